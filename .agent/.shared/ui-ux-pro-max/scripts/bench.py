@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Benchmarks - latency and throughput of search and design-system generation
+Usage: python bench.py                                # shipped + 1k/10k/100k packs
+       python bench.py --packs shipped,10k            # selected packs
+       python bench.py --compare .bench/previous.json # flag regressions, exit 1 if any
+
+Runs offline. Synthetic packs are generated from the real CSV schemas: every
+data CSV (stacks and ui-reasoning.csv included) is scaled so the whole pack
+holds 1k/10k/100k rows, proportionally to the shipped sizes. Rows mix whole
+cells from shipped rows of the same column, keyword columns get an extra
+Zipf-distributed term so the vocabulary keeps growing with the pack.
+
+Per pack:
+  cold_build      build every index from scratch (no .index, empty cache)
+  cold_load       first search per domain with indexes on disk, empty cache
+  warm_query      search() with a known domain
+  auto_domain     search() with domain detection
+  stack_query     search_stack()
+  batch           search_many() over all queries at once
+  bm25_fit        BM25.fit() over the largest CSV's documents
+  bm25_score      BM25.score() (full ranking) on that index
+  bm25_top_k      BM25.top_k() on that index
+  design_system   generate_design_system() end to end (markdown, result cache off)
+  design_system_cached  the same requests answered from the result cache
+The shipped pack also measures process cold start (see bench_startup.py).
+
+Results are written as JSON to ../.bench/ (or --output) for comparison over time.
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import core
+import design_system
+
+# ============ CONFIGURATION ============
+BENCH_DIR = Path(__file__).parent.parent / ".bench"
+RESULTS_VERSION = 1
+PACKS = {"shipped": None, "1k": 1_000, "10k": 10_000, "100k": 100_000}
+SEED = 1337
+REGRESSION_THRESHOLD = 1.25
+
+QUERIES = [
+    "glassmorphism dark mode", "minimalist clean", "fintech dashboard", "saas landing page",
+    "ecommerce luxury", "healthcare app calm", "elegant serif", "playful rounded",
+    "accessible form validation", "loading skeleton", "real-time analytics chart",
+    "pricing page conversion", "mobile navigation", "brutalism bold", "beauty spa wellness",
+    "education kids", "gaming neon", "trust blue professional", "animation performance",
+    "icons navigation menu",
+]
+STACK_QUERIES = ["form validation", "state management", "performance memo", "accessibility focus", "routing"]
+DESIGN_QUERIES = ["saas analytics dashboard", "beauty spa wellness", "fintech crypto app", "ecommerce luxury fashion"]
+STACK = "react"
+
+# Columns holding row numbers; synthetic rows renumber them
+_SERIAL_COLS = {"No", "STT"}
+
+
+# ============ SYNTHETIC PACKS ============
+def _read_csv(filepath):
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(f)
+        return reader.fieldnames or [], list(reader)
+
+
+def make_pack(target_rows, dest, source=None, seed=SEED):
+    """Write a synthetic copy of the data dir to dest/data, scaled to target_rows in total"""
+    source = Path(source or core.DATA_DIR)
+    rng = random.Random(seed)
+    files = sorted(p.relative_to(source) for p in source.rglob("*.csv"))
+    tables = {file: _read_csv(source / file) for file in files}
+    shipped = sum(len(rows) for _, rows in tables.values()) or 1
+
+    for file, (header, rows) in tables.items():
+        out = Path(dest) / "data" / file
+        out.parent.mkdir(parents=True, exist_ok=True)
+        count = max(1, round(len(rows) * target_rows / shipped)) if rows else 0
+        keyword_cols = [col for col in header if "Keywords" in col]
+        with open(out, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=header)
+            writer.writeheader()
+            for serial in range(1, count + 1):
+                row = {col: rng.choice(rows)[col] for col in header}
+                for col in header:
+                    if col in _SERIAL_COLS:
+                        row[col] = str(serial)
+                for col in keyword_cols:
+                    row[col] = f"{row[col]}, term{int(rng.paretovariate(1.0))}"
+                writer.writerow(row)
+    return Path(dest) / "data"
+
+
+def _use_data_dir(data_dir, index_dir):
+    """Point core/design_system at a data dir with its own index dir and empty caches"""
+    core.DATA_DIR = design_system.DATA_DIR = Path(data_dir)
+    os.environ["UIPRO_INDEX_DIR"] = str(index_dir)
+    core._index_cache.clear()
+
+
+def _sample_queries(data_dir, count, seed=SEED):
+    """Extra queries drawn from the pack's own keyword columns"""
+    rng = random.Random(seed)
+    words = []
+    for config in core.CSV_CONFIG.values():
+        filepath = Path(data_dir) / config["file"]
+        if filepath.exists():
+            _, rows = _read_csv(filepath)
+            for row in rows[:200]:
+                words.extend(w for w in re.findall(r"[a-z]{4,}", " ".join(
+                    str(row.get(col, "")) for col in config["search_cols"]).lower()))
+    if not words:
+        return []
+    return [" ".join(rng.sample(words, 2)) for _ in range(count)]
+
+
+# ============ MEASUREMENT ============
+def summarize(samples):
+    """Latency percentiles (ms) and throughput for per-call times in seconds"""
+    if not samples:
+        return {"count": 0}
+    ms = sorted(s * 1000 for s in samples)
+
+    def percentile(p):
+        k = (len(ms) - 1) * p / 100
+        lo = int(k)
+        hi = min(lo + 1, len(ms) - 1)
+        return ms[lo] + (ms[hi] - ms[lo]) * (k - lo)
+
+    total = sum(samples)
+    return {
+        "count": len(ms),
+        "mean_ms": round(statistics.fmean(ms), 4),
+        "p50_ms": round(percentile(50), 4),
+        "p90_ms": round(percentile(90), 4),
+        "p99_ms": round(percentile(99), 4),
+        "max_ms": round(ms[-1], 4),
+        "per_sec": round(len(ms) / total, 1) if total else None,
+    }
+
+
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def _repeat(fn, items, rounds):
+    return [_timed(fn, item) for _ in range(rounds) for item in items]
+
+
+def bench_pack(data_dir, index_dir, rounds=3):
+    """Run every benchmark against one data dir; returns {metric: summary}"""
+    _use_data_dir(data_dir, index_dir)
+    shutil.rmtree(index_dir, ignore_errors=True)
+    queries = QUERIES + _sample_queries(data_dir, len(QUERIES))
+    domains = [domain for domain, _, _ in core._domain_sources()]
+    metrics = {}
+
+    build = time.perf_counter()
+    core.warm_indexes()
+    core._get_unified_index()
+    metrics["cold_build"] = summarize([time.perf_counter() - build])
+
+    core._index_cache.clear()
+    metrics["cold_load"] = summarize([_timed(core.search, queries[0], domain) for domain in domains])
+
+    # One sample per query covers every domain; report the per-search time
+    metrics["warm_query"] = summarize([t / len(domains) for t in _repeat(
+        lambda q: [core.search(q, domain) for domain in domains], queries, rounds)])
+    metrics["auto_domain"] = summarize(_repeat(core.search, queries, rounds))
+    metrics["stack_query"] = summarize(_repeat(lambda q: core.search_stack(q, STACK), STACK_QUERIES, rounds))
+
+    batch = [{"query": q, "domain": domain} for q in queries for domain in domains]
+    batch_times = [_timed(core.search_many, batch) for _ in range(rounds)]
+    metrics["batch"] = summarize([t / len(batch) for t in batch_times])
+    metrics["batch"]["batch_size"] = len(batch)
+
+    largest = max((core.DATA_DIR / config["file"] for config in core.CSV_CONFIG.values()
+                   if (core.DATA_DIR / config["file"]).exists()), key=lambda p: p.stat().st_size)
+    config = next(c for c in core.CSV_CONFIG.values() if core.DATA_DIR / c["file"] == largest)
+    _, rows = _read_csv(largest)
+    documents = [" ".join(str(row.get(col, "")) for col in config["search_cols"]) for row in rows]
+    bm25 = core.BM25()
+    metrics["bm25_fit"] = summarize([_timed(bm25.fit, documents) for _ in range(rounds)])
+    metrics["bm25_fit"].update({"file": config["file"], "documents": len(documents)})
+    metrics["bm25_score"] = summarize(_repeat(bm25.score, queries, rounds))
+    metrics["bm25_top_k"] = summarize(_repeat(lambda q: bm25.top_k(q, core.MAX_RESULTS), queries, rounds))
+
+    generate = lambda q: design_system.generate_design_system(q, "Bench", "markdown")
+    cache_size = design_system.RESULT_CACHE_SIZE
+    try:
+        design_system.RESULT_CACHE_SIZE = 0
+        metrics["design_system"] = summarize(_repeat(generate, DESIGN_QUERIES, rounds))
+        design_system.RESULT_CACHE_SIZE = max(cache_size, len(DESIGN_QUERIES))
+        for q in DESIGN_QUERIES:
+            generate(q)
+        metrics["design_system_cached"] = summarize(_repeat(generate, DESIGN_QUERIES, rounds))
+    finally:
+        design_system.RESULT_CACHE_SIZE = cache_size
+    return metrics
+
+
+def run(packs, rounds=3, startup_runs=9):
+    """Benchmark the requested packs; returns the results document"""
+    original = core.DATA_DIR
+    saved_index_dir = os.environ.get("UIPRO_INDEX_DIR")
+    results = {
+        "version": RESULTS_VERSION,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "search_backend": core.SEARCH_BACKEND,
+        "bm25_backend": core.BM25_BACKEND,
+        "packs": {},
+    }
+    workdir = Path(tempfile.mkdtemp(prefix="uipro-bench-"))
+    try:
+        for name in packs:
+            scale = PACKS[name]
+            data_dir = original if scale is None else make_pack(scale, workdir / name, original)
+            start = time.perf_counter()
+            metrics = bench_pack(data_dir, workdir / name / ".index", rounds)
+            rows = sum(len(_read_csv(p)[1]) for p in Path(data_dir).rglob("*.csv"))
+            results["packs"][name] = {"rows": rows, "metrics": metrics,
+                                      "seconds": round(time.perf_counter() - start, 2)}
+            print(f"  {name}: {rows} rows, {results['packs'][name]['seconds']}s", file=sys.stderr)
+    finally:
+        core.DATA_DIR = design_system.DATA_DIR = original
+        core._index_cache.clear()
+        if saved_index_dir is None:
+            os.environ.pop("UIPRO_INDEX_DIR", None)
+        else:
+            os.environ["UIPRO_INDEX_DIR"] = saved_index_dir
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if "shipped" in packs and startup_runs:
+        import bench_startup
+        results["packs"]["shipped"]["metrics"]["process_cold_start"] = bench_startup.run_mode("search", startup_runs)
+    return results
+
+
+# ============ REPORTING ============
+def format_report(results):
+    """One table per pack: p50/p90/p99 latency and throughput per metric"""
+    lines = [f"UI Pro Max benchmarks ({results['timestamp']}, Python {results['python']})"]
+    for name, pack in results["packs"].items():
+        lines.append(f"\n## {name} ({pack['rows']} rows)")
+        lines.append(f"{'metric':<16}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'per sec':>12}")
+        for metric, summary in pack["metrics"].items():
+            if metric == "process_cold_start":
+                lines.append(f"{metric:<16}{summary['wall_ms']:>10.1f}  (overhead {summary['overhead_ms']}ms, "
+                             f"budget {summary['budget_ms']}ms)")
+                continue
+            lines.append(f"{metric:<16}{summary['p50_ms']:>10.3f}{summary['p90_ms']:>10.3f}"
+                         f"{summary['p99_ms']:>10.3f}{summary['per_sec'] or 0:>12.1f}")
+    return "\n".join(lines)
+
+
+def compare(old, new, threshold=REGRESSION_THRESHOLD):
+    """(report lines, regressions) comparing p50 latency of two results documents"""
+    lines = [f"{'pack/metric':<28}{'old p50':>10}{'new p50':>10}{'ratio':>8}"]
+    regressions = []
+    for name, pack in new["packs"].items():
+        previous = old.get("packs", {}).get(name)
+        if not previous:
+            continue
+        for metric, summary in pack["metrics"].items():
+            before = previous["metrics"].get(metric, {})
+            if "p50_ms" not in summary or not before.get("p50_ms"):
+                continue
+            ratio = summary["p50_ms"] / before["p50_ms"]
+            flag = "  REGRESSION" if ratio > threshold else ""
+            lines.append(f"{name + '/' + metric:<28}{before['p50_ms']:>10.3f}{summary['p50_ms']:>10.3f}{ratio:>7.2f}x{flag}")
+            if flag:
+                regressions.append(f"{name}/{metric}")
+    return lines, regressions
+
+
+# ============ CLI ============
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max search and design-system benchmarks")
+    parser.add_argument("--packs", type=str, default=",".join(PACKS), help=f"Comma-separated packs (default: {','.join(PACKS)})")
+    parser.add_argument("--rounds", type=int, default=3, help="Repetitions of each query set (default: 3)")
+    parser.add_argument("--startup-runs", type=int, default=9, help="Processes for the cold-start measurement (0 to skip)")
+    parser.add_argument("--output", "-o", type=str, default=None, help=f"Results file (default: {BENCH_DIR.name}/bench-<timestamp>.json)")
+    parser.add_argument("--compare", type=str, default=None, help="Previous results file to compare against")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help=f"p50 ratio counted as a regression (default: {REGRESSION_THRESHOLD})")
+    parser.add_argument("--json", action="store_true", help="Print the results JSON instead of tables")
+    args = parser.parse_args()
+
+    packs = [p.strip() for p in args.packs.split(",") if p.strip()]
+    unknown = [p for p in packs if p not in PACKS]
+    if unknown:
+        parser.error(f"unknown pack(s): {', '.join(unknown)} (choose from {', '.join(PACKS)})")
+
+    results = run(packs, max(1, args.rounds), args.startup_runs)
+
+    output = Path(args.output) if args.output else BENCH_DIR / f"bench-{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2), encoding='utf-8')
+
+    print(json.dumps(results, indent=2) if args.json else format_report(results))
+    print(f"\nResults: {output}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            lines, regressions = compare(json.load(f), results, args.threshold)
+        print("\n" + "\n".join(lines))
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            sys.exit(1)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Startup Benchmark - cold-start time and import budget of search.py
+Usage: python bench_startup.py                 # All modes, exit 1 if over budget
+       python bench_startup.py --mode search   # One mode
+       python bench_startup.py --json          # Machine-readable results
+
+Each run is a fresh `python search.py ... --no-server` process, the way agents
+call the CLI. Time is reported as overhead over a bare interpreter start,
+timed in alternation with each mode so both see the same machine state, so
+the budget holds across machines; like timeit, the budget is checked against
+the best run (least disturbed by other load), the median is reported too. Each mode also lists modules it must not
+import (checked with -X importtime), which keeps lazy imports from regressing.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# ============ CONFIGURATION ============
+SCRIPT = Path(__file__).parent / "search.py"
+RUNS = 15
+
+MODES = {
+    "search": {
+        "args": ["glassmorphism dark", "--domain", "style"],
+        "budget_ms": 45,
+        "forbidden": ["argparse", "design_system", "csv", "hashlib", "socket", "tempfile", "datetime", "numpy", "sqlite3"],
+    },
+    "auto-domain": {
+        "args": ["fintech dashboard"],
+        "budget_ms": 45,
+        "forbidden": ["argparse", "design_system", "csv", "hashlib", "socket", "tempfile", "datetime", "numpy", "sqlite3"],
+    },
+    "stack": {
+        "args": ["form validation", "--stack", "react"],
+        "budget_ms": 45,
+        "forbidden": ["argparse", "design_system", "csv", "hashlib", "socket", "tempfile", "datetime", "numpy", "sqlite3"],
+    },
+    "design-system": {
+        "args": ["saas analytics dashboard", "--design-system"],
+        "budget_ms": 80,
+        "forbidden": ["socket", "tempfile", "numpy", "sqlite3"],
+    },
+}
+
+
+def _env():
+    """Environment for benchmark runs: bytecode caching on, no server"""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["UIPRO_NO_SERVER"] = "1"
+    return env
+
+
+def _run_ms(argv, env):
+    start = time.perf_counter()
+    subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env, check=False)
+    return (time.perf_counter() - start) * 1000
+
+
+def _time_runs(argv, runs, env):
+    """(best, median, best bare interpreter) wall time in ms over runs fresh processes
+
+    Each run is paired with a bare `python -c pass`, so a machine that speeds
+    up or slows down during the benchmark shifts both numbers alike.
+    """
+    samples, baseline = [], []
+    for _ in range(runs):
+        baseline.append(_run_ms([sys.executable, "-c", "pass"], env))
+        samples.append(_run_ms(argv, env))
+    return min(samples), statistics.median(samples), min(baseline)
+
+
+def import_profile(args, env=None):
+    """Parse -X importtime for one run: {module: (self_us, cumulative_us, depth)}"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", str(SCRIPT), *args],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=env or _env(), check=False
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        self_us, cumulative_us, name = int(fields[0]), int(fields[1]), fields[2]
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules[name.strip()] = (self_us, cumulative_us, depth)
+    return modules
+
+
+def run_mode(name, runs=RUNS):
+    """Benchmark one mode; returns its result dict"""
+    config = MODES[name]
+    env = _env()
+    argv = [sys.executable, str(SCRIPT), *config["args"]]
+    # Warm-up: writes .pyc files and compiled indexes, so runs measure steady state
+    subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env, check=False)
+
+    wall_ms, median_ms, baseline_ms = _time_runs(argv, runs, env)
+    modules = import_profile(config["args"], env)
+
+    top_level = sum(cumulative for _, cumulative, depth in modules.values() if depth == 0)
+    slowest = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)[:8]
+    overhead_ms = wall_ms - baseline_ms
+    violations = [module for module in config["forbidden"] if module in modules]
+    return {
+        "mode": name,
+        "wall_ms": round(wall_ms, 1),
+        "median_ms": round(median_ms, 1),
+        "baseline_ms": round(baseline_ms, 1),
+        "overhead_ms": round(overhead_ms, 1),
+        "budget_ms": config["budget_ms"],
+        "import_ms": round(top_level / 1000, 1),
+        "modules": len(modules),
+        "slowest_imports": [{"module": module, "self_ms": round(self_us / 1000, 2)} for module, (self_us, _, _) in slowest],
+        "forbidden_imports": violations,
+        "ok": overhead_ms <= config["budget_ms"] and not violations,
+    }
+
+
+def format_report(results):
+    """Human-readable table of run_mode() results"""
+    lines = [f"{'mode':<15}{'best':>9}{'median':>9}{'overhead':>10}{'budget':>8}{'imports':>9}  status"]
+    for r in results:
+        status = "ok" if r["ok"] else "OVER BUDGET"
+        if r["forbidden_imports"]:
+            status = f"imports {', '.join(r['forbidden_imports'])}"
+        lines.append(f"{r['mode']:<15}{r['wall_ms']:>7.1f}ms{r['median_ms']:>7.1f}ms{r['overhead_ms']:>8.1f}ms{r['budget_ms']:>6}ms"
+                     f"{r['import_ms']:>7.1f}ms  {status}")
+    if results:
+        baselines = sorted(r["baseline_ms"] for r in results)
+        lines.append(f"(baseline interpreter start: {baselines[0]:.1f}-{baselines[-1]:.1f}ms, timed with each mode)")
+    return "\n".join(lines)
+
+
+# ============ CLI ============
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max search.py cold-start benchmark")
+    parser.add_argument("--mode", choices=list(MODES.keys()), action="append", help="Mode to benchmark (repeatable; default: all)")
+    parser.add_argument("--runs", type=int, default=RUNS, help=f"Processes per mode (default: {RUNS})")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    results = [run_mode(mode, args.runs) for mode in (args.mode or MODES)]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_report(results))
+    sys.exit(0 if all(r["ok"] for r in results) else 1)
@@ -2,13 +2,25 @@
 # -*- coding: utf-8 -*-
 """
 UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
+
+Imports are kept to what a warm-index search needs; modules only used when
+loading or (re)building an index (pickle, csv, hashlib, mmap, threading) are
+imported there, so a query answered by the search server never loads them.
 """
 
-import csv
+import heapq
+import json
+import os
 import re
+import sys
+import time
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
 from pathlib import Path
 from math import log
-from collections import defaultdict
+from collections import defaultdict, deque
+from itertools import islice
 
 # ============ CONFIGURATION ============
 DATA_DIR = Path(__file__).parent.parent / "data"
@@ -95,19 +107,155 @@ _STACK_COLS = {
 
 AVAILABLE_STACKS = list(STACK_CONFIG.keys())
 
+# Search backend: "bm25" (compiled indexes below) or "fts5" (SQLite, see fts.py)
+SEARCH_BACKEND = os.environ.get("UIPRO_SEARCH_BACKEND", "bm25")
+
+# Scoring backend: "python", "numpy" or "auto" (numpy for large corpora when installed)
+BM25_BACKEND = os.environ.get("UIPRO_BM25_BACKEND", "auto")
+NUMPY_MIN_DOCS = 5000
+
+# Compiled indexes live next to DATA_DIR (override with UIPRO_INDEX_DIR)
+INDEX_DIR_NAME = ".index"
+INDEX_VERSION = 5
+
+
+# ============ PROFILING ============
+_profile = None  # the active Profile, if any; stages are no-ops otherwise
+
+
+class Profile:
+    """Per-stage wall time and allocation counts, collected while the profile is active.
+
+        with Profile() as profile:
+            search("glassmorphism", "style")
+        profile.to_dict()
+
+    Stages nest, so their times are inclusive (index.build contains csv.load,
+    tokenize and index.fit). allocated_blocks is the sys.getallocatedblocks()
+    delta: blocks still allocated when the stage ended, process-wide.
+    """
+
+    def __init__(self):
+        import threading
+        self._lock = threading.Lock()
+        self._previous = None
+        self.stages = {}  # name -> [calls, seconds, allocated blocks], in first-seen order
+        self.started = self.finished = None
+
+    def __enter__(self):
+        global _profile
+        self._previous, _profile = _profile, self
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        global _profile
+        self.finished = time.perf_counter()
+        _profile = self._previous
+        return False
+
+    def add(self, name, seconds, blocks=0, calls=1):
+        with self._lock:
+            entry = self.stages.setdefault(name, [0, 0.0, 0])
+            entry[0] += calls
+            entry[1] += seconds
+            entry[2] += blocks
+
+    def timed(self, name, fn):
+        """Wrap fn so every call is recorded as stage name"""
+        def wrapper(*args, **kwargs):
+            blocks = sys.getallocatedblocks()
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.add(name, time.perf_counter() - start, sys.getallocatedblocks() - blocks)
+        return wrapper
+
+    def timed_iter(self, name, iterable):
+        """Iterate, recording the time spent producing each item as stage name"""
+        iterator = iter(iterable)
+        while True:
+            blocks = sys.getallocatedblocks()
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add(name, time.perf_counter() - start, sys.getallocatedblocks() - blocks, calls=0)
+                return
+            self.add(name, time.perf_counter() - start, sys.getallocatedblocks() - blocks)
+            yield item
+
+    def to_dict(self):
+        end = self.finished or time.perf_counter()
+        return {
+            "total_ms": round((end - self.started) * 1000, 3) if self.started else 0,
+            "stages": [{"stage": name, "calls": calls, "ms": round(seconds * 1000, 3), "allocated_blocks": blocks}
+                       for name, (calls, seconds, blocks) in self.stages.items()],
+        }
+
+
+class _Stage:
+    __slots__ = ("profile", "name", "blocks", "start")
+
+    def __init__(self, profile, name):
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self):
+        self.blocks = sys.getallocatedblocks()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profile.add(self.name, time.perf_counter() - self.start, sys.getallocatedblocks() - self.blocks)
+        return False
+
+
+class _NoStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_STAGE = _NoStage()
+
+
+def stage(name):
+    """Context manager recording a pipeline stage while a Profile is active"""
+    profile = _profile
+    return _NO_STAGE if profile is None else _Stage(profile, name)
+
+
+def profiled(name, fn):
+    """fn, wrapped to record each call as a stage while a Profile is active"""
+    profile = _profile
+    return fn if profile is None else profile.timed(name, fn)
+
+
+def profiled_iter(name, iterable):
+    """iterable, wrapped to record item production as a stage while a Profile is active"""
+    profile = _profile
+    return iterable if profile is None else profile.timed_iter(name, iterable)
+
 
 # ============ BM25 IMPLEMENTATION ============
 class BM25:
-    """BM25 ranking algorithm for text search"""
+    """BM25 ranking algorithm for text search, backed by an inverted index"""
 
     def __init__(self, k1=1.5, b=0.75):
         self.k1 = k1
         self.b = b
-        self.corpus = []
         self.doc_lengths = []
         self.avgdl = 0
         self.idf = {}
         self.doc_freqs = defaultdict(int)
+        self.postings = {}    # term -> (doc ids, BM25 weights), ordered by doc id
+        self.max_weight = {}  # term -> largest weight in its postings (MaxScore bound)
         self.N = 0
 
     def tokenize(self, text):
@@ -116,53 +264,807 @@ class BM25:
         return [w for w in text.split() if len(w) > 2]
 
     def fit(self, documents):
-        """Build BM25 index from documents"""
-        self.corpus = [self.tokenize(doc) for doc in documents]
-        self.N = len(self.corpus)
+        """Build BM25 inverted index from documents"""
+        tokenize = profiled("tokenize", self.tokenize)
+        corpus = [tokenize(doc) for doc in documents]
+        self.N = len(corpus)
         if self.N == 0:
             return
-        self.doc_lengths = [len(doc) for doc in self.corpus]
+        self.doc_lengths = [len(doc) for doc in corpus]
         self.avgdl = sum(self.doc_lengths) / self.N
 
-        for doc in self.corpus:
-            seen = set()
+        # term -> {doc id: term frequency}, doc ids inserted in ascending order
+        term_freqs = defaultdict(dict)
+        for idx, doc in enumerate(corpus):
             for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
+                tfs = term_freqs[word]
+                tfs[idx] = tfs.get(idx, 0) + 1
 
-        for word, freq in self.doc_freqs.items():
+        for word, tfs in term_freqs.items():
+            freq = len(tfs)
+            self.doc_freqs[word] = freq
             self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
 
+        self._compile(term_freqs)
+
+    def fit_segments(self, segments):
+        """Build the index from pre-tokenized segments (a SegmentSet) without re-tokenizing.
+
+        N, document frequencies, IDF and avgdl are computed over the live
+        documents of all segments together, so scores match a full fit().
+        """
+        self.N = len(segments)
+        self.doc_freqs = defaultdict(int)
+        self.idf = {}
+        if self.N == 0:
+            self.doc_lengths = []
+            self.avgdl = 0
+            self.postings = {}
+            self.max_weight = {}
+            return
+
+        self.doc_lengths = [segments.segments[seg].lengths[local] for seg, local in segments.locations()]
+        self.avgdl = sum(self.doc_lengths) / self.N
+
+        term_freqs = defaultdict(dict)
+        for seg_idx, segment in enumerate(segments.segments):
+            doc_ids = segments.doc_ids(seg_idx)
+            for word, (locals_, tfs) in segment.term_freqs.items():
+                target = term_freqs[word]
+                for local, tf in zip(locals_, tfs):
+                    doc = doc_ids[local]
+                    if doc >= 0:
+                        target[doc] = tf
+
+        for word in list(term_freqs):
+            tfs = term_freqs[word]
+            if not tfs:
+                del term_freqs[word]
+                continue
+            term_freqs[word] = dict(sorted(tfs.items()))
+            freq = len(tfs)
+            self.doc_freqs[word] = freq
+            self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
+
+        self._compile(term_freqs)
+
+    def _compile(self, term_freqs):
+        """Precompute per-posting BM25 weights with doc-length normalization"""
+        norms = [self.k1 * (1 - self.b + self.b * doc_len / self.avgdl) for doc_len in self.doc_lengths]
+        numerator_scale = self.k1 + 1
+        self.postings = {}
+        self.max_weight = {}
+        for word, tfs in term_freqs.items():
+            idf = self.idf[word]
+            docs = list(tfs)
+            weights = [idf * (tf * numerator_scale) / (tf + norms[doc]) for doc, tf in tfs.items()]
+            self.postings[word] = (docs, weights)
+            self.max_weight[word] = max(weights)
+
     def score(self, query):
         """Score all documents against query"""
-        query_tokens = self.tokenize(query)
-        scores = []
+        scores = [0] * self.N
+        for doc, score in self.scores_by_doc(query).items():
+            scores[doc] = score
+
+        return sorted(enumerate(scores), key=lambda x: x[1], reverse=True)
+
+    def scores_by_doc(self, query):
+        """{doc id: score} for the documents matching at least one query term"""
+        scores = defaultdict(int)
+        for token in self.tokenize(query):
+            if token in self.postings:
+                docs, weights = self.postings[token]
+                for doc, weight in zip(docs, weights):
+                    scores[doc] += weight
+        return scores
+
+    def top_k(self, query, k=MAX_RESULTS):
+        """Return the k best (idx, score) pairs with score > 0.
+
+        Document-at-a-time MaxScore: query terms are ordered by their score
+        upper bound, and terms whose combined bound cannot beat the current
+        k-th best score are only probed (by binary search) for candidates
+        coming from the remaining "essential" terms. Ties keep the lower
+        doc id first, matching score().
+        """
+        counts = defaultdict(int)
+        for token in self.tokenize(query):
+            if token in self.postings:
+                counts[token] += 1
+        if not counts or k <= 0:
+            return []
+
+        terms = sorted(counts, key=lambda t: self.max_weight[t] * counts[t])
+        lists = [self.postings[t] for t in terms]
+        mults = [counts[t] for t in terms]
+        bounds = []  # bounds[i]: best score reachable from terms[0..i]
+        total = 0
+        for term in terms:
+            total += self.max_weight[term] * counts[term]
+            bounds.append(total)
+
+        n = len(terms)
+        ptrs = [0] * n
+        heap = []
+        threshold = 0
+        first = 0  # lists[first:] are essential
+        while first < n:
+            candidate = self.N
+            for i in range(first, n):
+                docs = lists[i][0]
+                if ptrs[i] < len(docs) and docs[ptrs[i]] < candidate:
+                    candidate = docs[ptrs[i]]
+            if candidate == self.N:
+                break
 
-        for idx, doc in enumerate(self.corpus):
             score = 0
-            doc_len = self.doc_lengths[idx]
-            term_freqs = defaultdict(int)
-            for word in doc:
-                term_freqs[word] += 1
+            for i in range(first, n):
+                docs, weights = lists[i]
+                p = ptrs[i]
+                if p < len(docs) and docs[p] == candidate:
+                    score += weights[p] * mults[i]
+                    ptrs[i] = p + 1
+
+            for i in range(first - 1, -1, -1):
+                if score + bounds[i] <= threshold:
+                    break
+                docs, weights = lists[i]
+                p = bisect_left(docs, candidate, ptrs[i])
+                ptrs[i] = p
+                if p < len(docs) and docs[p] == candidate:
+                    score += weights[p] * mults[i]
+
+            if len(heap) < k:
+                heapq.heappush(heap, (score, -candidate))
+            elif score > threshold:
+                heapq.heapreplace(heap, (score, -candidate))
+            else:
+                continue
+
+            if len(heap) == k:
+                threshold = heap[0][0]
+                while first < n and bounds[first] <= threshold:
+                    first += 1
+
+        return [(-neg_idx, score) for score, neg_idx in sorted(heap, reverse=True)]
+
+    def score_batch(self, queries, k=MAX_RESULTS):
+        """top_k() for each query"""
+        return [self.top_k(query, k) for query in queries]
+
+
+# ============ VECTORIZED BACKEND (optional NumPy/SciPy) ============
+def _import_numpy():
+    """Return (numpy, scipy.sparse or None), or (None, None) if NumPy is missing"""
+    try:
+        import numpy
+    except ImportError:
+        return None, None
+    try:
+        from scipy import sparse
+    except ImportError:
+        sparse = None
+    return numpy, sparse
+
+
+class SparseBM25:
+    """BM25 scorer over a term-document matrix of precomputed weights.
+
+    Wraps a fitted BM25 and scores with one sparse matrix product per query
+    batch (SciPy), or one vectorized accumulation per query term (NumPy only).
+    """
+
+    def __init__(self, bm25, np, sparse=None):
+        self.bm25 = bm25
+        self.np = np
+        self.N = bm25.N
+        self.tokenize = bm25.tokenize
+        self.vocab = {term: row for row, term in enumerate(bm25.postings)}
+
+        indptr = [0]
+        indices = []
+        data = []
+        for docs, weights in bm25.postings.values():
+            indices.extend(docs)
+            data.extend(weights)
+            indptr.append(len(indices))
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data, dtype=np.float64)
+
+        self.sparse = sparse
+        self.matrix = None
+        if sparse is not None:
+            self.matrix = sparse.csr_matrix(
+                (self.data, self.indices, self.indptr), shape=(len(self.vocab), self.N))
+
+    def _query_terms(self, query):
+        """Vocabulary rows and multiplicities for a query"""
+        counts = defaultdict(int)
+        for token in self.tokenize(query):
+            row = self.vocab.get(token)
+            if row is not None:
+                counts[row] += 1
+        return counts
+
+    def _dense_scores(self, counts):
+        """Accumulate one query's scores over all documents"""
+        scores = self.np.zeros(self.N)
+        for row, count in counts.items():
+            start, end = self.indptr[row], self.indptr[row + 1]
+            scores[self.indices[start:end]] += self.data[start:end] * count
+        return scores
+
+    def _select(self, doc_ids, scores, k):
+        """Top-k (idx, score) with score > 0, ties broken by lower idx"""
+        np = self.np
+        positive = scores > 0
+        doc_ids, scores = doc_ids[positive], scores[positive]
+        if len(scores) > k:
+            kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+            keep = scores >= kth
+            doc_ids, scores = doc_ids[keep], scores[keep]
+        order = np.lexsort((doc_ids, -scores))[:k]
+        return [(int(doc_ids[i]), float(scores[i])) for i in order]
+
+    def scores_by_doc(self, query):
+        """{doc id: score} for the documents matching at least one query term"""
+        scores = self._dense_scores(self._query_terms(query))
+        matched = self.np.flatnonzero(scores)
+        return dict(zip(matched.tolist(), scores[matched].tolist()))
+
+    def score(self, query):
+        """Score all documents against query"""
+        scores = self._dense_scores(self._query_terms(query))
+        order = self.np.argsort(-scores, kind="stable")
+        return [(int(i), float(scores[i])) for i in order]
+
+    def top_k(self, query, k=MAX_RESULTS):
+        """Return the k best (idx, score) pairs with score > 0"""
+        if k <= 0:
+            return []
+        scores = self._dense_scores(self._query_terms(query))
+        return self._select(self.np.arange(self.N), scores, k)
+
+    def score_batch(self, queries, k=MAX_RESULTS):
+        """top_k() for many queries with a single sparse matrix-matrix product"""
+        if self.matrix is None or k <= 0:
+            return [self.top_k(query, k) for query in queries]
+
+        np = self.np
+        rows, cols, vals = [], [], []
+        for qi, query in enumerate(queries):
+            for row, count in self._query_terms(query).items():
+                rows.append(qi)
+                cols.append(row)
+                vals.append(count)
+        query_matrix = self.sparse.csr_matrix(
+            (np.asarray(vals, dtype=np.float64), (rows, cols)), shape=(len(queries), len(self.vocab)))
+        result = (query_matrix @ self.matrix).tocsr()
+
+        ranked = []
+        for qi in range(len(queries)):
+            start, end = result.indptr[qi], result.indptr[qi + 1]
+            ranked.append(self._select(result.indices[start:end], result.data[start:end], k))
+        return ranked
+
+
+def make_scorer(bm25, backend=None):
+    """Pick the scoring backend for a fitted BM25; falls back to pure Python"""
+    backend = backend or BM25_BACKEND
+    if backend == "python" or (backend == "auto" and bm25.N < NUMPY_MIN_DOCS):
+        return bm25
+    np, sparse = _import_numpy()
+    if np is None:
+        return bm25
+    return SparseBM25(bm25, np, sparse)
+
+
+# ============ PERSISTENT INDEX ============
+_index_cache = {}
+_index_locks = {}  # key -> threading.Lock, created on the first cache miss
+
+
+def _index_dir():
+    """Directory holding compiled indexes"""
+    override = os.environ.get("UIPRO_INDEX_DIR")
+    return Path(override) if override else DATA_DIR.parent / INDEX_DIR_NAME
+
+
+def _index_path(filepath):
+    """Index file for a CSV, unique per absolute source path"""
+    digest = zlib.crc32(str(Path(filepath).resolve()).encode("utf-8"))
+    return _index_dir() / f"{Path(filepath).stem}-{digest:08x}.idx"
+
+
+def _file_signature(filepath):
+    """Cheap staleness key: (size, mtime_ns)"""
+    st = os.stat(filepath)
+    return st.st_size, st.st_mtime_ns
+
+
+def _files_digest(filepaths):
+    """Content hash, used when an mtime changed but the bytes may not have"""
+    import hashlib
+    digest = hashlib.sha1()
+    for filepath in filepaths:
+        with open(filepath, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+# ============ ROW STORE ============
+class RowStore:
+    """Output columns of an index, one compact JSON record per row.
+
+    Records sit back to back in one buffer, addressed by an offsets array.
+    Loaded indexes view the buffer through a memory map of the index file
+    (pages are read on demand), and rows are only decoded into dicts when a
+    search returns them.
+    """
+
+    __slots__ = ("columns", "offsets", "_buffer")
+
+    def __init__(self, columns, offsets=None, buffer=b""):
+        self.columns = tuple(sys.intern(col) for col in columns)
+        self.offsets = offsets if offsets is not None else array("Q", [0])
+        self._buffer = buffer
+
+    def __getstate__(self):
+        # The buffer is stored after the pickled payload, not inside it
+        return self.columns, self.offsets
+
+    def __setstate__(self, state):
+        columns, offsets = state
+        self.columns = tuple(sys.intern(col) for col in columns)
+        self.offsets = offsets
+        self._buffer = None
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx):
+        start = self.offsets[idx]
+        values = json.loads(bytes(self._buffer[start:self.offsets[idx + 1]]))
+        return dict(zip(self.columns, values))
+
+    def record(self, idx):
+        """Encoded record bytes for row idx"""
+        return bytes(self._buffer[self.offsets[idx]:self.offsets[idx + 1]])
+
+    @classmethod
+    def from_records(cls, columns, records):
+        """Build a store from encoded record bytes"""
+        offsets = array("Q", [0])
+        for record in records:
+            offsets.append(offsets[-1] + len(record))
+        return cls(columns, offsets, b"".join(records))
+
+    def attach(self, mapped, offset):
+        """Read records from a memoryview of the index file, starting at byte offset.
+
+        The map pins the file it was read from: an index rewritten with
+        os.replace() later (update, background merge, another process)
+        never shifts the records under an already loaded store.
+        """
+        self._buffer = mapped[offset:offset + self.offsets[-1]]
+
+    def tobytes(self):
+        return bytes(self._buffer)
+
+
+# ============ SEGMENTS ============
+# Compaction kicks in past this many segments or this share of dead rows
+MAX_SEGMENTS = 4
+MAX_DEAD_RATIO = 0.25
+
+
+class Segment:
+    """An immutable batch of indexed rows: term frequencies, lengths, digests and records"""
+
+    __slots__ = ("term_freqs", "lengths", "digests", "records")
+
+    def __init__(self, columns, items):
+        """items: iterable of (tokens, digest, encoded record), in local id order"""
+        term_freqs = defaultdict(dict)
+        self.lengths = array("I")
+        self.digests = []
+        records = []
+        for local, (tokens, digest, record) in enumerate(items):
+            for word in tokens:
+                tfs = term_freqs[word]
+                tfs[local] = tfs.get(local, 0) + 1
+            self.lengths.append(len(tokens))
+            self.digests.append(digest)
+            records.append(record)
+        self.term_freqs = {word: (list(tfs), list(tfs.values())) for word, tfs in term_freqs.items()}
+        self.records = RowStore.from_records(columns, records)
+
+    def __len__(self):
+        return len(self.lengths)
+
+
+class SegmentSet:
+    """The segments of one CSV index and the live row order.
+
+    Doc id i (the i-th CSV row) lives at (segment[i], local[i]); rows of a
+    segment that no longer appear in the CSV are simply not referenced.
+    """
+
+    __slots__ = ("segments", "segment", "local")
+
+    def __init__(self, segments, order):
+        order = list(order)
+        self.segments = segments
+        self.segment = array("I", (seg for seg, _ in order))
+        self.local = array("Q", (local for _, local in order))
+
+    def __len__(self):
+        return len(self.segment)
 
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
-                    numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
+    def __getitem__(self, doc):
+        return self.segments[self.segment[doc]].records[self.local[doc]]
 
-            scores.append((idx, score))
+    @property
+    def columns(self):
+        return self.segments[0].records.columns if self.segments else ()
 
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+    def locations(self):
+        return zip(self.segment, self.local)
+
+    def doc_ids(self, seg_idx):
+        """Local id -> doc id for one segment (-1 for dead rows)"""
+        ids = [-1] * len(self.segments[seg_idx])
+        for doc, (seg, local) in enumerate(self.locations()):
+            if seg == seg_idx:
+                ids[local] = doc
+        return ids
+
+    def stores(self):
+        return [segment.records for segment in self.segments]
+
+    def dead_ratio(self):
+        stored = sum(len(segment) for segment in self.segments)
+        return 1 - len(self) / stored if stored else 0
+
+
+def _parse_rows(filepath, search_cols, output_cols):
+    """Stream a CSV as (present output columns, iterator of (document, encoded record))"""
+    import csv
+    f = open(filepath, 'r', encoding='utf-8')
+    reader = csv.reader(f)
+    header = next(reader, [])
+    positions = {col: i for i, col in enumerate(header)}
+    present = [col for col in output_cols if col in positions]
+    search_idx = [positions.get(col) for col in search_cols]
+    output_idx = [positions[col] for col in present]
+
+    def cell(row, i):
+        # csv.DictReader semantics: unknown column -> "", short row -> None
+        if i is None:
+            return ""
+        return row[i] if i < len(row) else None
+
+    def rows():
+        with f:
+            for row in reader:
+                if not row:
+                    continue
+                record = json.dumps([cell(row, i) for i in output_idx],
+                                    ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                yield " ".join(str(cell(row, i)) for i in search_idx), record
+
+    return present, rows()
+
+
+def _row_digest(document, record):
+    import hashlib
+    return hashlib.blake2b(document.encode("utf-8") + b"\0" + record, digest_size=16).digest()
+
+
+def _segment_items(rows, tokenize):
+    for document, record in rows:
+        yield tokenize(document), _row_digest(document, record), record
+
+
+def _build_index(filepath, search_cols, output_cols):
+    """Stream the CSV once: tokenize search columns, encode output columns per row"""
+    bm25 = BM25()
+    present, rows = _parse_rows(filepath, search_cols, output_cols)
+    rows = profiled_iter("csv.load", rows)
+    segment = Segment(present, _segment_items(rows, profiled("tokenize", bm25.tokenize)))
+    segments = SegmentSet([segment], ((0, local) for local in range(len(segment))))
+    with stage("index.fit"):
+        bm25.fit_segments(segments)
+    return {"bm25": bm25, "rows": segments}
+
+
+def _update_index(payload, filepath, search_cols, output_cols):
+    """Incrementally refresh a stale index; None if a full rebuild is needed.
+
+    Rows are matched to already-indexed rows by content digest. Unchanged
+    rows keep their segment postings; appended or edited rows are tokenized
+    into one new segment; removed rows drop out of the live order. The
+    scoring view is then recompiled from segment term frequencies with
+    global IDF/avgdl.
+    """
+    old = payload.get("rows")
+    present, rows = _parse_rows(filepath, search_cols, output_cols)
+    if not isinstance(old, SegmentSet) or tuple(present) != old.columns:
+        rows.close()
+        return None
+
+    available = defaultdict(deque)  # digest -> live (segment, local) in doc order
+    for seg, local in old.locations():
+        available[old.segments[seg].digests[local]].append((seg, local))
+
+    bm25 = BM25()
+    tokenize = profiled("tokenize", bm25.tokenize)
+    order = []
+    fresh = []
+    for document, record in profiled_iter("csv.load", rows):
+        digest = _row_digest(document, record)
+        if available.get(digest):
+            order.append(available[digest].popleft())
+        else:
+            order.append((len(old.segments), len(fresh)))
+            fresh.append((tokenize(document), digest, record))
+
+    segments = list(old.segments)
+    if fresh:
+        segments.append(Segment(present, fresh))
+
+    # Drop segments no live row points at any more
+    used = sorted(set(seg for seg, _ in order))
+    renumber = {seg: i for i, seg in enumerate(used)}
+    segment_set = SegmentSet([segments[seg] for seg in used], [(renumber[seg], local) for seg, local in order])
+
+    with stage("index.fit"):
+        bm25.fit_segments(segment_set)
+    return {"bm25": bm25, "rows": segment_set}
+
+
+def _merge_segments(segment_set):
+    """Compact the live rows of all segments into one segment (no re-tokenizing)"""
+    merged = Segment.__new__(Segment)
+    term_freqs = defaultdict(dict)
+    for seg_idx, segment in enumerate(segment_set.segments):
+        doc_ids = segment_set.doc_ids(seg_idx)
+        for word, (locals_, tfs) in segment.term_freqs.items():
+            for local, tf in zip(locals_, tfs):
+                if doc_ids[local] >= 0:
+                    term_freqs[word][doc_ids[local]] = tf
+
+    merged.term_freqs = {}
+    for word, tfs in term_freqs.items():
+        ordered = sorted(tfs.items())
+        merged.term_freqs[word] = ([doc for doc, _ in ordered], [tf for _, tf in ordered])
+
+    locations = list(segment_set.locations())
+    merged.lengths = array("I", (segment_set.segments[seg].lengths[local] for seg, local in locations))
+    merged.digests = [segment_set.segments[seg].digests[local] for seg, local in locations]
+    merged.records = RowStore.from_records(
+        segment_set.columns, [segment_set.segments[seg].records.record(local) for seg, local in locations])
+    return SegmentSet([merged], ((0, doc) for doc in range(len(locations))))
+
+
+def _needs_merge(segment_set):
+    return len(segment_set.segments) > MAX_SEGMENTS or segment_set.dead_ratio() > MAX_DEAD_RATIO
+
+
+def _merge_in_background(key, path, payload):
+    """Compact an index's segments on a worker thread and persist the result.
+
+    Scoring is unaffected (same live rows, same statistics); the thread is
+    non-daemon so a short-lived CLI process still finishes the write.
+    Processes that already loaded the old layout (e.g. a --serve server
+    whose CSV signature still matches) keep reading it: their stores map
+    the replaced file, not the path.
+    """
+    def run():
+        merged = _merge_segments(payload["rows"])
+        _write_index(path, {**payload, "rows": merged})
+        if _index_cache.get(key) is payload:
+            payload["rows"] = merged
+
+    import threading
+    thread = threading.Thread(target=run, name="uipro-index-merge")
+    thread.start()
+    return thread
+
+
+def _row_stores(payload):
+    rows = payload.get("rows") if isinstance(payload, dict) else None
+    return rows.stores() if isinstance(rows, SegmentSet) else []
+
+
+def _read_index(path):
+    """Load a compiled index, or None if missing/corrupt.
+
+    Layout: 8-byte little-endian payload length, pickled payload, then the
+    records of each segment's RowStore in order, memory-mapped from the
+    same open file as the payload so both come from one version of it.
+    """
+    import pickle
+    try:
+        with open(path, 'rb') as f:
+            size = int.from_bytes(f.read(8), "little")
+            payload = pickle.loads(f.read(size))
+            stores = _row_stores(payload)
+            if any(store.offsets[-1] for store in stores):
+                import mmap
+                mapped = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            else:
+                mapped = memoryview(b"")
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError, AttributeError, ImportError, IndexError):
+        return None
+    offset = 8 + size
+    for store in stores:
+        store.attach(mapped, offset)
+        offset += store.offsets[-1]
+    return payload
+
+
+def _write_index(path, payload):
+    """Atomically write a compiled index; silently skip on read-only installs"""
+    import pickle
+    import threading
+    tmp = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        # Backend objects are rebuilt from the postings on load, never persisted
+        header = pickle.dumps({k: v for k, v in payload.items() if k != "scorer"},
+                              protocol=pickle.HIGHEST_PROTOCOL)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, 'wb') as f:
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            for store in _row_stores(payload):
+                f.write(store.tobytes())
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _compiled_index(key, path, filepaths, meta, build, update=None):
+    """Return a compiled index built from filepaths, rebuilding it when stale.
+
+    Indexes are reused from memory, then from disk, while the sources'
+    (size, mtime_ns) signatures match; a content hash catches touched but
+    unchanged files. meta must match too (e.g. the indexed columns).
+    Changed sources go through update(payload) when given, which returns
+    a refreshed payload or None to force a full build().
+
+    Thread-safe: concurrent callers wait for one load/build per key.
+    """
+    signature = tuple(_file_signature(f) for f in filepaths)
+
+    cached = _index_cache.get(key)
+    if cached is not None and cached["signature"] == signature:
+        return cached
+
+    with _index_lock(key):
+        cached = _index_cache.get(key)
+        if cached is not None and cached["signature"] == signature:
+            return cached  # loaded by another thread while we waited
+        return _refresh_index(key, path, filepaths, meta, build, update, signature)
+
+
+def _index_lock(key):
+    import threading
+    lock = _index_locks.get(key)
+    if lock is None:
+        lock = _index_locks.setdefault(key, threading.Lock())
+    return lock
+
+
+def _refresh_index(key, path, filepaths, meta, build, update, signature):
+    """Load, update or build an index whose cached copy is missing or stale"""
+    with stage("index.load"):
+        payload = _read_index(path)
+    valid = (
+        isinstance(payload, dict)
+        and payload.get("version") == INDEX_VERSION
+        and payload.get("meta") == meta
+    )
+
+    if valid and payload["signature"] != signature:
+        if payload["digest"] == _files_digest(filepaths):
+            payload["signature"] = signature
+            _write_index(path, payload)
+        else:
+            valid = False
+            with stage("index.update"):
+                payload = update(payload) if update else None
+            if payload is not None:
+                payload.update({"version": INDEX_VERSION, "meta": meta, "signature": signature,
+                                "digest": _files_digest(filepaths)})
+                _write_index(path, payload)
+                valid = True
+
+    if not valid:
+        with stage("index.build"):
+            payload = build()
+        payload.update({
+            "version": INDEX_VERSION,
+            "meta": meta,
+            "signature": signature,
+            "digest": _files_digest(filepaths),
+        })
+        _write_index(path, payload)
+
+    payload["scorer"] = make_scorer(payload["bm25"])
+    _index_cache[key] = payload
+    if isinstance(payload.get("rows"), SegmentSet) and _needs_merge(payload["rows"]):
+        _merge_in_background(key, path, payload)
+    return payload
+
+
+def _get_index(filepath, search_cols, output_cols):
+    """Return the compiled index for a CSV, rebuilding it when stale"""
+    columns = (tuple(search_cols), tuple(output_cols))
+    return _compiled_index(
+        (str(filepath), columns), _index_path(filepath), [filepath], columns,
+        lambda: _build_index(filepath, search_cols, output_cols),
+        lambda payload: _update_index(payload, filepath, search_cols, output_cols))
+
+
+def _domain_sources():
+    """(domain, filepath, config) for every domain whose CSV exists"""
+    return [(domain, DATA_DIR / config["file"], config)
+            for domain, config in CSV_CONFIG.items()
+            if (DATA_DIR / config["file"]).exists()]
+
+
+def _build_unified_index(sources):
+    """Fit one BM25 over every domain's search columns; doc ids are grouped by domain"""
+    documents = []
+    ranges = []
+    for domain, filepath, config in sources:
+        start = len(documents)
+        documents.extend(" ".join(str(row.get(col, "")) for col in config["search_cols"])
+                         for row in _load_csv(filepath))
+        ranges.append((domain, start, len(documents)))
+
+    bm25 = BM25()
+    with stage("index.fit"):
+        bm25.fit(documents)
+    return {"bm25": bm25, "ranges": ranges}
+
+
+def _get_unified_index():
+    """Return the cross-domain index over all CSV_CONFIG files"""
+    sources = _domain_sources()
+    meta = tuple((domain, config["file"], tuple(config["search_cols"])) for domain, _, config in sources)
+    return _compiled_index(
+        ("__unified__", meta), _index_dir() / "unified.idx", [f for _, f, _ in sources], meta,
+        lambda: _build_unified_index(sources))
+
+
+def warm_indexes():
+    """Load (building when stale) every domain and stack index; returns how many"""
+    count = 0
+    for config in CSV_CONFIG.values():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            _get_index(filepath, config["search_cols"], config["output_cols"])
+            count += 1
+    for config in STACK_CONFIG.values():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            _get_index(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"])
+            count += 1
+    return count
 
 
 # ============ SEARCH FUNCTIONS ============
 def _load_csv(filepath):
     """Load CSV and return list of dicts"""
-    with open(filepath, 'r', encoding='utf-8') as f:
+    import csv
+    with stage("csv.load"), open(filepath, 'r', encoding='utf-8') as f:
         return list(csv.DictReader(f))
 
 
@@ -171,24 +1073,98 @@ def _search_csv(filepath, search_cols, output_cols, query, max_results):
     if not filepath.exists():
         return []
 
-    data = _load_csv(filepath)
+    if SEARCH_BACKEND == "fts5":
+        results = _search_fts(filepath, search_cols, output_cols, query, max_results)
+        if results is not None:
+            return results
 
-    # Build documents from search columns
-    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
+    index = _get_index(filepath, search_cols, output_cols)
+    rows = index["rows"]
+    with stage("top_k"):
+        ranked = index["scorer"].top_k(query, max_results)
 
-    # BM25 search
-    bm25 = BM25()
-    bm25.fit(documents)
-    ranked = bm25.score(query)
+    # top_k only returns results with score > 0
+    with stage("rows.decode"):
+        return [rows[idx] for idx, score in ranked]
 
-    # Get top results with score > 0
-    results = []
-    for idx, score in ranked[:max_results]:
+
+def _search_fts(filepath, search_cols, output_cols, query, max_results):
+    """Search through the SQLite FTS5 backend; None if it cannot serve this file"""
+    import fts
+    if not fts.fts5_available():
+        return None
+    with stage("fts.query"):
+        return fts.search_file(filepath, search_cols, output_cols, query, max_results)
+
+
+def _search_csv_batch(filepath, search_cols, output_cols, queries, max_results):
+    """_search_csv() for many queries against one index in a single scoring pass"""
+    if SEARCH_BACKEND == "fts5":
+        return [_search_csv(filepath, search_cols, output_cols, query, max_results) for query in queries]
+
+    index = _get_index(filepath, search_cols, output_cols)
+    rows = index["rows"]
+    with stage("score_batch"):
+        batch = index["scorer"].score_batch(queries, max_results)
+    with stage("rows.decode"):
+        return [[rows[idx] for idx, score in ranked] for ranked in batch]
+
+
+def _unified_hits(index, query):
+    """Probe the unified index once; {domain: [(score, doc id), ...]}"""
+    starts = [start for _, start, _ in index["ranges"]]
+    hits = defaultdict(list)
+    with stage("score"):
+        scores = index["scorer"].scores_by_doc(query)
+    for doc, score in scores.items():
         if score > 0:
-            row = data[idx]
-            results.append({col: row.get(col, "") for col in output_cols if col in row})
+            hits[index["ranges"][bisect_right(starts, doc) - 1][0]].append((score, doc))
+    return hits
 
-    return results
+
+def search_all(query, max_results=MAX_RESULTS, domains=None):
+    """Search every domain at once with a single probe of the unified index.
+
+    Scores use corpus statistics across all domains, so they are comparable
+    between domains. Returns per-domain top-k results (search()-shaped) and
+    the domains ranked by their best score.
+    """
+    index = _get_unified_index()
+    hits = _unified_hits(index, query)
+    wanted = set(domains) if domains else None
+
+    by_domain = {}
+    best = {}
+    for domain, start, end in index["ranges"]:
+        if wanted is not None and domain not in wanted:
+            continue
+        top = heapq.nsmallest(max_results, hits[domain], key=lambda hit: (-hit[0], hit[1]))
+        config = CSV_CONFIG[domain]
+        rows = _get_index(DATA_DIR / config["file"], config["search_cols"], config["output_cols"])["rows"]
+        results = [rows[doc - start] for _, doc in top]
+        by_domain[domain] = _with_results({"domain": domain, "query": query, "file": config["file"]}, results)
+        if top:
+            best[domain] = top[0][0]
+
+    return {
+        "query": query,
+        "ranking": sorted(best, key=best.get, reverse=True),
+        "domains": by_domain
+    }
+
+
+def route_domain(query, candidates=None):
+    """Domain holding the best-scoring document in the unified index, or None"""
+    index = _get_unified_index()
+    hits = _unified_hits(index, query)
+    best_domain, best_score = None, 0
+    for domain, _, _ in index["ranges"]:
+        if candidates is not None and domain not in candidates:
+            continue
+        top = max((score for score, _ in hits[domain]), default=0)
+        if top > best_score:
+            best_domain, best_score = domain, top
+    return best_domain
 
 
 def detect_domain(query):
@@ -211,48 +1187,113 @@ def detect_domain(query):
 
     scores = {domain: sum(1 for kw in keywords if kw in query_lower) for domain, keywords in domain_keywords.items()}
     best = max(scores, key=scores.get)
+    candidates = [domain for domain, score in scores.items() if score == scores[best]]
+    if len(candidates) == 1:
+        return best
+
+    # No keyword hit, or a tie: let the unified index statistics decide
+    routed = route_domain(query, candidates if scores[best] > 0 else None)
+    if routed:
+        return routed
     return best if scores[best] > 0 else "style"
 
 
-def search(query, domain=None, max_results=MAX_RESULTS):
-    """Main search function with auto-domain detection"""
+def _domain_target(query, domain):
+    """Resolve a domain search to (result skeleton, (filepath, search_cols, output_cols)).
+
+    The source is None when the search cannot run; the skeleton is then the error result.
+    """
     if domain is None:
-        domain = detect_domain(query)
+        with stage("detect_domain"):
+            domain = detect_domain(query)
 
     config = CSV_CONFIG.get(domain, CSV_CONFIG["style"])
     filepath = DATA_DIR / config["file"]
 
     if not filepath.exists():
-        return {"error": f"File not found: {filepath}", "domain": domain}
+        return {"error": f"File not found: {filepath}", "domain": domain}, None
 
-    results = _search_csv(filepath, config["search_cols"], config["output_cols"], query, max_results)
+    skeleton = {"domain": domain, "query": query, "file": config["file"]}
+    return skeleton, (filepath, config["search_cols"], config["output_cols"])
 
-    return {
-        "domain": domain,
-        "query": query,
-        "file": config["file"],
-        "count": len(results),
-        "results": results
-    }
 
-
-def search_stack(query, stack, max_results=MAX_RESULTS):
-    """Search stack-specific guidelines"""
+def _stack_target(query, stack):
+    """Resolve a stack search to (result skeleton, source), like _domain_target()"""
     if stack not in STACK_CONFIG:
-        return {"error": f"Unknown stack: {stack}. Available: {', '.join(AVAILABLE_STACKS)}"}
+        return {"error": f"Unknown stack: {stack}. Available: {', '.join(AVAILABLE_STACKS)}"}, None
 
     filepath = DATA_DIR / STACK_CONFIG[stack]["file"]
 
     if not filepath.exists():
-        return {"error": f"Stack file not found: {filepath}", "stack": stack}
+        return {"error": f"Stack file not found: {filepath}", "stack": stack}, None
 
-    results = _search_csv(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query, max_results)
+    skeleton = {"domain": "stack", "stack": stack, "query": query, "file": STACK_CONFIG[stack]["file"]}
+    return skeleton, (filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"])
 
-    return {
-        "domain": "stack",
-        "stack": stack,
-        "query": query,
-        "file": STACK_CONFIG[stack]["file"],
-        "count": len(results),
-        "results": results
-    }
+
+def _with_results(skeleton, results):
+    return {**skeleton, "count": len(results), "results": results}
+
+
+def search(query, domain=None, max_results=MAX_RESULTS):
+    """Main search function with auto-domain detection"""
+    skeleton, source = _domain_target(query, domain)
+    if source is None:
+        return skeleton
+
+    return _with_results(skeleton, _search_csv(*source, query, max_results))
+
+
+def search_stack(query, stack, max_results=MAX_RESULTS):
+    """Search stack-specific guidelines"""
+    skeleton, source = _stack_target(query, stack)
+    if source is None:
+        return skeleton
+
+    return _with_results(skeleton, _search_csv(*source, query, max_results))
+
+
+def search_many(queries, domain=None, max_results=MAX_RESULTS):
+    """Run many searches, scoring all queries for one domain/stack in a single batch.
+
+    Each entry is a query string or a dict with "query" and optional
+    "domain", "stack", "max_results" and "id" (echoed back). Results are
+    returned in input order, shaped like search()/search_stack() results.
+    """
+    results = []
+    groups = defaultdict(list)  # (source, max_results) -> [(position, query)]
+    targets = {}  # resolved once per stack/domain; auto-detected domains depend on the query
+    for item in queries:
+        request = {"query": item} if isinstance(item, str) else item
+        query = str(request.get("query", ""))
+        target = ("stack", request["stack"]) if request.get("stack") else ("domain", request.get("domain") or domain)
+        if target[1] is None:
+            skeleton, source = _domain_target(query, None)
+        else:
+            if target not in targets:
+                targets[target] = (_stack_target if target[0] == "stack" else _domain_target)(query, target[1])
+            skeleton, source = targets[target]
+            skeleton = {**skeleton, "query": query} if source is not None else dict(skeleton)
+        if "id" in request:
+            skeleton["id"] = request["id"]
+        if source is not None:
+            n = request.get("max_results", max_results)
+            groups[(source[0], tuple(source[1]), tuple(source[2]), n)].append((len(results), query))
+        results.append(skeleton)
+
+    for (filepath, search_cols, output_cols, n), members in groups.items():
+        batch = _search_csv_batch(filepath, search_cols, output_cols, [q for _, q in members], n)
+        for (position, _), rows in zip(members, batch):
+            results[position] = _with_results(results[position], rows)
+
+    return results
+
+
+def iter_search_many(queries, domain=None, max_results=MAX_RESULTS, batch_size=1):
+    """Stream search_many() results, yielding each batch as soon as it is scored"""
+    queries = iter(queries)
+    while True:
+        chunk = list(islice(queries, batch_size))
+        if not chunk:
+            return
+        yield from search_many(chunk, domain, max_results)
@@ -16,9 +16,12 @@ Usage:
 import csv
 import json
 import os
+import re
+import sys
 from datetime import datetime
 from pathlib import Path
-from core import search, DATA_DIR
+import core
+from core import search, stage, _index_dir, DATA_DIR
 
 
 # ============ CONFIGURATION ============
@@ -32,13 +35,44 @@ SEARCH_CONFIG = {
     "typography": {"max_results": 2}
 }
 
+# Domain searches are pure Python: threads only pay off when they run in parallel
+# (free-threaded builds). Force with UIPRO_PARALLEL_SEARCH=1 or 0.
+_gil_check = getattr(sys, "_is_gil_enabled", None)
+PARALLEL_SEARCH = os.environ.get("UIPRO_PARALLEL_SEARCH", "0" if _gil_check is None or _gil_check() else "1") == "1"
+
+
+def _run_searches(tasks: dict) -> dict:
+    """Run {domain: (query, max_results)} searches; concurrently when PARALLEL_SEARCH."""
+    if not PARALLEL_SEARCH or len(tasks) < 2:
+        return {domain: search(query, domain, n) for domain, (query, n) in tasks.items()}
+
+    import threading
+    results, errors = {}, []
+
+    def run(domain, query, n):
+        try:
+            results[domain] = search(query, domain, n)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(domain, query, n)) for domain, (query, n) in tasks.items()]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return {domain: results[domain] for domain in tasks}
+
 
 # ============ DESIGN SYSTEM GENERATOR ============
 class DesignSystemGenerator:
     """Generates design system recommendations from aggregated searches."""
 
     def __init__(self):
-        self.reasoning_data = self._load_reasoning()
+        with stage("reasoning.load"):
+            self.reasoning_data = self._load_reasoning()
+            self._index_reasoning()
 
     def _load_reasoning(self) -> list:
         """Load reasoning rules from CSV."""
@@ -48,48 +82,79 @@ class DesignSystemGenerator:
         with open(filepath, 'r', encoding='utf-8') as f:
             return list(csv.DictReader(f))
 
-    def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
-        """Execute searches across multiple domains."""
-        results = {}
-        for domain, config in SEARCH_CONFIG.items():
+    def _multi_domain_search(self, query: str, style_priority: list = None, domains: list = None) -> dict:
+        """Execute searches across multiple domains (all of SEARCH_CONFIG by default)."""
+        tasks = {}
+        for domain in domains or SEARCH_CONFIG:
+            domain_query = query
             if domain == "style" and style_priority:
                 # For style, also search with priority keywords
-                priority_query = " ".join(style_priority[:2]) if style_priority else query
-                combined_query = f"{query} {priority_query}"
-                results[domain] = search(combined_query, domain, config["max_results"])
-            else:
-                results[domain] = search(query, domain, config["max_results"])
-        return results
+                domain_query = f"{query} {' '.join(style_priority[:2])}"
+            tasks[domain] = (domain_query, SEARCH_CONFIG[domain]["max_results"])
+        return _run_searches(tasks)
+
+    def _index_reasoning(self):
+        """Index rules by category once: exact-match dict, keyword index, decoded rules."""
+        self._categories = [rule.get("UI_Category", "").lower() for rule in self.reasoning_data]
+        self._exact = {}
+        self._keywords = {}  # keyword -> first rule position, in rule order
+        for position, ui_cat in enumerate(self._categories):
+            self._exact.setdefault(ui_cat, position)
+            for kw in ui_cat.replace("/", " ").replace("-", " ").split():
+                self._keywords.setdefault(kw, position)
+        self._decoded = [self._decode_rule(rule) for rule in self.reasoning_data]
+        self._positions = {}  # category (lowercase) -> rule position or None
+
+    def _decode_rule(self, rule: dict) -> dict:
+        """Reasoning for one rule, with its Decision_Rules JSON parsed."""
+        decision_rules = {}
+        try:
+            decision_rules = json.loads(rule.get("Decision_Rules", "{}"))
+        except json.JSONDecodeError:
+            pass
 
-    def _find_reasoning_rule(self, category: str) -> dict:
-        """Find matching reasoning rule for a category."""
+        return {
+            "pattern": rule.get("Recommended_Pattern", ""),
+            "style_priority": [s.strip() for s in rule.get("Style_Priority", "").split("+")],
+            "color_mood": rule.get("Color_Mood", ""),
+            "typography_mood": rule.get("Typography_Mood", ""),
+            "key_effects": rule.get("Key_Effects", ""),
+            "anti_patterns": rule.get("Anti_Patterns", ""),
+            "decision_rules": decision_rules,
+            "severity": rule.get("Severity", "MEDIUM")
+        }
+
+    def _rule_position(self, category: str):
+        """Position of the matching reasoning rule for a category, or None (memoized)."""
         category_lower = category.lower()
+        if category_lower in self._positions:
+            return self._positions[category_lower]
 
         # Try exact match first
-        for rule in self.reasoning_data:
-            if rule.get("UI_Category", "").lower() == category_lower:
-                return rule
+        position = self._exact.get(category_lower)
 
         # Try partial match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            if ui_cat in category_lower or category_lower in ui_cat:
-                return rule
+        if position is None:
+            position = next((i for i, ui_cat in enumerate(self._categories)
+                             if ui_cat in category_lower or category_lower in ui_cat), None)
 
-        # Try keyword match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            keywords = ui_cat.replace("/", " ").replace("-", " ").split()
-            if any(kw in category_lower for kw in keywords):
-                return rule
+        # Try keyword match: earliest rule owning a keyword found in the category
+        if position is None:
+            position = min((i for kw, i in self._keywords.items() if kw in category_lower), default=None)
 
-        return {}
+        self._positions[category_lower] = position
+        return position
+
+    def _find_reasoning_rule(self, category: str) -> dict:
+        """Find matching reasoning rule for a category."""
+        position = self._rule_position(category)
+        return self.reasoning_data[position] if position is not None else {}
 
     def _apply_reasoning(self, category: str, search_results: dict) -> dict:
         """Apply reasoning rules to search results."""
-        rule = self._find_reasoning_rule(category)
+        position = self._rule_position(category)
 
-        if not rule:
+        if position is None:
             return {
                 "pattern": "Hero + Features + CTA",
                 "style_priority": ["Minimalism", "Flat Design"],
@@ -101,23 +166,10 @@ class DesignSystemGenerator:
                 "severity": "MEDIUM"
             }
 
-        # Parse decision rules JSON
-        decision_rules = {}
-        try:
-            decision_rules = json.loads(rule.get("Decision_Rules", "{}"))
-        except json.JSONDecodeError:
-            pass
-
-        return {
-            "pattern": rule.get("Recommended_Pattern", ""),
-            "style_priority": [s.strip() for s in rule.get("Style_Priority", "").split("+")],
-            "color_mood": rule.get("Color_Mood", ""),
-            "typography_mood": rule.get("Typography_Mood", ""),
-            "key_effects": rule.get("Key_Effects", ""),
-            "anti_patterns": rule.get("Anti_Patterns", ""),
-            "decision_rules": decision_rules,
-            "severity": rule.get("Severity", "MEDIUM")
-        }
+        # Copy the mutable parts: callers own the returned reasoning
+        decoded = self._decoded[position]
+        return {**decoded, "style_priority": list(decoded["style_priority"]),
+                "decision_rules": dict(decoded["decision_rules"])}
 
     def _select_best_match(self, results: list, priority_keywords: list) -> dict:
         """Select best matching result based on priority keywords."""
@@ -162,20 +214,22 @@ class DesignSystemGenerator:
 
     def generate(self, query: str, project_name: str = None) -> dict:
         """Generate complete design system recommendation."""
-        # Step 1: First search product to get category
-        product_result = search(query, "product", 1)
+        # Step 1: Search product (decides the category) together with every
+        # domain that only needs the raw query; style waits for the reasoning
+        search_results = self._multi_domain_search(query, domains=[d for d in SEARCH_CONFIG if d != "style"])
+        product_result = search_results["product"]
         product_results = product_result.get("results", [])
         category = "General"
         if product_results:
             category = product_results[0].get("Product Type", "General")
 
         # Step 2: Get reasoning rules for this category
-        reasoning = self._apply_reasoning(category, {})
+        with stage("reasoning.lookup"):
+            reasoning = self._apply_reasoning(category, {})
         style_priority = reasoning.get("style_priority", [])
 
-        # Step 3: Multi-domain search with style priority hints
-        search_results = self._multi_domain_search(query, style_priority)
-        search_results["product"] = product_result  # Reuse product search
+        # Step 3: Style search with style priority hints
+        search_results.update(self._multi_domain_search(query, style_priority, domains=["style"]))
 
         # Step 4: Select best matches from each domain using priority
         style_results = self._extract_results(search_results.get("style", {}))
@@ -183,7 +237,8 @@ class DesignSystemGenerator:
         typography_results = self._extract_results(search_results.get("typography", {}))
         landing_results = self._extract_results(search_results.get("landing", {}))
 
-        best_style = self._select_best_match(style_results, reasoning.get("style_priority", []))
+        with stage("best_match"):
+            best_style = self._select_best_match(style_results, reasoning.get("style_priority", []))
         best_color = color_results[0] if color_results else {}
         best_typography = typography_results[0] if typography_results else {}
         best_landing = landing_results[0] if landing_results else {}
@@ -459,6 +514,26 @@ def format_markdown(design_system: dict) -> str:
 
 
 # ============ MAIN ENTRY POINT ============
+_generators = {}  # (reasoning file, size, mtime_ns) -> DesignSystemGenerator
+
+
+def get_generator() -> DesignSystemGenerator:
+    """Per-process generator, rebuilt only when the reasoning CSV changes."""
+    filepath = DATA_DIR / REASONING_FILE
+    try:
+        st = os.stat(filepath)
+        key = (str(filepath), st.st_size, st.st_mtime_ns)
+    except OSError:
+        key = (str(filepath), None, None)
+
+    generator = _generators.get(key)
+    if generator is None:
+        generator = DesignSystemGenerator()
+        _generators.clear()
+        _generators[key] = generator
+    return generator
+
+
 def generate_design_system(query: str, project_name: str = None, output_format: str = "ascii", 
                            persist: bool = False, page: str = None, output_dir: str = None) -> str:
     """
@@ -474,17 +549,117 @@ def generate_design_system(query: str, project_name: str = None, output_format:
 
     Returns:
         Formatted design system string
+
+    Results (and rendered files) come from the result cache when the same
+    request was answered before against the same data; see RESULT CACHE.
     """
-    generator = DesignSystemGenerator()
-    design_system = generator.generate(query, project_name)
+    cache_key = None
+    if RESULT_CACHE_SIZE > 0:
+        with stage("result_cache"):
+            cache_key = _result_cache_key(query, project_name, output_format, persist, page)
+            data_id = _fingerprint_id(_data_fingerprint())
+            entry = _result_cache_get(cache_key, data_id)
+        if entry is not None:
+            if persist:
+                with stage("persist"):
+                    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    restamp = lambda m: m.group(0)[:m.group(0).index(":**") + 3] + " " + timestamp
+                    _write_persisted_files([(name, _VOLATILE_LINE.sub(restamp, content))
+                                            for name, content in entry["files"]], output_dir)
+            return entry["output"]
+
+    generator = get_generator()
+    with stage("generate"):
+        design_system = generator.generate(query, project_name)
     
     # Persist to files if requested
+    files = []
     if persist:
-        persist_design_system(design_system, page, output_dir, query)
+        with stage("persist"):
+            files = _render_persisted_files(design_system, page, query)
+            _write_persisted_files(files, output_dir)
 
-    if output_format == "markdown":
-        return format_markdown(design_system)
-    return format_ascii_box(design_system)
+    with stage("format"):
+        if output_format == "markdown":
+            output = format_markdown(design_system)
+        else:
+            output = format_ascii_box(design_system)
+
+    if cache_key is not None:
+        with stage("result_cache"):
+            _result_cache_put(cache_key, data_id, output, files)
+    return output
+
+
+# ============ RESULT CACHE ============
+# One JSON file per request under <index dir>/results/, named by a hash of the
+# request key. Entries carry the data fingerprint they were computed against;
+# file mtime is the last use, and the least recently used entries are evicted.
+RESULT_CACHE_DIR = "results"
+RESULT_CACHE_VERSION = 1
+RESULT_CACHE_SIZE = int(os.environ.get("UIPRO_RESULT_CACHE_SIZE", "256"))  # entries; 0 disables
+
+
+def _data_fingerprint() -> str:
+    """(path, size, mtime) of every file under DATA_DIR, plus the search and generator code."""
+    parts = []
+    for root, dirs, files in os.walk(DATA_DIR):
+        dirs.sort()
+        for name in sorted(files):
+            st = os.stat(os.path.join(root, name))
+            parts.append(f"{os.path.relpath(os.path.join(root, name), DATA_DIR)}:{st.st_size}:{st.st_mtime_ns}")
+    for module in ("core.py", "fts.py", "design_system.py"):
+        st = os.stat(Path(__file__).with_name(module))
+        parts.append(f"{module}:{st.st_size}:{st.st_mtime_ns}")
+    return "\n".join(parts)
+
+
+def _result_cache_key(query: str, project_name: str, output_format: str, persist: bool, page: str) -> str:
+    # The project name defaults to query.upper(), so it is keyed verbatim; the
+    # search backends can rank differently, so their results are kept apart
+    return json.dumps([RESULT_CACHE_VERSION, " ".join(query.lower().split()), project_name or query.upper(),
+                       output_format, bool(persist), page if persist else None,
+                       core.SEARCH_BACKEND, core.BM25_BACKEND], ensure_ascii=False)
+
+
+def _fingerprint_id(fingerprint: str) -> str:
+    import zlib
+    return f"{zlib.crc32(fingerprint.encode('utf-8')):08x}-{len(fingerprint)}"
+
+
+def _result_cache_path(key: str) -> Path:
+    import zlib
+    return _index_dir() / RESULT_CACHE_DIR / f"{zlib.crc32(key.encode('utf-8')):08x}.json"
+
+
+def _result_cache_get(key: str, data_id: str):
+    """Cached {"output", "files"} for key, or None; marks the entry as recently used."""
+    path = _result_cache_path(key)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("key") != key or entry.get("data") != data_id:
+        return None  # other request with the same hash, or computed against older data
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return entry
+
+
+def _result_cache_put(key: str, data_id: str, output: str, files: list):
+    """Store a result, then evict least recently used entries beyond RESULT_CACHE_SIZE."""
+    path = _result_cache_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_if_changed(path, json.dumps({"key": key, "data": data_id, "output": output, "files": files}, ensure_ascii=False))
+        entries = sorted(path.parent.glob("*.json"), key=lambda p: p.stat().st_mtime_ns)
+        for stale in entries[:max(0, len(entries) - RESULT_CACHE_SIZE)]:
+            stale.unlink()
+    except OSError:
+        pass  # read-only install or a concurrent eviction: caching is best effort
 
 
 # ============ PERSISTENCE FUNCTIONS ============
@@ -498,47 +673,102 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
         output_dir: Optional output directory (defaults to current working directory)
         page_query: Optional query string for intelligent page override generation
     
+    Files whose content is unchanged (ignoring the Generated timestamp) are
+    left untouched, so file watchers only see real changes; the others are
+    replaced atomically.
+
     Returns:
-        dict with created file paths and status
+        dict with status, all file paths (created_files) and the ones actually
+        written (changed_files)
     """
-    base_dir = Path(output_dir) if output_dir else Path.cwd()
-    
-    # Use project name for project-specific folder
-    project_name = design_system.get("project_name", "default")
-    project_slug = project_name.lower().replace(' ', '-')
-    
-    design_system_dir = base_dir / "design-system" / project_slug
-    pages_dir = design_system_dir / "pages"
-    
-    created_files = []
-    
-    # Create directories
-    design_system_dir.mkdir(parents=True, exist_ok=True)
-    pages_dir.mkdir(parents=True, exist_ok=True)
-    
-    master_file = design_system_dir / "MASTER.md"
-    
-    # Generate and write MASTER.md
-    master_content = format_master_md(design_system)
-    with open(master_file, 'w', encoding='utf-8') as f:
-        f.write(master_content)
-    created_files.append(str(master_file))
-    
+    files = _render_persisted_files(design_system, page, page_query)
+    return _write_persisted_files(files, output_dir)
+
+
+def _render_persisted_files(design_system: dict, page: str = None, page_query: str = None) -> list:
+    """[(path relative to the output dir, content)]: MASTER.md, then the optional page override."""
+    design_system_dir = _design_system_dir(design_system, ".")
+
+    # Generate MASTER.md
+    with stage("format"):
+        files = [((design_system_dir / "MASTER.md").as_posix(), format_master_md(design_system))]
+
     # If page is specified, create page override file with intelligent content
     if page:
-        page_file = pages_dir / f"{page.lower().replace(' ', '-')}.md"
-        page_content = format_page_override_md(design_system, page, page_query)
-        with open(page_file, 'w', encoding='utf-8') as f:
-            f.write(page_content)
-        created_files.append(str(page_file))
-    
+        page_file = design_system_dir / "pages" / _page_filename(page)
+        with stage("format"):
+            files.append((page_file.as_posix(), format_page_override_md(design_system, page, page_query)))
+    return files
+
+
+def _write_persisted_files(files: list, output_dir: str = None) -> dict:
+    """Write _render_persisted_files() output under output_dir; persist_design_system() result."""
+    base_dir = Path(output_dir) if output_dir else Path.cwd()
+    created_files = []
+    changed_files = []
+    for relative, content in files:
+        path = base_dir / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if _write_if_changed(path, content):
+            changed_files.append(str(path))
+        created_files.append(str(path))
+
+    master_file = Path(created_files[0])
+    (master_file.parent / "pages").mkdir(exist_ok=True)
     return {
         "status": "success",
-        "design_system_dir": str(design_system_dir),
-        "created_files": created_files
+        "design_system_dir": str(master_file.parent),
+        "created_files": created_files,
+        "changed_files": changed_files
     }
 
 
+# Lines that differ on every run without the design system changing
+_VOLATILE_LINE = re.compile(r"^(?:> )?\*\*Generated:\*\* .*$", re.MULTILINE)
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write content atomically (temp file + rename) unless the file already holds it.
+
+    The comparison ignores the Generated timestamp line. Returns True if written.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            existing = f.read()
+    except (OSError, UnicodeDecodeError):
+        existing = None
+    if existing is not None and _VOLATILE_LINE.sub("", existing) == _VOLATILE_LINE.sub("", content):
+        return False
+
+    import threading
+    tmp = path.with_name(f".{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+    return True
+
+
+def _design_system_dir(design_system: dict, output_dir: str = None) -> Path:
+    """design-system/<project-slug>/ under output_dir (default: current directory)."""
+    base_dir = Path(output_dir) if output_dir else Path.cwd()
+
+    # Use project name for project-specific folder
+    project_name = design_system.get("project_name", "default")
+    project_slug = project_name.lower().replace(' ', '-')
+    return base_dir / "design-system" / project_slug
+
+
+def _page_filename(page: str) -> str:
+    return f"{page.lower().replace(' ', '-')}.md"
+
+
 def format_master_md(design_system: dict) -> str:
     """Format design system as MASTER.md with hierarchical override logic."""
     project = design_system.get("project_name", "PROJECT")
@@ -802,14 +1032,19 @@ def format_master_md(design_system: dict) -> str:
     return "\n".join(lines)
 
 
-def format_page_override_md(design_system: dict, page_name: str, page_query: str = None) -> str:
-    """Format a page-specific override file with intelligent AI-generated content."""
+def format_page_override_md(design_system: dict, page_name: str, page_query: str = None,
+                            page_overrides: dict = None) -> str:
+    """Format a page-specific override file with intelligent AI-generated content.
+
+    page_overrides: precomputed _generate_intelligent_overrides() result (bulk mode)
+    """
     project = design_system.get("project_name", "PROJECT")
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     page_title = page_name.replace("-", " ").replace("_", " ").title()
     
     # Detect page type and generate intelligent overrides
-    page_overrides = _generate_intelligent_overrides(page_name, page_query, design_system)
+    if page_overrides is None:
+        page_overrides = _generate_intelligent_overrides(page_name, page_query, design_system)
     
     lines = []
     
@@ -911,6 +1146,39 @@ def format_page_override_md(design_system: dict, page_name: str, page_query: str
     return "\n".join(lines)
 
 
+# Page-specific guidance: (domain, max_results) searched for every page context
+PAGE_OVERRIDE_SEARCHES = [("style", 1), ("ux", 3), ("landing", 1)]
+
+
+def _page_context(page_name: str, page_query: str = None) -> str:
+    return f"{page_name.lower()} {(page_query or '').lower()}"
+
+
+def generate_page_overrides(design_system: dict, pages: list) -> list:
+    """
+    Generate intelligent overrides for many pages of one design system at once.
+
+    pages: page names or (page name, page query) pairs. Each distinct page
+    context is searched once, and the searches of all pages are scored in one
+    batch per domain (see core.search_many()). Returns overrides in input order.
+    """
+    from core import search_many
+
+    contexts = [_page_context(*page) if isinstance(page, (tuple, list)) else _page_context(page)
+                for page in pages]
+    unique = list(dict.fromkeys(contexts))
+    with stage("overrides.search"):
+        responses = search_many([{"query": context, "domain": domain, "max_results": n}
+                                 for domain, n in PAGE_OVERRIDE_SEARCHES for context in unique])
+
+    overrides = {}
+    for i, context in enumerate(unique):
+        style_results, ux_results, landing_results = (
+            responses[d * len(unique) + i].get("results", []) for d in range(len(PAGE_OVERRIDE_SEARCHES)))
+        overrides[context] = _build_overrides(context, style_results, ux_results, landing_results)
+    return [overrides[context] for context in contexts]
+
+
 def _generate_intelligent_overrides(page_name: str, page_query: str, design_system: dict) -> dict:
     """
     Generate intelligent overrides based on page type using layered search.
@@ -918,22 +1186,11 @@ def _generate_intelligent_overrides(page_name: str, page_query: str, design_syst
     Uses the existing search infrastructure to find relevant style, UX, and layout
     data instead of hardcoded page types.
     """
-    from core import search
-    
-    page_lower = page_name.lower()
-    query_lower = (page_query or "").lower()
-    combined_context = f"{page_lower} {query_lower}"
-    
-    # Search across multiple domains for page-specific guidance
-    style_search = search(combined_context, "style", max_results=1)
-    ux_search = search(combined_context, "ux", max_results=3)
-    landing_search = search(combined_context, "landing", max_results=1)
-    
-    # Extract results from search response
-    style_results = style_search.get("results", [])
-    ux_results = ux_search.get("results", [])
-    landing_results = landing_search.get("results", [])
-    
+    return generate_page_overrides(design_system, [(page_name, page_query)])[0]
+
+
+def _build_overrides(combined_context: str, style_results: list, ux_results: list, landing_results: list) -> dict:
+    """Overrides for one page context from its style, ux and landing search results."""
     # Detect page type from search results or context
     page_type = _detect_page_type(combined_context, style_results)
     
@@ -1017,27 +1274,37 @@ def _generate_intelligent_overrides(page_name: str, page_query: str, design_syst
     }
 
 
+# Common page type patterns, in priority order
+PAGE_PATTERNS = [
+    (["dashboard", "admin", "analytics", "data", "metrics", "stats", "monitor", "overview"], "Dashboard / Data View"),
+    (["checkout", "payment", "cart", "purchase", "order", "billing"], "Checkout / Payment"),
+    (["settings", "profile", "account", "preferences", "config"], "Settings / Profile"),
+    (["landing", "marketing", "homepage", "hero", "home", "promo"], "Landing / Marketing"),
+    (["login", "signin", "signup", "register", "auth", "password"], "Authentication"),
+    (["pricing", "plans", "subscription", "tiers", "packages"], "Pricing / Plans"),
+    (["blog", "article", "post", "news", "content", "story"], "Blog / Article"),
+    (["product", "item", "detail", "pdp", "shop", "store"], "Product Detail"),
+    (["search", "results", "browse", "filter", "catalog", "list"], "Search Results"),
+    (["empty", "404", "error", "not found", "zero"], "Empty State"),
+]
+
+# All keywords in one alternation, in pattern order: at each position the lookahead
+# reports the highest-priority keyword starting there, so one scan finds the first
+# matching pattern
+_PAGE_KEYWORDS = {kw: position for position, (keywords, _) in reversed(list(enumerate(PAGE_PATTERNS)))
+                  for kw in keywords}
+_PAGE_MATCHER = re.compile("(?=(" + "|".join(
+    re.escape(kw) for kw in sorted(_PAGE_KEYWORDS, key=_PAGE_KEYWORDS.get)) + "))")
+
+
 def _detect_page_type(context: str, style_results: list) -> str:
     """Detect page type from context and search results."""
     context_lower = context.lower()
     
-    # Check for common page type patterns
-    page_patterns = [
-        (["dashboard", "admin", "analytics", "data", "metrics", "stats", "monitor", "overview"], "Dashboard / Data View"),
-        (["checkout", "payment", "cart", "purchase", "order", "billing"], "Checkout / Payment"),
-        (["settings", "profile", "account", "preferences", "config"], "Settings / Profile"),
-        (["landing", "marketing", "homepage", "hero", "home", "promo"], "Landing / Marketing"),
-        (["login", "signin", "signup", "register", "auth", "password"], "Authentication"),
-        (["pricing", "plans", "subscription", "tiers", "packages"], "Pricing / Plans"),
-        (["blog", "article", "post", "news", "content", "story"], "Blog / Article"),
-        (["product", "item", "detail", "pdp", "shop", "store"], "Product Detail"),
-        (["search", "results", "browse", "filter", "catalog", "list"], "Search Results"),
-        (["empty", "404", "error", "not found", "zero"], "Empty State"),
-    ]
-    
-    for keywords, page_type in page_patterns:
-        if any(kw in context_lower for kw in keywords):
-            return page_type
+    # First pattern with a keyword anywhere in the context
+    position = min((_PAGE_KEYWORDS[m.group(1)] for m in _PAGE_MATCHER.finditer(context_lower)), default=None)
+    if position is not None:
+        return PAGE_PATTERNS[position][1]
     
     # Fallback: try to infer from style results
     if style_results:
@@ -1052,16 +1319,142 @@ def _detect_page_type(context: str, style_results: list) -> str:
     return "General"
 
 
+# ============ BULK GENERATION ============
+def load_manifest(path: str) -> tuple:
+    """Read a bulk manifest; returns (entries, output_dir or None).
+
+    YAML when PyYAML is installed (JSON is valid YAML), plain JSON otherwise.
+    Either a list of entries or {"output_dir": ..., "apps": [...]}; each entry is
+    {"query": ..., "project_name": ..., "pages": ["dashboard", {"name": "checkout", "query": ...}]}
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    try:
+        import yaml
+    except ImportError:
+        if Path(path).suffix.lower() in (".yaml", ".yml"):
+            raise ValueError("PyYAML is required for YAML manifests (pip install pyyaml), or use a JSON manifest")
+        manifest = json.loads(text)
+    else:
+        try:
+            manifest = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ValueError(f"invalid YAML: {e}")
+
+    output_dir = None
+    if isinstance(manifest, dict):
+        output_dir = manifest.get("output_dir")
+        manifest = manifest.get("apps", [])
+    if not isinstance(manifest, list):
+        raise ValueError("Manifest must be a list of apps or a mapping with an 'apps' list")
+    return manifest, output_dir
+
+
+def _manifest_pages(entry: dict) -> list:
+    """[(page name, page query)] for one manifest entry."""
+    pages = []
+    for page in entry.get("pages") or []:
+        if isinstance(page, dict):
+            pages.append((str(page["name"]), page.get("query") or entry["query"]))
+        else:
+            pages.append((str(page), entry["query"]))
+    return pages
+
+
+def generate_bulk(entries: list, output_dir: str = None, workers: int = None) -> list:
+    """Generate and persist many design systems (MASTER.md + page overrides) in one process.
+
+    Generation shares the warm indexes and reasoning generator; each entry's
+    page overrides are searched in one batch (see generate_page_overrides()),
+    and page contexts already seen in an earlier entry are reused; files are written
+    by a thread pool, skipping unchanged ones (see persist_design_system()).
+    Returns one result per entry, in order ({"error": ...} on failure).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    results = []
+    overrides = {}  # page context -> generate_page_overrides() result
+    with ThreadPoolExecutor(max_workers=workers or min(8, (os.cpu_count() or 1) + 4),
+                            thread_name_prefix="uipro-persist") as pool:
+        pending = []  # (result, futures)
+        for entry in entries:
+            try:
+                if not isinstance(entry, dict) or not entry.get("query"):
+                    raise ValueError("entry needs a 'query'")
+                query = str(entry["query"])
+                design_system = get_generator().generate(query, entry.get("project_name"))
+                design_system_dir = _design_system_dir(design_system, entry.get("output_dir") or output_dir)
+                pages_dir = design_system_dir / "pages"
+                pages_dir.mkdir(parents=True, exist_ok=True)
+
+                pages = _manifest_pages(entry)
+                new = list(dict.fromkeys(page for page in pages if _page_context(*page) not in overrides))
+                if new:
+                    overrides.update(zip((_page_context(*page) for page in new),
+                                         generate_page_overrides(design_system, new)))
+
+                with stage("format"):
+                    files = [(design_system_dir / "MASTER.md", format_master_md(design_system))]
+                    for page, page_query in pages:
+                        files.append((pages_dir / _page_filename(page), format_page_override_md(
+                            design_system, page, page_query, overrides[_page_context(page, page_query)])))
+            except (KeyError, TypeError, ValueError, OSError) as e:
+                results.append({"query": entry.get("query") if isinstance(entry, dict) else entry,
+                                "error": f"{type(e).__name__}: {e}"})
+                continue
+
+            result = {"query": query, "project_name": design_system["project_name"],
+                      "design_system_dir": str(design_system_dir), "created_files": [str(path) for path, _ in files]}
+            results.append(result)
+            pending.append((result, [(path, pool.submit(_write_if_changed, path, content)) for path, content in files]))
+
+        with stage("persist"):
+            for result, futures in pending:
+                errors = [str(future.exception()) for _, future in futures if future.exception()]
+                result["changed_files"] = [str(path) for path, future in futures
+                                           if not future.exception() and future.result()]
+                if errors:
+                    result["error"] = "; ".join(errors)
+    return results
+
+
 # ============ CLI SUPPORT ============
 if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description="Generate Design System")
-    parser.add_argument("query", help="Search query (e.g., 'SaaS dashboard')")
+    parser.add_argument("query", nargs="?", help="Search query (e.g., 'SaaS dashboard')")
     parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name")
     parser.add_argument("--format", "-f", choices=["ascii", "markdown"], default="ascii", help="Output format")
+    # Bulk mode
+    parser.add_argument("--manifest", "-m", type=str, default=None, help="Generate and persist every app in a YAML/JSON manifest")
+    parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for --manifest (default: manifest's output_dir or current directory)")
+    parser.add_argument("--workers", type=int, default=None, help="File-writing threads for --manifest")
+    parser.add_argument("--json", action="store_true", help="With --manifest: print results as JSON")
 
     args = parser.parse_args()
 
+    if args.manifest:
+        try:
+            entries, manifest_dir = load_manifest(args.manifest)
+        except (OSError, ValueError) as e:
+            print(f"Error: cannot read manifest: {e}")
+            raise SystemExit(1)
+        results = generate_bulk(entries, args.output_dir or manifest_dir, args.workers)
+        failed = [r for r in results if "error" in r]
+        if args.json:
+            print(json.dumps(results, indent=2, ensure_ascii=False))
+        else:
+            for r in results:
+                if "error" in r:
+                    print(f"❌ {r['query']}: {r['error']}")
+                else:
+                    print(f"✅ {r['project_name']}: {len(r['changed_files'])}/{len(r['created_files'])} files changed in {r['design_system_dir']}")
+            print(f"\n{len(results) - len(failed)}/{len(results)} design systems persisted")
+        raise SystemExit(1 if failed else 0)
+
+    if args.query is None:
+        parser.error("the following arguments are required: query (or --manifest)")
+
     result = generate_design_system(args.query, args.project_name, args.format)
     print(result)
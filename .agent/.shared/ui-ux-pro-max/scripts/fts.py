@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max FTS5 Backend - SQLite full-text index over every data CSV
+Usage: python fts.py --build          # (Re)compile the database
+       python fts.py --status         # Show database path and freshness
+
+Enable for search()/search_stack() with UIPRO_SEARCH_BACKEND=fts5.
+
+All CSVs (including stacks/) are compiled into one SQLite database with
+one FTS5 table per file. Search columns are indexed with weight 1.0 each
+(today's BM25 concatenates them with equal weight); output-only columns
+are stored UNINDEXED. Ranking uses FTS5's built-in bm25().
+
+The database is never modified in place: rebuilds write a new file and
+atomically replace it, so any number of agent processes can read it
+concurrently through read-only connections. Within a process (e.g. the
+threaded search server), stale checks and rebuilds are serialized, and a
+rebuilt database is swapped in as a new connection: queries already
+running finish on the old one.
+"""
+
+import csv
+import json
+import os
+import re
+import sqlite3
+import threading
+
+from core import (CSV_CONFIG, STACK_CONFIG, _STACK_COLS, DATA_DIR, BM25,
+                  _file_signature, _index_dir)
+
+# ============ CONFIGURATION ============
+DB_NAME = "search.sqlite3"
+DB_VERSION = 1
+
+_connection = None
+_connection_lock = threading.RLock()  # stale checks, rebuilds and connection swaps
+_fts5_available = None
+
+
+def database_path():
+    return _index_dir() / DB_NAME
+
+
+def fts5_available():
+    """True if this Python's SQLite was compiled with FTS5"""
+    global _fts5_available
+    if _fts5_available is None:
+        try:
+            with sqlite3.connect(":memory:") as conn:
+                conn.execute("CREATE VIRTUAL TABLE probe USING fts5(x)")
+            _fts5_available = True
+        except sqlite3.OperationalError:
+            _fts5_available = False
+    return _fts5_available
+
+
+def _table_name(file):
+    return "t_" + re.sub(r'\W', '_', file)
+
+
+def _sources():
+    """(file, search_cols, output_cols) for every configured CSV that exists"""
+    sources = []
+    for config in CSV_CONFIG.values():
+        sources.append((config["file"], config["search_cols"], config["output_cols"]))
+    for config in STACK_CONFIG.values():
+        sources.append((config["file"], _STACK_COLS["search_cols"], _STACK_COLS["output_cols"]))
+    return [source for source in sources if (DATA_DIR / source[0]).exists()]
+
+
+# ============ BUILD ============
+def _build_table(conn, file, search_cols, output_cols):
+    """Create and fill the FTS5 table for one CSV; returns its metadata row"""
+    filepath = DATA_DIR / file
+    signature = _file_signature(filepath)
+    with open(filepath, 'r', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    header = list(rows[0].keys()) if rows else []
+
+    present = [col for col in output_cols if col in header]
+    stored = present + [col for col in search_cols if col not in present]
+    columns = [f"c{i}" for i in range(len(stored))]
+    indexed = set(stored.index(col) for col in search_cols)
+    definitions = [col if i in indexed else f"{col} UNINDEXED" for i, col in enumerate(columns)]
+
+    table = _table_name(file)
+    conn.execute(f"CREATE VIRTUAL TABLE {table} USING fts5({', '.join(definitions)})")
+    placeholders = ", ".join("?" for _ in range(len(columns) + 1))
+    conn.executemany(
+        f"INSERT INTO {table} (rowid, {', '.join(columns)}) VALUES ({placeholders})",
+        ([idx] + [row.get(col, "") if col in header else "" for col in stored] for idx, row in enumerate(rows))
+    )
+    weights = [1.0 if i in indexed else 0.0 for i in range(len(columns))]
+    return (file, table, signature[0], signature[1], json.dumps(search_cols),
+            json.dumps(present), json.dumps(weights))
+
+
+def build_database(path=None):
+    """Compile every data CSV into one SQLite/FTS5 database (atomic replace)"""
+    path = path or database_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    if tmp.exists():
+        tmp.unlink()
+
+    conn = sqlite3.connect(tmp)
+    try:
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute("INSERT INTO meta VALUES ('version', ?)", (str(DB_VERSION),))
+        conn.execute("""CREATE TABLE sources (file TEXT PRIMARY KEY, tbl TEXT, size INTEGER, mtime_ns INTEGER,
+                        search_cols TEXT, output_cols TEXT, weights TEXT)""")
+        for file, search_cols, output_cols in _sources():
+            conn.execute("INSERT INTO sources VALUES (?, ?, ?, ?, ?, ?, ?)",
+                         _build_table(conn, file, search_cols, output_cols))
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp, path)
+    return path
+
+
+# ============ QUERY ============
+def _open(path):
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _connect():
+    """Shared read-only connection; (re)builds the database when missing or outdated"""
+    global _connection
+    if _connection is not None:
+        return _connection
+    with _connection_lock:
+        if _connection is None:
+            path = database_path()
+            if not path.exists():
+                build_database(path)
+            conn = _open(path)
+            version = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if version is None or version[0] != str(DB_VERSION):
+                conn.close()
+                conn = _open(build_database(path))
+            _connection = conn
+        return _connection
+
+
+def _lookup(file, search_cols):
+    """Metadata row for file, or None if it is missing or stale"""
+    meta = _connect().execute("SELECT * FROM sources WHERE file = ?", (file,)).fetchone()
+    fresh = (
+        meta is not None
+        and (meta["size"], meta["mtime_ns"]) == _file_signature(DATA_DIR / file)
+        and json.loads(meta["search_cols"]) == list(search_cols)
+    )
+    return meta if fresh else None
+
+
+def _source(file, search_cols):
+    """Metadata for file, rebuilding the database if the CSV or its columns changed"""
+    global _connection
+    meta = _lookup(file, search_cols)
+    if meta is None:
+        with _connection_lock:
+            meta = _lookup(file, search_cols)  # another thread may have rebuilt it meanwhile
+            if meta is None:
+                # The old connection is not closed: threads still querying it keep the
+                # replaced file open and finish there; it closes once they let go
+                _connection = _open(build_database())
+                meta = _connect().execute("SELECT * FROM sources WHERE file = ?", (file,)).fetchone()
+    return meta
+
+
+def _match_expression(query):
+    """OR of the query's BM25 tokens, each quoted so FTS5 syntax is never interpreted"""
+    tokens = dict.fromkeys(BM25().tokenize(query))
+    return " OR ".join('"' + token.replace('"', '""') + '"' for token in tokens)
+
+
+def search_file(filepath, search_cols, output_cols, query, max_results):
+    """FTS5 counterpart of core._search_csv(); None if filepath is not a configured CSV"""
+    try:
+        file = filepath.relative_to(DATA_DIR).as_posix()
+    except ValueError:
+        return None
+    if not filepath.exists():
+        return []
+
+    meta = _source(file, search_cols)
+    if meta is None:
+        return None
+    expression = _match_expression(query)
+    if not expression or max_results <= 0:
+        return []
+
+    present = json.loads(meta["output_cols"])
+    weights = ", ".join(str(w) for w in json.loads(meta["weights"]))
+    columns = ", ".join(f"c{i}" for i in range(len(present))) or "rowid"
+    rows = _connect().execute(
+        f"SELECT {columns} FROM {meta['tbl']} WHERE {meta['tbl']} MATCH ? "
+        f"ORDER BY bm25({meta['tbl']}, {weights}), rowid LIMIT ?",
+        (expression, max_results)
+    ).fetchall()
+    return [dict(zip(present, tuple(row)[:len(present)])) for row in rows]
+
+
+# ============ CLI ============
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="UI Pro Max FTS5 search database")
+    parser.add_argument("--build", action="store_true", help="Rebuild the database now")
+    parser.add_argument("--status", action="store_true", help="Show database path and stale sources")
+    args = parser.parse_args()
+
+    if not fts5_available():
+        print("Error: this Python's SQLite build has no FTS5 support")
+        raise SystemExit(1)
+
+    if args.build:
+        print(f"Built {build_database()}")
+    else:
+        path = database_path()
+        print(f"Database: {path} ({'present' if path.exists() else 'missing'})")
+        if path.exists():
+            conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+            stale = [file for file, size, mtime_ns in conn.execute("SELECT file, size, mtime_ns FROM sources")
+                     if (size, mtime_ns) != _file_signature(DATA_DIR / file)]
+            conn.close()
+            print(f"Stale sources: {', '.join(stale) if stale else 'none'}")
@@ -3,6 +3,8 @@
 """
 UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
 Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
+       python search.py "<query>" --all-domains [--max-results 3]
+       python search.py --batch <file|-> [--domain <domain>] [--stack <stack>] [--batch-size 1]
        python search.py "<query>" --design-system [-p "Project Name"]
        python search.py "<query>" --design-system --persist [-p "Project Name"] [--page "dashboard"]
 
@@ -12,11 +14,36 @@ Stacks: html-tailwind, react, nextjs
 Persistence (Master + Overrides pattern):
   --persist    Save design system to design-system/MASTER.md
   --page       Also create a page-specific override file in design-system/pages/
+
+Batch mode (one JSON result per input line, streamed as each batch finishes):
+  Input lines are plain queries, or JSONL objects such as
+  {"id": "hero", "query": "saas landing", "domain": "landing", "max_results": 2}
+  {"query": "form validation", "stack": "react"}
+
+Search backend: compiled BM25 indexes by default; set UIPRO_SEARCH_BACKEND=fts5
+to use the SQLite FTS5 database instead (build it ahead of time with fts.py --build).
+
+Server mode (keeps all indexes warm; other invocations use it automatically):
+  python search.py --serve [--socket PATH]
+  python search.py --serve --stdio
+
+Profiling: --profile runs in-process and writes per-stage timings and
+allocation counts as one JSON object to stderr (stdout is unchanged):
+  {"mode": "search", "query": "...", "total_ms": 4.2,
+   "stages": [{"stage": "index.load", "calls": 1, "ms": 1.9, "allocated_blocks": 8652}, ...]}
+
+Startup: agents spawn this CLI once per query, so each mode imports only what
+it needs (design_system only for --design-system, argparse only for options
+beyond a plain domain/stack search). Check the budget with
+python bench_startup.py.
 """
 
-import argparse
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
-from design_system import generate_design_system, persist_design_system
+import json
+import os
+import sys
+from types import SimpleNamespace
+from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_all, search_many, search_stack
+from server import call, serve_socket, serve_stdio
 
 
 def format_output(result):
@@ -45,33 +72,196 @@ def format_output(result):
     return "\n".join(output)
 
 
+def format_all_output(result):
+    """Format search_all() results: one section per matching domain, best first"""
+    sections = [format_output(result["domains"][domain]) for domain in result["ranking"]]
+    if not sections:
+        return f"## UI Pro Max Search Results\n**Domains:** all | **Query:** {result['query']} | **Found:** 0 results"
+    return "\n".join(sections)
+
+
+def _read_batch(lines, stack=None):
+    """Parse batch input lines into search_many() entries; bad lines become error entries"""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                yield {"error": f"Invalid JSON: {e}", "line": line}
+        elif stack:
+            yield {"query": line, "stack": stack}
+        else:
+            yield line
+
+
+def run_batch(source, domain=None, stack=None, max_results=MAX_RESULTS, batch_size=1, socket_path=None):
+    """Stream one JSON result per line for each query read from source"""
+    stream = sys.stdin if source == "-" else open(source, 'r', encoding='utf-8')
+    try:
+        chunk = []
+        for entry in _read_batch(stream, stack):
+            if isinstance(entry, dict) and "error" in entry:
+                _flush_batch(chunk, domain, max_results, socket_path)
+                chunk = []
+                print(json.dumps(entry, ensure_ascii=False), flush=True)
+                continue
+            chunk.append(entry)
+            if len(chunk) >= batch_size:
+                _flush_batch(chunk, domain, max_results, socket_path)
+                chunk = []
+        _flush_batch(chunk, domain, max_results, socket_path)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def _emit_profile(profile, mode, query):
+    """Write a finished Profile as one JSON line to stderr"""
+    profile.__exit__(None, None, None)
+    print(json.dumps({"mode": mode, "query": query, **profile.to_dict()}), file=sys.stderr)
+
+
+def _flush_batch(chunk, domain, max_results, socket_path):
+    if not chunk:
+        return
+    results = call(
+        "search_many",
+        lambda: search_many(chunk, domain, max_results),
+        path=socket_path,
+        queries=chunk,
+        domain=domain,
+        max_results=max_results
+    )
+    for result in results:
+        print(json.dumps(result, ensure_ascii=False), flush=True)
+
+
+# Options of a plain search: flag -> (attribute, value parser; None for switches)
+_PLAIN_OPTIONS = {
+    "--domain": ("domain", lambda v: v if v in CSV_CONFIG else None),
+    "-d": ("domain", lambda v: v if v in CSV_CONFIG else None),
+    "--stack": ("stack", lambda v: v if v in AVAILABLE_STACKS else None),
+    "-s": ("stack", lambda v: v if v in AVAILABLE_STACKS else None),
+    "--max-results": ("max_results", lambda v: int(v) if v.isdigit() else None),
+    "-n": ("max_results", lambda v: int(v) if v.isdigit() else None),
+    "--json": ("json", None),
+    "--no-server": ("no_server", None),
+}
+
+
+def _parse_plain(argv):
+    """Arguments of `"<query>" [--domain D] [--stack S] [-n N] [--json] [--no-server]` without
+    argparse; None for anything else (other modes, --help, invalid values), which argparse handles"""
+    args = SimpleNamespace(query=None, domain=None, stack=None, all_domains=False, max_results=MAX_RESULTS,
+                           json=False, batch=None, batch_size=1, design_system=False, project_name=None,
+                           format="ascii", persist=False, page=None, output_dir=None, serve=False, stdio=False,
+                           socket=None, no_server=False, profile=False)
+    argv = iter(argv)
+    for arg in argv:
+        if arg in _PLAIN_OPTIONS:
+            name, parse = _PLAIN_OPTIONS[arg]
+            value = True if parse is None else parse(next(argv, ""))
+            if value is None:
+                return None
+            setattr(args, name, value)
+        elif arg.startswith("-") or args.query is not None:
+            return None
+        else:
+            args.query = arg
+    return args if args.query is not None else None
+
+
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
-    parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
-    parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
-    parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
-    parser.add_argument("--json", action="store_true", help="Output as JSON")
-    # Design system generation
-    parser.add_argument("--design-system", "-ds", action="store_true", help="Generate complete design system recommendation")
-    parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name for design system output")
-    parser.add_argument("--format", "-f", choices=["ascii", "markdown"], default="ascii", help="Output format for design system")
-    # Persistence (Master + Overrides pattern)
-    parser.add_argument("--persist", action="store_true", help="Save design system to design-system/MASTER.md (creates hierarchical structure)")
-    parser.add_argument("--page", type=str, default=None, help="Create page-specific override file in design-system/pages/")
-    parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
-
-    args = parser.parse_args()
+    # Plain searches skip argparse, which with its gettext/locale/shutil imports
+    # is a third of this CLI's cold start (see bench_startup.py)
+    args = _parse_plain(sys.argv[1:])
+    if args is None:
+        import argparse
+        parser = argparse.ArgumentParser(description="UI Pro Max Search")
+        parser.add_argument("query", nargs="?", help="Search query")
+        parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
+        parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
+        parser.add_argument("--all-domains", "-a", action="store_true", help="Search every domain at once (per-domain top results)")
+        parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
+        parser.add_argument("--json", action="store_true", help="Output as JSON")
+        # Batch mode
+        parser.add_argument("--batch", type=str, metavar="FILE", default=None, help="Read one query (or JSONL request) per line from FILE or - for stdin; print JSONL")
+        parser.add_argument("--batch-size", type=int, default=1, help="Queries scored per batch before results are printed (default: 1)")
+        # Design system generation
+        parser.add_argument("--design-system", "-ds", action="store_true", help="Generate complete design system recommendation")
+        parser.add_argument("--project-name", "-p", type=str, default=None, help="Project name for design system output")
+        parser.add_argument("--format", "-f", choices=["ascii", "markdown"], default="ascii", help="Output format for design system")
+        # Persistence (Master + Overrides pattern)
+        parser.add_argument("--persist", action="store_true", help="Save design system to design-system/MASTER.md (creates hierarchical structure)")
+        parser.add_argument("--page", type=str, default=None, help="Create page-specific override file in design-system/pages/")
+        parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
+        # Server mode
+        parser.add_argument("--serve", action="store_true", help="Run a long-lived search server with all indexes warm")
+        parser.add_argument("--stdio", action="store_true", help="With --serve: answer JSON-RPC on stdin/stdout instead of a socket")
+        parser.add_argument("--socket", type=str, default=None, help="Server socket path (default: $UIPRO_SEARCH_SOCKET or uipro-search-<uid>-<checkout hash>.sock in $XDG_RUNTIME_DIR or the temp dir)")
+        parser.add_argument("--no-server", action="store_true", help="Always search in-process, even if a server is running")
+        # Profiling
+        parser.add_argument("--profile", action="store_true", help="Print per-stage timings and allocations as JSON to stderr (runs in-process)")
+
+        args = parser.parse_args()
+
+    if args.no_server:
+        os.environ["UIPRO_NO_SERVER"] = "1"
+
+    if args.profile and not args.serve:
+        import atexit
+        from core import Profile
+
+        # Stages are recorded in this process, so never hand the call to a server
+        os.environ["UIPRO_NO_SERVER"] = "1"
+        mode = ("design_system" if args.design_system else "batch" if args.batch else "search_stack" if args.stack
+                else "search_all" if args.all_domains else "search")
+        atexit.register(_emit_profile, Profile().__enter__(), mode, args.query)
+
+    if args.serve:
+        try:
+            if args.stdio:
+                serve_stdio()
+            else:
+                serve_socket(args.socket)
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        sys.exit(0)
+
+    if args.batch:
+        run_batch(args.batch, args.domain, args.stack, args.max_results, max(1, args.batch_size), args.socket)
+        sys.exit(0)
+
+    if args.query is None:
+        parser.error("the following arguments are required: query")
 
     # Design system takes priority
     if args.design_system:
-        result = generate_design_system(
-            args.query, 
-            args.project_name, 
-            args.format,
+        from design_system import generate_design_system
+
+        # Resolve the output dir here: the server runs in its own working directory
+        output_dir = os.path.abspath(args.output_dir or os.getcwd())
+        result = call(
+            "design_system",
+            lambda: generate_design_system(
+                args.query,
+                args.project_name,
+                args.format,
+                persist=args.persist,
+                page=args.page,
+                output_dir=args.output_dir
+            ),
+            path=args.socket,
+            query=args.query,
+            project_name=args.project_name,
+            output_format=args.format,
             persist=args.persist,
             page=args.page,
-            output_dir=args.output_dir
+            output_dir=output_dir
         )
         print(result)
         
@@ -90,17 +280,42 @@ if __name__ == "__main__":
             print("=" * 60)
     # Stack search
     elif args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
+        result = call(
+            "search_stack",
+            lambda: search_stack(args.query, args.stack, args.max_results),
+            path=args.socket,
+            query=args.query,
+            stack=args.stack,
+            max_results=args.max_results
+        )
         if args.json:
-            import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
         else:
             print(format_output(result))
+    # Cross-domain search
+    elif args.all_domains:
+        result = call(
+            "search_all",
+            lambda: search_all(args.query, args.max_results),
+            path=args.socket,
+            query=args.query,
+            max_results=args.max_results
+        )
+        if args.json:
+            print(json.dumps(result, indent=2, ensure_ascii=False))
+        else:
+            print(format_all_output(result))
     # Domain search
     else:
-        result = search(args.query, args.domain, args.max_results)
+        result = call(
+            "search",
+            lambda: search(args.query, args.domain, args.max_results),
+            path=args.socket,
+            query=args.query,
+            domain=args.domain,
+            max_results=args.max_results
+        )
         if args.json:
-            import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
         else:
             print(format_output(result))
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Search Server - keeps every domain and stack index warm in one process
+Usage: python search.py --serve [--socket PATH]   # Unix domain socket (default)
+       python search.py --serve --stdio           # JSON-RPC over stdin/stdout
+
+Protocol: JSON-RPC 2.0, one request per line, one response per line.
+Methods: search, search_stack, search_all, search_many, design_system, ping, shutdown
+
+    {"jsonrpc": "2.0", "id": 1, "method": "search", "params": {"query": "glassmorphism", "domain": "style"}}
+
+Clients use call(), which talks to a running server and falls back to
+in-process search when none is listening or it cannot answer. socket and
+threading are imported only once a server socket exists, so the fallback
+path stays cheap. The default socket is per user and per checkout (data
+directory and code location), so a server never answers for other data.
+"""
+
+import json
+import os
+import sys
+import zlib
+
+# ============ CONFIGURATION ============
+CONNECT_TIMEOUT = 0.5
+CALL_TIMEOUT = 60.0
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+def default_socket_path():
+    """Socket path per user and checkout: DATA_DIR and this code's location (override with UIPRO_SEARCH_SOCKET)"""
+    override = os.environ.get("UIPRO_SEARCH_SOCKET")
+    if override:
+        return override
+    from core import DATA_DIR
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or _temp_dir()
+    user = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+    checkout = f"{os.path.realpath(DATA_DIR)}\0{os.path.realpath(os.path.dirname(__file__))}"
+    return os.path.join(runtime_dir, f"uipro-search-{user}-{zlib.crc32(checkout.encode('utf-8')):08x}.sock")
+
+
+def _temp_dir():
+    """tempfile.gettempdir() without importing tempfile when $TMPDIR/$TEMP/$TMP is set"""
+    for name in ("TMPDIR", "TEMP", "TMP"):
+        if os.environ.get(name):
+            return os.environ[name]
+    import tempfile
+    return tempfile.gettempdir()
+
+
+# ============ REQUEST HANDLING ============
+def _method_search(params):
+    from core import MAX_RESULTS, search
+    return search(params["query"], params.get("domain"), params.get("max_results", MAX_RESULTS))
+
+
+def _method_search_stack(params):
+    from core import MAX_RESULTS, search_stack
+    return search_stack(params["query"], params["stack"], params.get("max_results", MAX_RESULTS))
+
+
+def _method_search_all(params):
+    from core import MAX_RESULTS, search_all
+    return search_all(params["query"], params.get("max_results", MAX_RESULTS), params.get("domains"))
+
+
+def _method_search_many(params):
+    from core import MAX_RESULTS, search_many
+    return search_many(params["queries"], params.get("domain"), params.get("max_results", MAX_RESULTS))
+
+
+def _method_design_system(params):
+    from design_system import generate_design_system
+    return generate_design_system(
+        params["query"],
+        params.get("project_name"),
+        params.get("output_format", "ascii"),
+        persist=params.get("persist", False),
+        page=params.get("page"),
+        output_dir=params.get("output_dir"),
+    )
+
+
+def _method_ping(params):
+    return "pong"
+
+
+METHODS = {
+    "search": _method_search,
+    "search_stack": _method_search_stack,
+    "search_all": _method_search_all,
+    "search_many": _method_search_many,
+    "design_system": _method_design_system,
+    "ping": _method_ping,
+}
+
+
+def _error(request_id, code, message):
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def handle_request(line):
+    """Handle one JSON-RPC request line and return the response dict"""
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as e:
+        return _error(None, PARSE_ERROR, f"Parse error: {e}")
+
+    if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+        return _error(None, INVALID_REQUEST, "Invalid request")
+
+    request_id = request.get("id")
+    method = METHODS.get(request["method"])
+    if method is None:
+        return _error(request_id, METHOD_NOT_FOUND, f"Unknown method: {request['method']}")
+
+    params = request.get("params") or {}
+    try:
+        result = method(params)
+    except (KeyError, TypeError) as e:
+        return _error(request_id, INVALID_PARAMS, f"Invalid params: {e}")
+    except Exception as e:
+        return _error(request_id, INTERNAL_ERROR, f"{type(e).__name__}: {e}")
+
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def _encode(response):
+    return json.dumps(response, ensure_ascii=False) + "\n"
+
+
+# ============ SERVERS ============
+def _warm():
+    """Load every index up front so the first request is already warm"""
+    from core import warm_indexes
+    import design_system  # noqa: F401  (import cost paid once, not per request)
+    return warm_indexes()
+
+
+def serve_stdio(stdin=None, stdout=None):
+    """Answer JSON-RPC requests line by line on stdin/stdout until EOF or shutdown"""
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    _warm()
+    for line in stdin:
+        if not line.strip():
+            continue
+        if _is_shutdown(line):
+            stdout.write(_encode({"jsonrpc": "2.0", "id": _request_id(line), "result": "bye"}))
+            stdout.flush()
+            break
+        stdout.write(_encode(handle_request(line)))
+        stdout.flush()
+
+
+def serve_socket(path=None):
+    """Answer JSON-RPC requests on a Unix domain socket until shutdown"""
+    import socket
+    import socketserver
+    import threading
+
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("Unix domain sockets are not available on this platform; use --stdio")
+
+    path = path or default_socket_path()
+    if os.path.exists(path):
+        if ping(path):
+            raise OSError(f"A search server is already listening on {path}")
+        os.unlink(path)  # stale socket from a crashed server
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for raw in self.rfile:
+                line = raw.decode("utf-8")
+                if not line.strip():
+                    continue
+                if _is_shutdown(line):
+                    response = {"jsonrpc": "2.0", "id": _request_id(line), "result": "bye"}
+                    self.wfile.write(_encode(response).encode("utf-8"))
+                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+                    return
+                self.wfile.write(_encode(handle_request(line)).encode("utf-8"))
+                self.wfile.flush()
+
+    class Server(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+
+    count = _warm()
+    with Server(path, Handler) as server:
+        os.chmod(path, 0o600)
+        print(f"UI Pro Max search server: {count} indexes warm, listening on {path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+def _is_shutdown(line):
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError:
+        return False
+    return isinstance(request, dict) and request.get("method") == "shutdown"
+
+
+def _request_id(line):
+    return json.loads(line).get("id")
+
+
+# ============ CLIENT ============
+class ServerTimeout(Exception):
+    """The server took the request but did not answer in time (it may still be running it)"""
+
+
+class SearchClient:
+    """Minimal JSON-RPC client for a running search server"""
+
+    def __init__(self, path=None, timeout=CALL_TIMEOUT):
+        self.path = path or default_socket_path()
+        self.timeout = timeout
+        self._next_id = 0
+
+    def call(self, method, **params):
+        """Call a server method.
+
+        Raises OSError if no server is reachable or the connection drops,
+        ValueError for a malformed reply, RuntimeError for a server-side
+        error and ServerTimeout if the request was sent but not answered.
+        """
+        if not os.path.exists(self.path):
+            raise ConnectionRefusedError(f"No search server at {self.path}")
+        import socket
+        if not hasattr(socket, "AF_UNIX"):
+            raise ConnectionRefusedError(f"No search server at {self.path}")
+
+        self._next_id += 1
+        request = {"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": params}
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(self.path)
+            sock.settimeout(self.timeout)
+            sock.sendall(_encode(request).encode("utf-8"))
+            try:
+                with sock.makefile("r", encoding="utf-8") as reader:
+                    line = reader.readline()
+            except socket.timeout:
+                raise ServerTimeout(f"search server at {self.path} did not answer {method} within {self.timeout:g}s")
+        if not line:
+            raise ConnectionResetError("Search server closed the connection")
+
+        response = json.loads(line)
+        if not isinstance(response, dict) or not ("result" in response or "error" in response):
+            raise ValueError(f"Malformed response from search server: {line[:200]!r}")
+        if "error" in response:
+            raise RuntimeError(response["error"]["message"])
+        return response["result"]
+
+
+def ping(path=None):
+    """True if a server answers on the socket"""
+    try:
+        return SearchClient(path, timeout=CONNECT_TIMEOUT).call("ping") == "pong"
+    except (OSError, ValueError, RuntimeError, ServerTimeout):
+        return False
+
+
+def call(method, fallback, path=None, **params):
+    """Run a method on the warm server if one is listening, else fallback() in-process.
+
+    A server error or garbled reply also falls back. A request the server
+    took but did not answer in time is not re-run (it may still be writing
+    --persist files): the CLI reports the timeout and exits.
+    """
+    if os.environ.get("UIPRO_NO_SERVER"):
+        return fallback()
+    try:
+        return SearchClient(path).call(method, **params)
+    except ServerTimeout as e:
+        print(f"Error: {e}; not re-running it in-process", file=sys.stderr)
+        raise SystemExit(1)
+    except (OSError, ValueError, RuntimeError):
+        return fallback()
@@ -0,0 +1,972 @@
+#!/usr/bin/env python3
+"""
+Parallel Check Runner - Antigravity Kit
+=======================================
+
+Runs validation scripts concurrently for checklist.py and verify_all.py (--jobs N).
+
+Each check runs in its own process (and process group), at most `jobs` at a
+time. Checks are scheduled as a DAG: a check starts once the checks it
+depends on have passed (it is blocked if one failed), and only while its
+resource class is below its own limit - so regex scanners fill every core
+while only one Chromium runs at a time. Among ready checks, required ones
+start first, in priority order. With stop_on_fail, the first failing
+required check kills every check still running and cancels the rest.
+Sequential runs (run_script) block a check whose dependency failed the
+same way, so --jobs 1 and --jobs N reach the same verdict.
+
+Resource classes:
+    cpu            - in-process scanners (regex/AST over the project tree)
+    io             - scripts mostly reading files or waiting on the network
+    browser        - checks that launch a browser (Lighthouse, Playwright)
+    external-tool  - checks that shell out to heavy tools (npm, eslint, tsc, pytest)
+
+With a FileSnapshot, the regex/AST scanners (IN_PROCESS_SCRIPTS) run in
+this interpreter instead: each is imported once and its main(argv,
+snapshot) called on a worker thread, so every scanner walks and reads the
+same in-memory view of the tree instead of re-reading it from disk, and no
+interpreter is started per check. Their output is captured per thread.
+A thread cannot be killed, so an in-process check past its timeout is
+reported as timed out and not waited for, but keeps running in the background.
+
+Output is streamed as it is printed: on_output(check, line, stream) gets
+every line of every running check (subprocess or in-process), and
+EventLog writes check started/finished events as NDJSON for dashboards.
+
+Every check that runs records its wall time, CPU time and peak RSS (exact
+per child via os.wait4, even with --jobs) in TimingHistory, which flags
+checks that got much slower than their rolling median.
+
+Results of checks that only read project files are cached in
+<project>/.agent/.cache/checks.sqlite (see ResultCache), keyed on the
+script's hash, its arguments and the content of the files it reads.
+
+Both orchestrators also share the terminal side from here: run_script()
+for sequential runs, per-check status lines, live output, timing trends.
+
+Usage:
+    from check_runner import ResultCache, run_checks
+    results = run_checks(checks, project_path, url, jobs=4, stop_on_fail=True,
+                         cache=ResultCache(project_path), snapshot=FileSnapshot(project_path))
+"""
+
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import queue
+import re
+import signal
+import sqlite3
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from file_snapshot import FileSnapshot
+
+RESOURCE_CLASSES = ("cpu", "io", "browser", "external-tool")
+
+
+def default_jobs() -> int:
+    """Worker count when --jobs is given without a value"""
+    return os.cpu_count() or 1
+
+
+def default_limits() -> Dict[str, int]:
+    """Concurrent checks allowed per resource class on this machine"""
+    cores = default_jobs()
+    return {"cpu": cores, "io": 2 * cores, "browser": 1, "external-tool": max(1, cores // 2)}
+
+
+def parse_limit(value: str) -> tuple:
+    """argparse type for --limit CLASS=N"""
+    import argparse
+    resource, _, count = value.partition("=")
+    if resource not in RESOURCE_CLASSES or not count.isdigit() or int(count) < 1:
+        raise argparse.ArgumentTypeError(f"expected CLASS=N with CLASS in {', '.join(RESOURCE_CLASSES)}")
+    return resource, int(count)
+
+
+def check_command(script_path: Path, project_path: str, url: Optional[str] = None) -> list:
+    """Command line for one validation script"""
+    cmd = ["python", str(script_path), project_path]
+    if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
+        cmd.append(url)
+    return cmd
+
+
+# ============ RESULT CACHE ============
+CACHE_FILE = Path(".agent") / ".cache" / "checks.sqlite"
+CACHE_VERSION = 1
+CACHE_TTL = 24 * 3600  # seconds; bounds staleness of checks that also query advisories (npm audit)
+
+# Project files each cacheable script reads, by suffix (None: every file).
+# Scripts not listed (test runner, Lighthouse, Playwright, bundle analysis)
+# depend on more than the source tree and always run.
+CHECK_INPUTS = {
+    # code + config it scans, lock/manifest files it checks for, header configs (nginx.conf, next.config.mjs)
+    "security_scan.py": {".js", ".ts", ".jsx", ".tsx", ".py", ".go", ".java", ".rb", ".php", ".json", ".yaml", ".yml",
+                         ".toml", ".local", ".development", ".lock", ".txt", ".mjs", ".conf"},
+    "dependency_analyzer.py": None,
+    "lint_runner.py": None,
+    "type_coverage.py": {".ts", ".tsx", ".py"},
+    "schema_validator.py": {".prisma", ".ts"},
+    "ux_audit.py": {".tsx", ".jsx", ".html", ".vue", ".svelte", ".css"},
+    # .css: style edits re-run it with the UX audit, though the checker itself only parses markup
+    "accessibility_checker.py": {".html", ".jsx", ".tsx", ".css"},
+    "seo_checker.py": {".html", ".htm", ".jsx", ".tsx"},
+    "geo_checker.py": {".html", ".htm", ".jsx", ".tsx"},
+    "mobile_audit.py": {".tsx", ".ts", ".jsx", ".js", ".dart"},
+    "i18n_checker.py": {".json", ".po", ".tsx", ".jsx", ".ts", ".js", ".vue", ".py"},
+}
+
+
+def check_affected(script_path: Path, changed: Iterable[str], project_path: Path) -> bool:
+    """Whether changes to these project files (relative paths) can change a check's result"""
+    suffixes = CHECK_INPUTS.get(script_path.name)  # scripts not listed read everything
+    try:
+        script = Path(script_path).relative_to(project_path).as_posix()
+    except ValueError:
+        script = None
+    return any(suffixes is None or path == script or Path(path).suffix.lower() in suffixes for path in changed)
+
+
+# Dependency and build output directories are not part of the fingerprint
+FINGERPRINT_SKIP_DIRS = {"node_modules", ".git", "dist", "build", "__pycache__", ".venv", "venv", ".next"}
+
+
+class ResultCache:
+    """
+    Check results keyed on (script hash, arguments, content of the files it reads).
+
+    File digests are kept per path with the (size, mtime) they were computed
+    for, so a run only re-hashes files that changed since the last one.
+    """
+
+    def __init__(self, project_path: Path, ttl: int = CACHE_TTL, snapshot: Optional[FileSnapshot] = None):
+        self.project_path = Path(project_path)
+        self.ttl = ttl
+        self.snapshot = snapshot  # walk/stat/read through the in-process scanners' snapshot
+        path = self.project_path / CACHE_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path, timeout=10)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, digest TEXT);
+            CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, script TEXT, passed INTEGER,
+                                                output TEXT, error TEXT, duration REAL, created REAL);
+        """)
+        self._digests = None
+
+    def close(self):
+        self.db.close()
+
+    def _file_digests(self) -> Dict[str, str]:
+        """{relative path: sha256} of every project file, computed once per run"""
+        if self._digests is not None:
+            return self._digests
+        known = {path: (size, mtime_ns, digest) for path, size, mtime_ns, digest
+                 in self.db.execute("SELECT path, size, mtime_ns, digest FROM files")}
+        digests, changed = {}, []
+        cache_dir = self.project_path / CACHE_FILE.parent
+        walk = self.snapshot.walk if self.snapshot is not None else os.walk
+        for root, dirs, files in walk(self.project_path):
+            dirs[:] = sorted(d for d in dirs if d not in FINGERPRINT_SKIP_DIRS and Path(root, d) != cache_dir)
+            for name in files:
+                path = Path(root, name)
+                rel = path.relative_to(self.project_path).as_posix()
+                try:
+                    st = self.snapshot.stat(path) if self.snapshot is not None else path.stat()
+                    entry = known.get(rel)
+                    if entry and entry[:2] == (st.st_size, st.st_mtime_ns):
+                        digests[rel] = entry[2]
+                        continue
+                    if self.snapshot is not None:
+                        digests[rel] = hashlib.sha256(self.snapshot.read_bytes(path)).hexdigest()
+                    else:
+                        with open(path, "rb") as f:
+                            digests[rel] = hashlib.sha256(f.read()).hexdigest()
+                except OSError:
+                    continue
+                changed.append((rel, st.st_size, st.st_mtime_ns, digests[rel]))
+        with self.db:
+            self.db.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", changed)
+            self.db.executemany("DELETE FROM files WHERE path = ?", [(rel,) for rel in known if rel not in digests])
+        self._digests = digests
+        return digests
+
+    def key(self, script_path: Path, cmd: list) -> Optional[str]:
+        """Cache key for one check command, or None if the script is never cached"""
+        if script_path.name not in CHECK_INPUTS:
+            return None
+        suffixes = CHECK_INPUTS[script_path.name]
+        inputs = sorted((rel, digest) for rel, digest in self._file_digests().items()
+                        if suffixes is None or Path(rel).suffix.lower() in suffixes)
+        with open(script_path, "rb") as f:
+            script_digest = hashlib.sha256(f.read()).hexdigest()
+        payload = json.dumps([CACHE_VERSION, script_digest, cmd[2:], inputs])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[dict]:
+        """Cached {passed, output, error, duration} for key, if fresh"""
+        if key is None:
+            return None
+        row = self.db.execute("SELECT passed, output, error, duration FROM results WHERE key = ? AND created > ?",
+                              (key, time.time() - self.ttl)).fetchone()
+        if row is None:
+            return None
+        return {"passed": bool(row[0]), "output": row[1], "error": row[2], "duration": row[3], "cached": True}
+
+    def put(self, key: Optional[str], script_path: Path, result: dict):
+        """Store a finished check's result (timeouts and spawn errors are not cached)"""
+        if key is None or result.get("skipped") or result.get("error") == "Timeout":
+            return
+        with self.db:
+            self.db.execute("DELETE FROM results WHERE created <= ?", (time.time() - self.ttl,))
+            self.db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            (key, script_path.name, int(result["passed"]), result.get("output", ""),
+                             result.get("error", ""), result.get("duration", 0), time.time()))
+
+
+class CheckProcess(subprocess.CompletedProcess):
+    """CompletedProcess plus the check's CPU seconds and peak RSS in MB (None when unknown)"""
+
+    def __init__(self, args, returncode, stdout=None, stderr=None, cpu_time=None, max_rss=None):
+        super().__init__(args, returncode, stdout, stderr)
+        self.cpu_time = cpu_time
+        self.max_rss = max_rss
+
+
+# ============ TIMING HISTORY ============
+HISTORY_FILE = Path(".agent") / ".cache" / "history.sqlite"
+HISTORY_WINDOW = 10  # previous runs of a check in its rolling median
+REGRESSION_FACTOR = 3.0  # flag a check this many times slower than its median...
+REGRESSION_MIN_SECONDS = 1.0  # ...and at least this much slower (ignores jitter of sub-second checks)
+REGRESSION_MIN_SAMPLES = 3
+
+
+class TimingHistory:
+    """
+    Wall time, CPU time and peak RSS of every check that actually ran
+    (not cached or skipped), per project, for trends and regression alerts.
+    """
+
+    def __init__(self, project_path: Path):
+        path = Path(project_path) / HISTORY_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path, timeout=10)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS timings (run REAL, runner TEXT, name TEXT, status TEXT,
+                                                duration REAL, cpu_time REAL, max_rss REAL);
+            CREATE INDEX IF NOT EXISTS timings_by_name ON timings (name, run);
+        """)
+
+    def close(self):
+        self.db.close()
+
+    @staticmethod
+    def _measured(results: List[dict]) -> List[dict]:
+        return [result for result in results
+                if not result.get("skipped") and not result.get("cached") and result.get("duration")]
+
+    def record(self, runner: str, results: List[dict]) -> List[dict]:
+        """
+        Store this run's timings; returns one trend per measured check, compared
+        with its previous runs: name, duration, cpu_time, max_rss, median
+        (None without history), ratio, samples, regressed.
+        """
+        trends = []
+        for result in self._measured(results):
+            previous = [row[0] for row in self.db.execute(
+                "SELECT duration FROM timings WHERE name = ? AND status IN ('passed', 'failed') "
+                "ORDER BY run DESC LIMIT ?", (result["name"], HISTORY_WINDOW))]
+            median = statistics.median(previous) if previous else None
+            duration = result["duration"]
+            trends.append({
+                "name": result["name"], "duration": duration, "cpu_time": result.get("cpu_time"),
+                "max_rss": result.get("max_rss"), "median": median, "samples": len(previous),
+                "ratio": duration / median if median else None,
+                "regressed": (len(previous) >= REGRESSION_MIN_SAMPLES and duration >= REGRESSION_FACTOR * median
+                              and duration - median >= REGRESSION_MIN_SECONDS),
+            })
+        now = time.time()
+        with self.db:
+            self.db.executemany("INSERT INTO timings VALUES (?, ?, ?, ?, ?, ?, ?)", [
+                (now, runner, result["name"], check_status(result), result["duration"],
+                 result.get("cpu_time"), result.get("max_rss"))
+                for result in self._measured(results)])
+        return trends
+
+
+# ============ IN-PROCESS CHECKS ============
+# Scanners exposing main(argv=None, snapshot=None) -> exit code that only
+# read the project tree; run in-process when a FileSnapshot is given.
+IN_PROCESS_SCRIPTS = {
+    "security_scan.py", "ux_audit.py", "mobile_audit.py", "seo_checker.py", "geo_checker.py",
+    "i18n_checker.py", "accessibility_checker.py", "type_coverage.py", "api_validator.py",
+}
+
+_scanners = {}  # resolved script path -> imported module
+_import_lock = threading.Lock()
+_capture = threading.local()  # .stdout/.stderr buffers of the check running on this thread
+
+
+class _ThreadOutput:
+    """sys.stdout/sys.stderr stand-in: writes go to the current thread's capture buffer, if any"""
+
+    def __init__(self, stream, name: str):
+        self._stream = stream
+        self._name = name
+
+    def _target(self):
+        return getattr(_capture, self._name, None) or self._stream
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    def __getattr__(self, attr):  # encoding, isatty, reconfigure, ...
+        return getattr(self._stream, attr)
+
+
+class _LineCapture(io.StringIO):
+    """Capture buffer that also hands each completed line to on_line(line, stream)"""
+
+    def __init__(self, stream: str, on_line: Optional[Callable] = None):
+        super().__init__()
+        self._stream = stream
+        self._on_line = on_line
+        self._partial = ""
+
+    def write(self, text):
+        count = super().write(text)
+        if self._on_line:
+            *lines, self._partial = (self._partial + text).split("\n")
+            for line in lines:
+                self._emit(line + "\n")
+        return count
+
+    def close_lines(self):
+        """Report a last line without a newline"""
+        if self._on_line and self._partial:
+            self._emit(self._partial)
+        self._partial = ""
+
+    def _emit(self, line: str):
+        # on_line may print: let it reach the real streams, not this buffer
+        saved = _capture.stdout, _capture.stderr
+        _capture.stdout = _capture.stderr = None
+        try:
+            self._on_line(line, self._stream)
+        finally:
+            _capture.stdout, _capture.stderr = saved
+
+
+def _install_capture():
+    """Route output written by in-process checks to per-thread buffers (idempotent)"""
+    if not isinstance(sys.stdout, _ThreadOutput):
+        sys.stdout = _ThreadOutput(sys.stdout, "stdout")
+    if not isinstance(sys.stderr, _ThreadOutput):
+        sys.stderr = _ThreadOutput(sys.stderr, "stderr")
+
+
+def runs_in_process(script_path: Path, snapshot: Optional[FileSnapshot]) -> bool:
+    return snapshot is not None and script_path.name in IN_PROCESS_SCRIPTS
+
+
+def _load_scanner(script_path: Path):
+    """Import a scanner script once per interpreter"""
+    path = script_path.resolve()
+    with _import_lock:
+        module = _scanners.get(path)
+        if module is None:
+            spec = importlib.util.spec_from_file_location(f"_check_{path.stem}", path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _scanners[path] = module
+    return module
+
+
+def run_in_process(script_path: Path, cmd: list, snapshot: FileSnapshot, on_line: Optional[Callable] = None,
+                   timeout: Optional[float] = None) -> CheckProcess:
+    """
+    Run a scanner's main() as run_command(cmd, timeout) would (CPU time of its thread only).
+
+    A thread cannot be killed: with a timeout, main() runs on a daemon thread
+    and subprocess.TimeoutExpired is raised once the timeout passes, while
+    the scanner keeps running in the background (its later output is dropped).
+    """
+    if timeout is None:
+        return _run_scanner(script_path, cmd, snapshot, on_line)
+    outcome = []
+    abandoned = threading.Event()
+
+    def forward(line, stream):
+        if on_line and not abandoned.is_set():
+            on_line(line, stream)
+
+    worker = threading.Thread(target=lambda: outcome.append(_run_scanner(script_path, cmd, snapshot, forward)),
+                              daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        abandoned.set()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return outcome[0]
+
+
+def _run_scanner(script_path: Path, cmd: list, snapshot: FileSnapshot,
+                 on_line: Optional[Callable] = None) -> CheckProcess:
+    """run_in_process() on this thread, without a timeout"""
+    _install_capture()
+    cpu_start = time.thread_time()
+    _capture.stdout, _capture.stderr = _LineCapture("stdout", on_line), _LineCapture("stderr", on_line)
+    try:
+        try:
+            returncode = _load_scanner(script_path).main(cmd[2:], snapshot) or 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                returncode = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                returncode = 1
+        except Exception:
+            traceback.print_exc()
+            returncode = 1
+        _capture.stdout.close_lines()
+        _capture.stderr.close_lines()
+        return CheckProcess(cmd, returncode, _capture.stdout.getvalue(), _capture.stderr.getvalue(),
+                            cpu_time=time.thread_time() - cpu_start)
+    finally:
+        _capture.stdout = _capture.stderr = None
+
+
+def _run_in_process(index: int, script_path: Path, cmd: list, snapshot: FileSnapshot, done: queue.Queue):
+    """In-process counterpart of _wait (thread body; run_checks() enforces the timeout)"""
+    result = _run_scanner(script_path, cmd, snapshot,
+                          on_line=lambda line, stream: done.put(("line", index, line, stream)))
+    done.put(("done", index, result.returncode, result.stdout, result.stderr, False, result.cpu_time, result.max_rss))
+
+
+def _kill(proc: subprocess.Popen):
+    """Kill a check and anything it spawned (linters, browsers, npm)"""
+    try:
+        if os.name == "posix":
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _spawn(cmd: list) -> subprocess.Popen:
+    """Start a check in its own process group, unbuffered so its output streams"""
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                            env={**os.environ, "PYTHONUNBUFFERED": "1"}, start_new_session=os.name == "posix")
+
+
+# ru_maxrss unit: kilobytes on Linux, bytes on macOS
+MAXRSS_PER_MB = 1024 * 1024 if sys.platform == "darwin" else 1024
+
+
+def _reap(proc: subprocess.Popen, usage: dict):
+    """Wait for proc with os.wait4 (thread body), keeping the CPU time and peak RSS of it and its children"""
+    _, status, rusage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    usage.update(cpu_time=rusage.ru_utime + rusage.ru_stime, max_rss=rusage.ru_maxrss / MAXRSS_PER_MB)
+
+
+def _communicate(proc: subprocess.Popen, timeout: Optional[int], on_line: Optional[Callable] = None) -> tuple:
+    """
+    proc.communicate() that also hands each output line to on_line(line, stream).
+
+    Returns (stdout, stderr, timed_out, usage) where usage has cpu_time and
+    max_rss where the platform reports them (os.wait4).
+    """
+    output = {"stdout": [], "stderr": []}
+
+    def pump(pipe, stream):
+        for line in pipe:
+            output[stream].append(line)
+            if on_line:
+                on_line(line, stream)
+        pipe.close()
+
+    readers = [threading.Thread(target=pump, args=(proc.stdout, "stdout"), daemon=True),
+               threading.Thread(target=pump, args=(proc.stderr, "stderr"), daemon=True)]
+    for reader in readers:
+        reader.start()
+    usage = {"cpu_time": None, "max_rss": None}
+    timed_out = False
+    if hasattr(os, "wait4"):
+        reaper = threading.Thread(target=_reap, args=(proc, usage), daemon=True)
+        reaper.start()
+        reaper.join(timeout)
+        if reaper.is_alive():
+            _kill(proc)
+            reaper.join()
+            timed_out = True
+    else:
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _kill(proc)
+            proc.wait()
+            timed_out = True
+    for reader in readers:
+        reader.join()
+    return "".join(output["stdout"]), "".join(output["stderr"]), timed_out, usage
+
+
+def run_command(cmd: list, timeout: Optional[int] = None, on_line: Optional[Callable] = None) -> CheckProcess:
+    """subprocess.run(cmd, capture_output=True, text=True, timeout=timeout), streaming lines to on_line(line, stream)"""
+    proc = _spawn(cmd)
+    stdout, stderr, timed_out, usage = _communicate(proc, timeout, on_line)
+    if timed_out:
+        raise subprocess.TimeoutExpired(cmd, timeout, stdout, stderr)
+    return CheckProcess(cmd, proc.returncode, stdout, stderr, **usage)
+
+
+def _wait(index: int, proc: subprocess.Popen, timeout: int, done: queue.Queue):
+    """Collect one check's output (thread body); queues its lines, then
+    ("done", index, returncode, stdout, stderr, timed_out, cpu_time, max_rss)"""
+    stdout, stderr, timed_out, usage = _communicate(proc, timeout, lambda line, stream: done.put(("line", index, line, stream)))
+    done.put(("done", index, proc.returncode, stdout, stderr, timed_out, usage["cpu_time"], usage["max_rss"]))
+
+
+# ============ PROGRESS EVENTS ============
+# Summary lines the scanners print, for the findings count of check_finished events
+FINDINGS_PATTERNS = [
+    re.compile(r'"(?:issues_found|total_findings)":\s*(\d+)'),  # JSON summaries (seo, accessibility, security)
+    re.compile(r"ISSUES \((\d+)\)"),  # ux / mobile audit
+    re.compile(r"(\d+) (?:critical )?issues"),  # i18n, type coverage, api validator
+]
+
+
+def failed_dependency(depends: Iterable[str], results: Dict[str, dict]) -> Optional[str]:
+    """The first of depends whose result (by name) failed, was blocked or was cancelled; names without a result are ignored"""
+    for name in depends:
+        result = results.get(name)
+        if result is not None and (not result["passed"] or result.get("blocked") or result.get("cancelled")):
+            return name
+    return None
+
+
+def count_findings(output: Optional[str]) -> Optional[int]:
+    """Number of findings a check reported, if its output says"""
+    for pattern in FINDINGS_PATTERNS:
+        match = pattern.search(output or "")
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def check_status(result: dict) -> str:
+    """passed | failed | timeout | skipped | blocked | cancelled"""
+    for status in ("cancelled", "blocked", "skipped"):
+        if result.get(status):
+            return status
+    if result.get("error") == "Timeout":
+        return "timeout"
+    return "passed" if result["passed"] else "failed"
+
+
+def _rounded(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 3)
+
+
+class EventLog:
+    """
+    Machine-readable progress: one JSON object per line (NDJSON), flushed as
+    it happens so dashboards can follow a run while it is going.
+
+    Events: run_started, check_started, check_finished (status, exit code,
+    duration, findings), run_finished (totals and the slowest check).
+    """
+
+    def __init__(self, path: str):
+        self.file = open(path, "w", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **fields):
+        line = json.dumps({"event": event, "time": round(time.time(), 3), **fields})
+        with self._lock:
+            self.file.write(line + "\n")
+            self.file.flush()
+
+    def run_started(self, project_path, checks: int, jobs: int):
+        self.emit("run_started", project=str(project_path), checks=checks, jobs=jobs)
+
+    def check_started(self, name: str, category: Optional[str] = None):
+        self.emit("check_started", name=name, category=category)
+
+    def check_finished(self, result: dict):
+        self.emit("check_finished", name=result["name"], category=result.get("category"),
+                  status=check_status(result), cached=bool(result.get("cached")), exit_code=result.get("exit_code"),
+                  duration=round(result.get("duration") or 0, 3), cpu_time=_rounded(result.get("cpu_time")),
+                  max_rss=_rounded(result.get("max_rss")), findings=count_findings(result.get("output")))
+
+    def run_finished(self, results: List[dict], duration: float):
+        statuses = Counter(check_status(result) for result in results)
+        slowest = max(results, key=lambda result: result.get("duration") or 0, default=None)
+        self.emit("run_finished", duration=round(duration, 3), passed=statuses["passed"],
+                  failed=statuses["failed"] + statuses["timeout"], skipped=len(results) - statuses["passed"]
+                  - statuses["failed"] - statuses["timeout"], slowest=slowest and slowest["name"])
+
+    def close(self):
+        self.file.close()
+
+
+def run_checks(checks: List[dict], project_path: str, url: Optional[str] = None, jobs: Optional[int] = None,
+               timeout: int = 600, stop_on_fail: bool = False, limits: Optional[Dict[str, int]] = None,
+               cache: Optional[ResultCache] = None, snapshot: Optional[FileSnapshot] = None,
+               on_start: Optional[Callable] = None, on_finish: Optional[Callable] = None,
+               on_output: Optional[Callable] = None) -> List[dict]:
+    """
+    Run checks concurrently and return their results in input order.
+
+    checks: dicts with "name", "script" (Path) and "required", plus optional
+    "resource" (class, default "cpu") and "depends" (names of checks that must
+    pass first; names not in this run are ignored). Any other keys (e.g.
+    "category") are copied into the result. limits overrides default_limits()
+    per class. With a cache, checks whose inputs are unchanged finish at once
+    with their cached result ("cached": True). With a snapshot, scanners in
+    IN_PROCESS_SCRIPTS run on threads of this process. Threads cannot be
+    killed: one past the timeout is reported as timed out and left running
+    (its late output is ignored), and stop_on_fail lets them finish. on_start(check),
+    on_output(check, line, stream) and on_finish(check, result) are called
+    from this thread as checks start, print and end.
+
+    Results have the keys of verify_all.run_script(): name, passed, output,
+    error, skipped, duration, exit_code (None if the check did not run),
+    cpu_time and max_rss (MB; None when not measured). Checks that never ran are skipped, with
+    "cancelled" (stop_on_fail) or "blocked" (a dependency failed) set.
+    """
+    jobs = max(1, jobs or default_jobs())
+    limits = {**default_limits(), **(limits or {})}
+    results = [None] * len(checks)
+    pending = sorted(range(len(checks)), key=lambda i: not checks[i].get("required"))  # stable
+    running = {}  # index -> (Popen or None if in-process, start time, cache key)
+    active = Counter()  # resource class -> running checks
+    by_name = {check["name"]: index for index, check in enumerate(checks)}
+    done = queue.Queue()
+    abandoned = set()  # in-process checks reported as timed out while their thread runs on
+    stopped_by = None
+
+    def finish(index, **fields):
+        check = checks[index]
+        result = {key: value for key, value in check.items() if key not in ("script", "required", "depends")}
+        result.update({"passed": False, "output": "", "error": "", "skipped": False, "duration": 0, "exit_code": None,
+                       "cpu_time": None, "max_rss": None}, **fields)
+        results[index] = result
+        if on_finish:
+            on_finish(check, result)
+        return result
+
+    def failed(index, result):
+        return checks[index].get("required") and not result["passed"] and not result["skipped"]
+
+    def dependency_state(check):
+        """("ready" | "waiting" | "blocked", failed dependency)"""
+        depends = [name for name in check.get("depends", ()) if name in by_name]
+        if any(results[by_name[name]] is None for name in depends):
+            return "waiting", None
+        dependency = failed_dependency(depends, {name: results[by_name[name]] for name in depends})
+        return ("blocked", dependency) if dependency else ("ready", None)
+
+    def stop(name):
+        """stop_on_fail: a required check failed - kill the running checks (their results come back cancelled)"""
+        nonlocal stopped_by
+        stopped_by = name
+        for proc, _, _ in running.values():
+            if proc is not None:
+                _kill(proc)
+
+    def start(index):
+        """Launch one check (or finish it at once: missing script, spawn error)"""
+        check = checks[index]
+        script = Path(check["script"])
+        if not (script.exists() and script.is_file()):
+            finish(index, passed=True, skipped=True)
+            return
+        cmd = check_command(script, project_path, url)
+        key = cache.key(script, cmd) if cache else None
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            if failed(index, finish(index, **cached)) and stop_on_fail:
+                stop(check["name"])
+            return
+        if on_start:
+            on_start(check)
+        if runs_in_process(script, snapshot):
+            running[index] = (None, time.monotonic(), key)
+            active[check.get("resource", "cpu")] += 1
+            threading.Thread(target=_run_in_process, args=(index, script, cmd, snapshot, done), daemon=True).start()
+            return
+        try:
+            proc = _spawn(cmd)
+        except OSError as e:
+            if failed(index, finish(index, error=str(e))) and stop_on_fail:
+                stop(check["name"])
+            return
+        running[index] = (proc, time.monotonic(), key)
+        active[check.get("resource", "cpu")] += 1
+        threading.Thread(target=_wait, args=(index, proc, timeout, done), daemon=True).start()
+
+    while pending or running:
+        # Start ready checks (in priority order) until no class or worker slot is free
+        scheduled = True
+        while scheduled and stopped_by is None and len(running) < jobs:
+            scheduled = False
+            for index in pending:
+                state, dependency = dependency_state(checks[index])
+                resource = checks[index].get("resource", "cpu")
+                if state == "blocked":
+                    finish(index, passed=True, skipped=True, blocked=True, error=f"Blocked: {dependency} failed")
+                elif state == "waiting" or active[resource] >= limits.get(resource, jobs):
+                    continue
+                else:
+                    start(index)
+                pending.remove(index)
+                scheduled = True
+                break
+
+        if not running:
+            break  # anything still pending waits on a dependency cycle
+
+        # Subprocesses time out in _wait; in-process checks only by no longer being waited for
+        deadlines = [started + timeout for proc, started, _ in running.values() if proc is None and timeout is not None]
+        try:
+            message = done.get(timeout=max(0, min(deadlines) - time.monotonic()) if deadlines else None)
+        except queue.Empty:
+            now = time.monotonic()
+            expired = [index for index, (proc, started, _) in running.items() if proc is None and now - started >= timeout]
+            if not expired:
+                continue
+            message = ("done", expired[0], None, "", "", True, None, None)
+            abandoned.add(expired[0])
+        else:
+            if message[1] in abandoned:
+                continue
+        if message[0] == "line":
+            _, index, line, stream = message
+            if on_output:
+                on_output(checks[index], line, stream)
+            continue
+        _, index, returncode, stdout, stderr, timed_out, cpu_time, max_rss = message
+        _, started, key = running.pop(index)
+        active[checks[index].get("resource", "cpu")] -= 1
+        duration = time.monotonic() - started
+        if stopped_by is not None:
+            finish(index, passed=True, skipped=True, cancelled=True, duration=duration,
+                   error=f"Cancelled: {stopped_by} failed")
+            continue
+        if timed_out:
+            result = finish(index, duration=duration, error="Timeout", cpu_time=cpu_time, max_rss=max_rss)
+        else:
+            result = finish(index, passed=returncode == 0, output=stdout, error=stderr, duration=duration,
+                            exit_code=returncode, cpu_time=cpu_time, max_rss=max_rss)
+            if cache:
+                cache.put(key, Path(checks[index]["script"]), result)
+
+        if stop_on_fail and failed(index, result):
+            stop(checks[index]["name"])
+
+    for index in pending:
+        if stopped_by is not None:
+            finish(index, passed=True, skipped=True, cancelled=True, error=f"Cancelled: {stopped_by} failed")
+        else:
+            finish(index, passed=False, error="Dependency cycle: " + ", ".join(checks[index].get("depends", ())))
+    return results
+
+
+# ============ TERMINAL REPORTING ============
+# Shared by checklist.py and verify_all.py (each keeps its own print_header)
+class Colors:
+    HEADER = '\033[95m'
+    BLUE = '\033[94m'
+    CYAN = '\033[96m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    ENDC = '\033[0m'
+    BOLD = '\033[1m'
+
+
+def print_step(text: str):
+    print(f"{Colors.BOLD}{Colors.BLUE}🔄 {text}{Colors.ENDC}")
+
+
+def print_success(text: str):
+    print(f"{Colors.GREEN}✅ {text}{Colors.ENDC}")
+
+
+def print_warning(text: str):
+    print(f"{Colors.YELLOW}⚠️  {text}{Colors.ENDC}")
+
+
+def print_error(text: str):
+    print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
+
+
+def print_output(name: str, line: str, stream: str = "stdout"):
+    """One line of a running check's output, prefixed with the check's name"""
+    color = Colors.RED if stream == "stderr" else ""
+    print(f"{Colors.CYAN}[{name}]{Colors.ENDC} {color}{line.rstrip()}{Colors.ENDC if color else ''}")
+
+
+def print_finished(check: dict, result: dict):
+    """Per-check status line for --jobs mode (checks finish in any order)"""
+    name = result["name"]
+    if result.get("cancelled"):
+        print_warning(f"{name}: cancelled")
+    elif result.get("blocked"):
+        print_warning(f"{name}: skipped - {result['error']}")
+    elif result.get("skipped"):
+        print_warning(f"{name}: Script not found, skipping")
+    elif result.get("cached") and result["passed"]:
+        print_success(f"{name}: PASSED (cached)")
+    elif result.get("cached"):
+        print_error(f"{name}: FAILED (cached)")
+    elif result["passed"]:
+        print_success(f"{name}: PASSED ({result['duration']:.1f}s)")
+    elif result.get("error") == "Timeout":
+        print_error(f"{name}: TIMEOUT (>{result['duration']:.0f}s)")
+    else:
+        print_error(f"{name}: FAILED ({result['duration']:.1f}s)")
+        if result.get("error"):
+            print(f"  Error: {result['error'][:300]}")
+
+
+def progress_callbacks(events: Optional[EventLog], stream: bool = True) -> dict:
+    """run_checks() callbacks: status lines, prefixed live output, progress events"""
+    def started(check):
+        print_step(f"Running: {check['name']}")
+        if events:
+            events.check_started(check["name"])
+
+    def finished(check, result):
+        print_finished(check, result)
+        if events:
+            events.check_finished(result)
+
+    def output(check, line, stream_name):
+        print_output(check["name"], line, stream_name)
+
+    return {"on_start": started, "on_finish": finished, "on_output": output if stream else None}
+
+
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None, timeout: int = 600,
+               cache: Optional[ResultCache] = None, snapshot: Optional[FileSnapshot] = None,
+               events: Optional[EventLog] = None, stream: bool = True, blocked_by: Optional[str] = None) -> dict:
+    """
+    Run one validation script for a sequential run: reuse its cached result,
+    or run it (in-process with a snapshot), echoing its output line by line
+    unless stream is False. blocked_by names a failed dependency (see
+    failed_dependency()): the check is then skipped as blocked, as
+    run_checks() does.
+
+    Returns the result dict of run_checks() (without category).
+    """
+    if blocked_by:
+        print_warning(f"{name}: skipped - Blocked: {blocked_by} failed")
+        return {"name": name, "passed": True, "output": "", "error": f"Blocked: {blocked_by} failed", "skipped": True,
+                "blocked": True, "duration": 0}
+
+    if not (script_path.exists() and script_path.is_file()):
+        print_warning(f"{name}: Script not found, skipping")
+        return {"name": name, "passed": True, "output": "", "skipped": True, "duration": 0}
+
+    cmd = check_command(script_path, project_path, url)
+
+    # Reuse the last result if the script and the files it reads are unchanged
+    key = cache.key(script_path, cmd) if cache else None
+    cached = cache.get(key) if cache else None
+    if cached is not None:
+        if cached["passed"]:
+            print_success(f"{name}: PASSED (cached)")
+        else:
+            print_error(f"{name}: FAILED (cached)")
+        return {"name": name, **cached, "skipped": False}
+
+    print_step(f"Running: {name}")
+    if events:
+        events.check_started(name)
+    start_time = time.monotonic()
+    on_line = (lambda line, stream_name: print_output(name, line, stream_name)) if stream else None
+
+    try:
+        if runs_in_process(script_path, snapshot):
+            result = run_in_process(script_path, cmd, snapshot, on_line, timeout=timeout)
+        else:
+            result = run_command(cmd, timeout=timeout, on_line=on_line)
+    except subprocess.TimeoutExpired:
+        print_error(f"{name}: TIMEOUT (>{timeout}s)")
+        return {"name": name, "passed": False, "output": "", "error": "Timeout", "skipped": False,
+                "duration": time.monotonic() - start_time}
+    except Exception as e:
+        print_error(f"{name}: ERROR - {str(e)}")
+        return {"name": name, "passed": False, "output": "", "error": str(e), "skipped": False,
+                "duration": time.monotonic() - start_time}
+
+    duration = time.monotonic() - start_time
+    passed = result.returncode == 0
+    if passed:
+        print_success(f"{name}: PASSED ({duration:.1f}s)")
+    else:
+        print_error(f"{name}: FAILED ({duration:.1f}s)")
+        if result.stderr:
+            print(f"  Error: {result.stderr[:300]}")
+
+    outcome = {"name": name, "passed": passed, "output": result.stdout, "error": result.stderr, "skipped": False,
+               "duration": duration, "exit_code": result.returncode, "cpu_time": result.cpu_time,
+               "max_rss": result.max_rss}
+    if cache:
+        cache.put(key, script_path, outcome)
+    return outcome
+
+
+def print_trends(trends: Optional[List[dict]]):
+    """Each check's timing against the median of its previous runs; flags regressions"""
+    if not trends:
+        return
+    print(f"{Colors.BOLD}⏱️  Timing (vs. median of previous runs):{Colors.ENDC}")
+    for t in trends:
+        line = f"  {t['name']:<22} {t['duration']:6.1f}s"
+        line += f"  median {t['median']:.1f}s ({t['ratio']:.1f}x)" if t["ratio"] is not None else "  (no history yet)"
+        if t["cpu_time"] is not None:
+            line += f"  cpu {t['cpu_time']:.1f}s"
+        if t["max_rss"] is not None:
+            line += f"  rss {t['max_rss']:.0f} MB"
+        if t["regressed"]:
+            print(f"{Colors.RED}{line}  ⚠️  REGRESSION{Colors.ENDC}")
+        else:
+            print(line)
+    regressed = [t["name"] for t in trends if t["regressed"]]
+    if regressed:
+        print_warning(f"Much slower than usual (>{REGRESSION_FACTOR:.0f}x median): {', '.join(regressed)}")
+    print()
+
+
+def record_history(history: Optional[TimingHistory], runner: str, results: List[dict]) -> Optional[List[dict]]:
+    """Store this run's timings and close the history; returns their trends for the report"""
+    if not history:
+        return None
+    trends = history.record(runner, results)
+    history.close()
+    return trends
+
+
+def finish_events(events: Optional[EventLog], results: List[dict], duration: float):
+    """Write run_finished and close the event log"""
+    if events:
+        events.run_finished(results, duration)
+        events.close()
@@ -9,6 +9,7 @@ Use this for incremental validation during development.
 Usage:
     python scripts/checklist.py .                    # Run core checks
     python scripts/checklist.py . --url <URL>        # Include performance checks
+    python scripts/checklist.py . --jobs 4           # Run checks in parallel
 
 Priority Order:
     P0: Security Scan (vulnerabilities, secrets)
@@ -21,112 +22,129 @@ Priority Order:
 """
 
 import sys
-import subprocess
 import argparse
+import time
 from pathlib import Path
 from typing import List, Tuple, Optional
 
-# ANSI colors for terminal output
-class Colors:
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
+from check_runner import (CACHE_FILE, FINGERPRINT_SKIP_DIRS, Colors, EventLog, ResultCache, TimingHistory, check_affected,
+                          default_jobs, failed_dependency, finish_events, parse_limit, print_error, print_step, print_success,
+                          print_trends, print_warning, progress_callbacks, record_history, run_checks, run_script)
+from file_snapshot import FileSnapshot
+from file_watcher import FileWatcher
 
 def print_header(text: str):
     print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.ENDC}")
     print(f"{Colors.BOLD}{Colors.CYAN}{text.center(60)}{Colors.ENDC}")
     print(f"{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.ENDC}\n")
 
-def print_step(text: str):
-    print(f"{Colors.BOLD}{Colors.BLUE}🔄 {text}{Colors.ENDC}")
-
-def print_success(text: str):
-    print(f"{Colors.GREEN}✅ {text}{Colors.ENDC}")
-
-def print_warning(text: str):
-    print(f"{Colors.YELLOW}⚠️  {text}{Colors.ENDC}")
-
-def print_error(text: str):
-    print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
-
 # Define priority-ordered checks
+# Each check: (name, script, required, resource class, depends on) - see check_runner.py
 CORE_CHECKS = [
-    ("Security Scan", ".agent/skills/vulnerability-scanner/scripts/security_scan.py", True),
-    ("Lint Check", ".agent/skills/lint-and-validate/scripts/lint_runner.py", True),
-    ("Schema Validation", ".agent/skills/database-design/scripts/schema_validator.py", False),
-    ("Test Runner", ".agent/skills/testing-patterns/scripts/test_runner.py", False),
-    ("UX Audit", ".agent/skills/frontend-design/scripts/ux_audit.py", False),
-    ("SEO Check", ".agent/skills/seo-fundamentals/scripts/seo_checker.py", False),
+    ("Security Scan", ".agent/skills/vulnerability-scanner/scripts/security_scan.py", True, "external-tool", []),
+    ("Lint Check", ".agent/skills/lint-and-validate/scripts/lint_runner.py", True, "external-tool", []),
+    ("Schema Validation", ".agent/skills/database-design/scripts/schema_validator.py", False, "cpu", []),
+    ("Test Runner", ".agent/skills/testing-patterns/scripts/test_runner.py", False, "external-tool", []),
+    ("UX Audit", ".agent/skills/frontend-design/scripts/ux_audit.py", False, "cpu", []),
+    ("SEO Check", ".agent/skills/seo-fundamentals/scripts/seo_checker.py", False, "cpu", []),
 ]
 
 PERFORMANCE_CHECKS = [
-    ("Lighthouse Audit", ".agent/skills/performance-profiling/scripts/lighthouse_audit.py", True),
-    ("Playwright E2E", ".agent/skills/webapp-testing/scripts/playwright_runner.py", False),
+    ("Lighthouse Audit", ".agent/skills/performance-profiling/scripts/lighthouse_audit.py", True, "browser", []),
+    ("Playwright E2E", ".agent/skills/webapp-testing/scripts/playwright_runner.py", False, "browser", []),
 ]
 
-def check_script_exists(script_path: Path) -> bool:
-    """Check if script file exists"""
-    return script_path.exists() and script_path.is_file()
+# --watch ignores these (besides .agent/.cache): tool output would re-trigger the checks that wrote it
+WATCH_SKIP_DIRS = FINGERPRINT_SKIP_DIRS | {"coverage", ".pytest_cache", ".mypy_cache", "test-results", "playwright-report"}
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
+def build_checks(project_path: Path, url: Optional[str]) -> List[dict]:
+    """check_runner check dicts for the core (and, with a URL, performance) checks"""
+    checks = [{"name": name, "script": project_path / script_path, "required": required,
+               "resource": resource, "depends": depends}
+              for name, script_path, required, resource, depends in CORE_CHECKS]
+    if url:
+        checks += [{"name": name, "script": project_path / script_path, "required": False,
+                    "resource": resource, "depends": depends}
+                   for name, script_path, _, resource, depends in PERFORMANCE_CHECKS]
+    return checks
+
+def run_parallel(project_path: Path, url: Optional[str], jobs: int, limits: Optional[dict] = None,
+                 cache: Optional[ResultCache] = None, snapshot: Optional[FileSnapshot] = None,
+                 events: Optional[EventLog] = None, stream: bool = True) -> List[dict]:
     """
-    Run a validation script and capture results
+    Run core (and performance) checks concurrently.
     
-    Returns:
-        dict with keys: name, passed, output, skipped
+    A failing required core check still stops the checklist: checks still
+    running are killed and the rest are cancelled. Performance checks never stop it.
     """
-    if not check_script_exists(script_path):
-        print_warning(f"{name}: Script not found, skipping")
-        return {"name": name, "passed": True, "output": "", "skipped": True}
-    
-    print_step(f"Running: {name}")
+    checks = build_checks(project_path, url)
+    print_header(f"📋 {len(checks)} CHECKS ON {jobs} WORKERS")
+    results = run_checks(checks, str(project_path), url, jobs=jobs, timeout=300, stop_on_fail=True, limits=limits, cache=cache,
+                         snapshot=snapshot, **progress_callbacks(events, stream))
     
-    # Build command
-    cmd = ["python", str(script_path), project_path]
-    if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
-        cmd.append(url)
+    for check, result in zip(checks, results):
+        if check["required"] and not result["passed"] and not result.get("skipped"):
+            print_error(f"CRITICAL: {check['name']} failed. Stopping checklist.")
+            break
+    return results
+
+def run_watch(project_path: Path, url: Optional[str], args) -> bool:
+    """
+    --watch: run every check, then after each (debounced) burst of file
+    changes re-run only the checks that read a changed file type (see
+    check_runner.CHECK_INPUTS). Untouched checks keep their last result in
+    memory. Failures don't end the loop - Ctrl+C does.
     
-    # Run script
+    Returns whether the last results all passed.
+    """
+    checks = build_checks(project_path, url)
+    last = {}  # check name -> latest result
+    all_passed = True
+    events = EventLog(args.events) if args.events else None
+    skip_paths = [project_path / CACHE_FILE.parent] + ([args.events] if args.events else [])
+    watcher = FileWatcher(project_path, skip_dirs=WATCH_SKIP_DIRS, skip_paths=skip_paths)
+    affected = checks
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
-        
-        passed = result.returncode == 0
-        
-        if passed:
-            print_success(f"{name}: PASSED")
-        else:
-            print_error(f"{name}: FAILED")
-            if result.stderr:
-                print(f"  Error: {result.stderr[:200]}")
-        
-        return {
-            "name": name,
-            "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
-            "skipped": False
-        }
-    
-    except subprocess.TimeoutExpired:
-        print_error(f"{name}: TIMEOUT (>5 minutes)")
-        return {"name": name, "passed": False, "output": "", "error": "Timeout", "skipped": False}
-    
-    except Exception as e:
-        print_error(f"{name}: ERROR - {str(e)}")
-        return {"name": name, "passed": False, "output": "", "error": str(e), "skipped": False}
+        while True:
+            if affected:
+                snapshot = FileSnapshot(project_path) if args.in_process else None
+                cache = None if args.no_cache else ResultCache(project_path, snapshot=snapshot)
+                history = None if args.no_history else TimingHistory(project_path)
+                start_time = time.monotonic()
+                if events:
+                    events.run_started(project_path, len(affected), args.jobs)
+                print_header(f"🔁 {len(affected)} OF {len(checks)} CHECKS")
+                results = run_checks(affected, str(project_path), url, jobs=args.jobs, timeout=300, limits=dict(args.limit),
+                                     cache=cache, snapshot=snapshot, **progress_callbacks(events, not args.no_stream))
+                if cache:
+                    cache.close()
+                last.update((result["name"], result) for result in results)
+                all_passed = print_summary([last[check["name"]] for check in checks],
+                                           record_history(history, "checklist", results))
+                if events:
+                    events.run_finished(results, time.monotonic() - start_time)
+            
+            print_step(f"Watching {project_path} for changes ({watcher.name}) - Ctrl+C to stop")
+            changed = watcher.changes()
+            if changed is None:
+                print_warning("Lost track of file changes - re-running every check")
+                affected = checks
+                continue
+            shown = ", ".join(sorted(changed)[:5]) + (f" (+{len(changed) - 5} more)" if len(changed) > 5 else "")
+            print(f"\nChanged: {shown}")
+            affected = [check for check in checks if check_affected(check["script"], changed, project_path)]
+            if not affected:
+                print_warning("No check reads these files - nothing to re-run")
+    except KeyboardInterrupt:
+        print()
+    finally:
+        watcher.close()
+        if events:
+            events.close()
+    return all_passed
 
-def print_summary(results: List[dict]):
-    """Print final summary report"""
+def print_summary(results: List[dict], trends: Optional[List[dict]] = None):
+    """Print final summary report (with timing trends from the history)"""
     print_header("📊 CHECKLIST SUMMARY")
     
     passed_count = sum(1 for r in results if r["passed"] and not r.get("skipped"))
@@ -151,6 +169,7 @@ def print_summary(results: List[dict]):
         print(f"{status} {r['name']}")
     
     print()
+    print_trends(trends)
     
     if failed_count > 0:
         print_error(f"{failed_count} check(s) FAILED - Please fix before proceeding")
@@ -172,8 +191,23 @@ Examples:
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", help="URL for performance checks (lighthouse, playwright)")
     parser.add_argument("--skip-performance", action="store_true", help="Skip performance checks even if URL provided")
+    parser.add_argument("--jobs", "-j", type=int, nargs="?", const=default_jobs(), default=1,
+                        help="Run up to N checks in parallel (default: 1; -j alone: one per CPU)")
+    parser.add_argument("--limit", type=parse_limit, action="append", default=[], metavar="CLASS=N",
+                        help="Max concurrent checks of a resource class with --jobs (cpu, io, browser, external-tool)")
+    parser.add_argument("--no-cache", action="store_true", help="Re-run every check instead of reusing cached results")
+    parser.add_argument("--in-process", action="store_true",
+                        help="Run the built-in scanners in this interpreter over one shared read of the project tree "
+                             "(a scanner past the timeout is reported as timed out but cannot be killed)")
+    parser.add_argument("--no-stream", action="store_true", help="Don't echo each check's output as it runs")
+    parser.add_argument("--no-history", action="store_true", help="Don't record check timings in .agent/.cache/history.sqlite")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running: re-run the checks affected by each change to the project (Ctrl+C to stop)")
+    parser.add_argument("--events", metavar="FILE",
+                        help="Write NDJSON progress events (check started/finished, duration, exit code, findings) to FILE")
     
     args = parser.parse_args()
+    sys.stdout.reconfigure(line_buffering=True)  # live progress when piped (CI logs)
     
     project_path = Path(args.project).resolve()
     
@@ -185,31 +219,58 @@ Examples:
     print(f"Project: {project_path}")
     print(f"URL: {args.url if args.url else 'Not provided (performance checks skipped)'}")
     
+    run_performance = bool(args.url) and not args.skip_performance
+    if args.watch:
+        all_passed = run_watch(project_path, args.url if run_performance else None, args)
+        sys.exit(0 if all_passed else 1)
+    
     results = []
+    snapshot = FileSnapshot(project_path) if args.in_process else None
+    events = EventLog(args.events) if args.events else None
+    history = None if args.no_history else TimingHistory(project_path)
+    start_time = time.monotonic()
+    if events:
+        events.run_started(project_path, len(CORE_CHECKS) + (len(PERFORMANCE_CHECKS) if run_performance else 0), args.jobs)
+    cache = None if args.no_cache else ResultCache(project_path, snapshot=snapshot)
+    
+    if args.jobs > 1:
+        url = args.url if run_performance else None
+        results = run_parallel(project_path, url, args.jobs, dict(args.limit), cache, snapshot, events, not args.no_stream)
+        all_passed = print_summary(results, record_history(history, "checklist", results))
+        finish_events(events, results, time.monotonic() - start_time)
+        sys.exit(0 if all_passed else 1)
     
     # Run core checks
     print_header("📋 CORE CHECKS")
-    for name, script_path, required in CORE_CHECKS:
+    for name, script_path, required, _, depends in CORE_CHECKS:
         script = project_path / script_path
-        result = run_script(name, script, str(project_path))
+        result = run_script(name, script, str(project_path), timeout=300, cache=cache, snapshot=snapshot, events=events,
+                            stream=not args.no_stream, blocked_by=failed_dependency(depends, {r["name"]: r for r in results}))
         results.append(result)
+        if events:
+            events.check_finished(result)
         
         # If required check fails, stop
         if required and not result["passed"] and not result.get("skipped"):
             print_error(f"CRITICAL: {name} failed. Stopping checklist.")
-            print_summary(results)
+            print_summary(results, record_history(history, "checklist", results))
+            finish_events(events, results, time.monotonic() - start_time)
             sys.exit(1)
     
     # Run performance checks if URL provided
-    if args.url and not args.skip_performance:
+    if run_performance:
         print_header("⚡ PERFORMANCE CHECKS")
-        for name, script_path, required in PERFORMANCE_CHECKS:
+        for name, script_path, required, _, depends in PERFORMANCE_CHECKS:
             script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
+            result = run_script(name, script, str(project_path), args.url, 300, cache, snapshot, events, not args.no_stream,
+                                blocked_by=failed_dependency(depends, {r["name"]: r for r in results}))
             results.append(result)
+            if events:
+                events.check_finished(result)
     
     # Print summary
-    all_passed = print_summary(results)
+    all_passed = print_summary(results, record_history(history, "checklist", results))
+    finish_events(events, results, time.monotonic() - start_time)
     
     sys.exit(0 if all_passed else 1)
 
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+File Snapshot - Antigravity Kit
+===============================
+
+One shared, lazily filled view of a project tree for in-process checks.
+
+Every directory is listed at most once and every file read from disk at
+most once per run, however many scanners walk, glob or read it. Listings
+keep os.scandir() order, so walk() and glob() yield paths in the same
+order as os.walk() and Path.glob(), and the scanners produce the same
+reports as when they run as separate processes.
+
+Scanners accept it duck-typed (they must still run standalone):
+    snapshot.walk(top)               -> like os.walk(top)
+    snapshot.glob(base, pattern)     -> like Path(base).glob(pattern)
+    snapshot.rglob(base, pattern)    -> like Path(base).rglob(pattern)
+    snapshot.open(path, errors=...)  -> like open(path, 'r', encoding='utf-8', errors=...)
+    snapshot.read_text(path, errors=...)
+"""
+
+import io
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+
+def _glob_regex(pattern: str):
+    """Compile a Path.glob() pattern ('**' = any number of directories) for relative posix paths"""
+    regex = ""
+    segments = pattern.split("/")
+    for i, segment in enumerate(segments):
+        if segment == "**":
+            regex += "(?:[^/]+/)*"
+            continue
+        for char in segment:
+            regex += {"*": "[^/]*", "?": "[^/]"}.get(char) or re.escape(char)
+        if i < len(segments) - 1:
+            regex += "/"
+    return re.compile(regex, re.DOTALL)
+
+
+class FileSnapshot:
+    """Directory listings and file contents of one project, read from disk at most once"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self._listings = {}  # directory -> [os.DirEntry] in scandir order, or None if unreadable
+        self._contents = {}  # normalized path -> bytes
+        self._lock = threading.Lock()
+        self.stats = {"listed": 0, "read": 0, "hits": 0}
+
+    # ------------------------------------------------------------------ tree
+    def _listing(self, directory: str) -> Optional[List[os.DirEntry]]:
+        key = os.path.normpath(directory)
+        if key not in self._listings:
+            try:
+                with os.scandir(directory) as entries:
+                    listing = list(entries)
+            except OSError:
+                listing = None
+            with self._lock:
+                self._listings.setdefault(key, listing)
+                self.stats["listed"] += 1
+        return self._listings[key]
+
+    def walk(self, top) -> Iterator[Tuple[str, List[str], List[str]]]:
+        """os.walk(top) (topdown, no symlinked directories) from cached listings; prune via dirs[:]"""
+        top = os.fspath(top)
+        listing = self._listing(top)
+        if listing is None:
+            return
+        dirs, files, links = [], [], set()
+        for entry in listing:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                dirs.append(entry.name)
+                if entry.is_symlink():
+                    links.add(entry.name)
+            else:
+                files.append(entry.name)
+        yield top, dirs, files
+        for name in dirs:
+            if name not in links:
+                yield from self.walk(os.path.join(top, name))
+
+    def glob(self, base, pattern: str) -> Iterator[Path]:
+        """Path(base).glob(pattern): matching files and directories, in walk order"""
+        base = Path(base)
+        regex = _glob_regex(pattern)
+        for root, dirs, files in self.walk(base):
+            rel_root = Path(root).relative_to(base).as_posix()
+            prefix = "" if rel_root == "." else rel_root + "/"
+            for entry in self._listing(root):
+                if regex.fullmatch(prefix + entry.name):
+                    yield Path(root) / entry.name
+
+    def rglob(self, base, pattern: str) -> Iterator[Path]:
+        """Path(base).rglob(pattern)"""
+        return self.glob(base, "**/" + pattern)
+
+    def stat(self, path) -> os.stat_result:
+        """stat() of a listed file (cached by its directory entry)"""
+        path = os.fspath(path)
+        for entry in self._listing(os.path.dirname(path)) or ():
+            if entry.name == os.path.basename(path):
+                return entry.stat()
+        return os.stat(path)
+
+    # -------------------------------------------------------------- contents
+    def read_bytes(self, path) -> bytes:
+        key = os.path.normpath(os.fspath(path))
+        data = self._contents.get(key)
+        if data is None:
+            with open(key, "rb") as f:
+                data = f.read()
+            with self._lock:
+                data = self._contents.setdefault(key, data)
+                self.stats["read"] += 1
+        else:
+            self.stats["hits"] += 1
+        return data
+
+    def read_text(self, path, encoding: str = "utf-8", errors: str = "strict") -> str:
+        """Path.read_text(): decoded with universal newlines, like text-mode open()"""
+        text = self.read_bytes(path).decode(encoding, errors)
+        return text.replace("\r\n", "\n").replace("\r", "\n")
+
+    def open(self, path, encoding: str = "utf-8", errors: str = "strict") -> io.StringIO:
+        """open(path, 'r', ...) served from the snapshot (read(), readlines(), iteration)"""
+        return io.StringIO(self.read_text(path, encoding, errors), newline="\n")
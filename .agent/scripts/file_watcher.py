@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+File Watcher - Antigravity Kit
+==============================
+
+Blocks until files of a project change, for checklist.py --watch.
+
+Uses inotify on Linux (through ctypes, no dependencies): one watch per
+directory, added as directories appear. Elsewhere, or when inotify is
+unavailable (e.g. the watch limit is reached), it falls back to polling
+file sizes and mtimes once per second. Bursts of events (an editor
+saving several files, a git checkout) are debounced into one set of
+changed paths.
+
+Usage:
+    watcher = FileWatcher(project_path, skip_dirs={"node_modules", ".git"})
+    while True:
+        changed = watcher.changes()  # {"src/app.tsx", ...} or None (unknown: rescan all)
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set
+
+DEBOUNCE = 0.3  # seconds without new events that end a burst
+POLL_INTERVAL = 1.0  # seconds between scans of the polling fallback
+
+# Editor swap/backup files never affect a check
+IGNORED_SUFFIXES = {".swp", ".swx", ".tmp"}
+
+# inotify(7)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def _ignored(name: str) -> bool:
+    return name.endswith("~") or name.startswith(".#") or Path(name).suffix in IGNORED_SUFFIXES
+
+
+class _InotifyBackend:
+    """Linux inotify: one watch per directory below root"""
+
+    name = "inotify"
+
+    def __init__(self, root: Path, skip):
+        self.root = root
+        self.skip = skip
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs = {}  # watch descriptor -> directory
+        try:
+            self._watch_tree(root)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch_tree(self, top: Path) -> Set[str]:
+        """Watch top and its subdirectories; returns the files already in them"""
+        found = set()
+        for root, dirs, files in os.walk(top):
+            dirs[:] = [d for d in dirs if not self.skip(Path(root, d))]
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(root), WATCH_MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {root}")
+            self.dirs[wd] = Path(root)
+            found.update(self._rel(Path(root, name)) for name in files if not _ignored(name))
+        return found
+
+    def _rel(self, path: Path) -> str:
+        return path.relative_to(self.root).as_posix()
+
+    def poll(self, timeout: Optional[float]) -> Optional[Set[str]]:
+        """Changed paths seen within timeout (None: events were lost)"""
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return set()
+        data = os.read(self.fd, 64 * 1024)
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            name = data[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b"\0")
+            offset += EVENT_HEADER.size + length
+            if mask & IN_Q_OVERFLOW:
+                return None
+            if mask & IN_IGNORED:
+                self.dirs.pop(wd, None)
+                continue
+            directory = self.dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if self.skip(path) or _ignored(path.name):
+                continue
+            if mask & IN_ISDIR:
+                if mask & IN_MOVED_FROM:
+                    return None  # a whole subtree left without per-file events
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    try:
+                        changed |= self._watch_tree(path)  # files may land before the watch does
+                    except OSError:
+                        return None
+                continue
+            changed.add(self._rel(path))
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class _PollingBackend:
+    """Portable fallback: compare (size, mtime) of every file every POLL_INTERVAL"""
+
+    name = "polling"
+
+    def __init__(self, root: Path, skip):
+        self.root = root
+        self.skip = skip
+        self.state = self._scan()
+
+    def _scan(self) -> Dict[str, tuple]:
+        state = {}
+        for root, dirs, files in os.walk(self.root):
+            dirs[:] = [d for d in dirs if not self.skip(Path(root, d))]
+            for name in files:
+                if _ignored(name):
+                    continue
+                path = Path(root, name)
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                state[path.relative_to(self.root).as_posix()] = (st.st_size, st.st_mtime_ns)
+        return state
+
+    def poll(self, timeout: Optional[float]) -> Optional[Set[str]]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            state = self._scan()
+            changed = {path for path in state.keys() | self.state.keys() if state.get(path) != self.state.get(path)}
+            self.state = state
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+            time.sleep(POLL_INTERVAL if deadline is None else max(0, min(POLL_INTERVAL, deadline - time.monotonic())))
+
+    def close(self):
+        pass
+
+
+class FileWatcher:
+    """Debounced change notifications for a project tree"""
+
+    def __init__(self, root, skip_dirs: Iterable[str] = (), skip_paths: Iterable = (), polling: bool = False):
+        self.root = Path(root).resolve()
+        skip_dirs = set(skip_dirs)
+        skip_paths = {Path(path).resolve() for path in skip_paths}
+
+        def skip(path: Path) -> bool:
+            return path.name in skip_dirs or path in skip_paths or any(parent in skip_paths for parent in path.parents)
+
+        self.backend = None
+        if not polling and hasattr(os, "O_CLOEXEC"):
+            try:
+                self.backend = _InotifyBackend(self.root, skip)
+            except (OSError, AttributeError):  # not Linux, or out of inotify watches
+                self.backend = None
+        if self.backend is None:
+            self.backend = _PollingBackend(self.root, skip)
+
+    @property
+    def name(self) -> str:
+        return self.backend.name
+
+    def changes(self, debounce: float = DEBOUNCE) -> Optional[Set[str]]:
+        """Block until files change; relative paths changed in the burst, or None if unknown (rescan all)"""
+        changed = set()
+        while not changed:
+            changed = self.backend.poll(None)
+            if changed is None:
+                return None
+        while True:
+            more = self.backend.poll(debounce)
+            if more is None:
+                return None
+            if not more:
+                return changed
+            changed |= more
+
+    def close(self):
+        self.backend.close()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for check_runner.run_checks()
+
+Run: python -m unittest discover -s .agent/scripts/tests
+"""
+
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from check_runner import ResultCache, run_checks, run_script  # noqa: E402
+from file_snapshot import FileSnapshot  # noqa: E402
+
+
+class StopOnFailTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.project = Path(self.tmp.name)
+        scripts = self.project / "scripts"
+        scripts.mkdir()
+        self.slow = scripts / "slow_check.py"
+        self.slow.write_text("import time\ntime.sleep(8)\n")
+        # Named like a cacheable scanner (CHECK_INPUTS) so its result is cached
+        self.failing = scripts / "ux_audit.py"
+        self.failing.write_text("import sys\nprint('ISSUES (1)')\nsys.exit(1)\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_checks(self, checks, cache):
+        return run_checks(checks, str(self.project), jobs=2, stop_on_fail=True, cache=cache,
+                          limits={"cpu": 1, "io": 1})
+
+    def test_cached_failure_cancels_running_checks(self):
+        failing = {"name": "UX Audit", "script": self.failing, "required": True, "resource": "cpu"}
+        cache = ResultCache(self.project)
+        try:
+            first = self.run_checks([failing], cache)
+            self.assertFalse(first[0]["passed"])
+
+            slow = {"name": "Slow Check", "script": self.slow, "required": True, "resource": "io"}
+            started = time.monotonic()
+            results = self.run_checks([slow, failing], cache)
+            elapsed = time.monotonic() - started
+        finally:
+            cache.close()
+
+        slow_result, failing_result = results
+        self.assertTrue(failing_result.get("cached"))
+        self.assertFalse(failing_result["passed"])
+        self.assertTrue(slow_result.get("cancelled"))
+        self.assertEqual(slow_result["error"], "Cancelled: UX Audit failed")
+        self.assertLess(elapsed, 5)
+
+
+class InProcessTimeoutTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.project = Path(self.tmp.name)
+        scripts = self.project / "scripts"
+        scripts.mkdir()
+        # Named like an in-process scanner (IN_PROCESS_SCRIPTS); hangs well past the timeout
+        self.hanging = scripts / "geo_checker.py"
+        self.hanging.write_text("import time\n\ndef main(argv=None, snapshot=None):\n    time.sleep(8)\n    return 0\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_run_checks_reports_timeout(self):
+        check = {"name": "GEO Check", "script": self.hanging, "required": True}
+        started = time.monotonic()
+        result, = run_checks([check], str(self.project), jobs=1, timeout=1, snapshot=FileSnapshot(self.project))
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertFalse(result["passed"])
+        self.assertEqual(result["error"], "Timeout")
+
+    def test_run_script_reports_timeout(self):
+        started = time.monotonic()
+        result = run_script("GEO Check", self.hanging, str(self.project), timeout=1,
+                            snapshot=FileSnapshot(self.project), stream=False)
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertFalse(result["passed"])
+        self.assertEqual(result["error"], "Timeout")
+
+
+if __name__ == "__main__":
+    unittest.main()
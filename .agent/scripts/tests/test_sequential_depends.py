@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Sequential (--jobs 1) and parallel (--jobs N) runs honor "depends" alike
+
+Run: python -m unittest discover -s .agent/scripts/tests
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parent.parent
+LINT = ".agent/skills/lint-and-validate/scripts/lint_runner.py"
+TYPES = ".agent/skills/lint-and-validate/scripts/type_coverage.py"
+
+
+class DependsAgreeTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.project = Path(self.tmp.name)
+        for script in (LINT, TYPES):
+            (self.project / script).parent.mkdir(parents=True, exist_ok=True)
+        (self.project / TYPES).write_text("print('types ok')\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def verdict(self, jobs):
+        """(exit code, {check name: status}) of one verify_all.py run"""
+        events = self.project / f"events-{jobs}.ndjson"
+        proc = subprocess.run(
+            [sys.executable, str(SCRIPTS / "verify_all.py"), str(self.project), "--url", "http://localhost:0",
+             "--jobs", str(jobs), "--no-cache", "--no-history", "--no-stream", "--events", str(events)],
+            capture_output=True, text=True, timeout=120,
+        )
+        statuses = {}
+        for line in events.read_text().splitlines():
+            event = json.loads(line)
+            if event["event"] == "check_finished":
+                statuses[event["name"]] = event["status"]
+        return proc.returncode, statuses
+
+    def test_failed_dependency_blocks_in_both_modes(self):
+        (self.project / LINT).write_text("import sys\nprint('lint failed')\nsys.exit(1)\n")
+        sequential, parallel = self.verdict(1), self.verdict(2)
+        self.assertEqual(sequential, parallel)
+        self.assertEqual(sequential[1]["Lint Check"], "failed")
+        self.assertEqual(sequential[1]["Type Coverage"], "blocked")
+
+    def test_passed_dependency_runs_in_both_modes(self):
+        (self.project / LINT).write_text("print('lint ok')\n")
+        sequential, parallel = self.verdict(1), self.verdict(2)
+        self.assertEqual(sequential, parallel)
+        self.assertEqual(sequential[1]["Type Coverage"], "passed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,7 @@ Use this before deployment or major releases.
 
 Usage:
     python scripts/verify_all.py . --url <URL>
+    python scripts/verify_all.py . --url <URL> --jobs 4   # Run checks in parallel
 
 Includes ALL checks:
     ✅ Security Scan (OWASP, secrets, dependencies)
@@ -23,48 +24,29 @@ Includes ALL checks:
 """
 
 import sys
-import subprocess
 import argparse
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
-# ANSI colors
-class Colors:
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
+from check_runner import (Colors, EventLog, ResultCache, TimingHistory, default_jobs, failed_dependency, finish_events, parse_limit,
+                          print_error, print_success, print_trends, progress_callbacks, record_history, run_checks, run_script)
+from file_snapshot import FileSnapshot
 
 def print_header(text: str):
     print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*70}{Colors.ENDC}")
     print(f"{Colors.BOLD}{Colors.CYAN}{text.center(70)}{Colors.ENDC}")
     print(f"{Colors.BOLD}{Colors.CYAN}{'='*70}{Colors.ENDC}\n")
 
-def print_step(text: str):
-    print(f"{Colors.BOLD}{Colors.BLUE}🔄 {text}{Colors.ENDC}")
-
-def print_success(text: str):
-    print(f"{Colors.GREEN}✅ {text}{Colors.ENDC}")
-
-def print_warning(text: str):
-    print(f"{Colors.YELLOW}⚠️  {text}{Colors.ENDC}")
-
-def print_error(text: str):
-    print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
-
 # Complete verification suite
+# Each check: (name, script, required, resource class, depends on) - see check_runner.py
 VERIFICATION_SUITE = [
     # P0: Security (CRITICAL)
     {
         "category": "Security",
         "checks": [
-            ("Security Scan", ".agent/skills/vulnerability-scanner/scripts/security_scan.py", True),
-            ("Dependency Analysis", ".agent/skills/vulnerability-scanner/scripts/dependency_analyzer.py", False),
+            ("Security Scan", ".agent/skills/vulnerability-scanner/scripts/security_scan.py", True, "external-tool", []),
+            ("Dependency Analysis", ".agent/skills/vulnerability-scanner/scripts/dependency_analyzer.py", False, "io", []),
         ]
     },
     
@@ -72,8 +54,8 @@ VERIFICATION_SUITE = [
     {
         "category": "Code Quality",
         "checks": [
-            ("Lint Check", ".agent/skills/lint-and-validate/scripts/lint_runner.py", True),
-            ("Type Coverage", ".agent/skills/lint-and-validate/scripts/type_coverage.py", False),
+            ("Lint Check", ".agent/skills/lint-and-validate/scripts/lint_runner.py", True, "external-tool", []),
+            ("Type Coverage", ".agent/skills/lint-and-validate/scripts/type_coverage.py", False, "cpu", ["Lint Check"]),
         ]
     },
     
@@ -81,7 +63,7 @@ VERIFICATION_SUITE = [
     {
         "category": "Data Layer",
         "checks": [
-            ("Schema Validation", ".agent/skills/database-design/scripts/schema_validator.py", False),
+            ("Schema Validation", ".agent/skills/database-design/scripts/schema_validator.py", False, "cpu", []),
         ]
     },
     
@@ -89,7 +71,7 @@ VERIFICATION_SUITE = [
     {
         "category": "Testing",
         "checks": [
-            ("Test Suite", ".agent/skills/testing-patterns/scripts/test_runner.py", False),
+            ("Test Suite", ".agent/skills/testing-patterns/scripts/test_runner.py", False, "external-tool", []),
         ]
     },
     
@@ -97,8 +79,8 @@ VERIFICATION_SUITE = [
     {
         "category": "UX & Accessibility",
         "checks": [
-            ("UX Audit", ".agent/skills/frontend-design/scripts/ux_audit.py", False),
-            ("Accessibility Check", ".agent/skills/frontend-design/scripts/accessibility_checker.py", False),
+            ("UX Audit", ".agent/skills/frontend-design/scripts/ux_audit.py", False, "cpu", []),
+            ("Accessibility Check", ".agent/skills/frontend-design/scripts/accessibility_checker.py", False, "cpu", []),
         ]
     },
     
@@ -106,8 +88,8 @@ VERIFICATION_SUITE = [
     {
         "category": "SEO & Content",
         "checks": [
-            ("SEO Check", ".agent/skills/seo-fundamentals/scripts/seo_checker.py", False),
-            ("GEO Check", ".agent/skills/geo-fundamentals/scripts/geo_checker.py", False),
+            ("SEO Check", ".agent/skills/seo-fundamentals/scripts/seo_checker.py", False, "cpu", []),
+            ("GEO Check", ".agent/skills/geo-fundamentals/scripts/geo_checker.py", False, "cpu", []),
         ]
     },
     
@@ -116,8 +98,8 @@ VERIFICATION_SUITE = [
         "category": "Performance",
         "requires_url": True,
         "checks": [
-            ("Lighthouse Audit", ".agent/skills/performance-profiling/scripts/lighthouse_audit.py", True),
-            ("Bundle Analysis", ".agent/skills/performance-profiling/scripts/bundle_analyzer.py", False),
+            ("Lighthouse Audit", ".agent/skills/performance-profiling/scripts/lighthouse_audit.py", True, "browser", []),
+            ("Bundle Analysis", ".agent/skills/performance-profiling/scripts/bundle_analyzer.py", False, "io", []),
         ]
     },
     
@@ -126,7 +108,7 @@ VERIFICATION_SUITE = [
         "category": "E2E Testing",
         "requires_url": True,
         "checks": [
-            ("Playwright E2E", ".agent/skills/webapp-testing/scripts/playwright_runner.py", False),
+            ("Playwright E2E", ".agent/skills/webapp-testing/scripts/playwright_runner.py", False, "browser", []),
         ]
     },
     
@@ -134,7 +116,7 @@ VERIFICATION_SUITE = [
     {
         "category": "Mobile",
         "checks": [
-            ("Mobile Audit", ".agent/skills/mobile-design/scripts/mobile_audit.py", False),
+            ("Mobile Audit", ".agent/skills/mobile-design/scripts/mobile_audit.py", False, "cpu", []),
         ]
     },
     
@@ -142,65 +124,36 @@ VERIFICATION_SUITE = [
     {
         "category": "Internationalization",
         "checks": [
-            ("i18n Check", ".agent/skills/i18n-localization/scripts/i18n_checker.py", False),
+            ("i18n Check", ".agent/skills/i18n-localization/scripts/i18n_checker.py", False, "cpu", []),
         ]
     },
 ]
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
-    """Run validation script"""
-    if not script_path.exists():
-        print_warning(f"{name}: Script not found, skipping")
-        return {"name": name, "passed": True, "skipped": True, "duration": 0}
-    
-    print_step(f"Running: {name}")
-    start_time = datetime.now()
-    
-    # Build command
-    cmd = ["python", str(script_path), project_path]
-    if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
-        cmd.append(url)
-    
-    # Run
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout for slow checks
-        )
-        
-        duration = (datetime.now() - start_time).total_seconds()
-        passed = result.returncode == 0
-        
-        if passed:
-            print_success(f"{name}: PASSED ({duration:.1f}s)")
-        else:
-            print_error(f"{name}: FAILED ({duration:.1f}s)")
-            if result.stderr:
-                print(f"  {result.stderr[:300]}")
-        
-        return {
-            "name": name,
-            "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
-            "skipped": False,
-            "duration": duration
-        }
+def run_parallel(suites: List[dict], project_path: Path, url: Optional[str], jobs: int, stop_on_fail: bool,
+                 limits: Optional[Dict[str, int]] = None, cache: Optional[ResultCache] = None,
+                 snapshot: Optional[FileSnapshot] = None, events: Optional[EventLog] = None,
+                 stream: bool = True) -> List[dict]:
+    """Run every check of the selected suites concurrently (DAG, per-class limits)"""
+    checks = [
+        {"name": name, "script": project_path / script_path, "required": required, "category": suite["category"],
+         "resource": resource, "depends": depends}
+        for suite in suites
+        for name, script_path, required, resource, depends in suite["checks"]
+    ]
     
-    except subprocess.TimeoutExpired:
-        duration = (datetime.now() - start_time).total_seconds()
-        print_error(f"{name}: TIMEOUT (>{duration:.0f}s)")
-        return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": "Timeout"}
+    print_header(f"📋 {len(checks)} CHECKS ON {jobs} WORKERS")
+    results = run_checks(checks, str(project_path), url, jobs=jobs, timeout=600, stop_on_fail=stop_on_fail, limits=limits, cache=cache,
+                         snapshot=snapshot, **progress_callbacks(events, stream))
     
-    except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
-        print_error(f"{name}: ERROR - {str(e)}")
-        return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": str(e)}
+    if stop_on_fail:
+        for check, result in zip(checks, results):
+            if check["required"] and not result["passed"] and not result.get("skipped"):
+                print_error(f"CRITICAL: {check['name']} failed. Stopping verification.")
+                break
+    return results
 
-def print_final_report(results: List[dict], start_time: datetime):
-    """Print comprehensive final report"""
+def print_final_report(results: List[dict], start_time: datetime, trends: Optional[List[dict]] = None):
+    """Print comprehensive final report (with timing trends from the history)"""
     total_duration = (datetime.now() - start_time).total_seconds()
     
     print_header("📊 FULL VERIFICATION REPORT")
@@ -239,6 +192,7 @@ def print_final_report(results: List[dict], start_time: datetime):
         print(f"  {status} {r['name']} {duration_str}")
     
     print()
+    print_trends(trends)
     
     # Failed checks detail
     if failed > 0:
@@ -274,8 +228,21 @@ Examples:
     parser.add_argument("--url", required=True, help="URL for performance & E2E checks")
     parser.add_argument("--no-e2e", action="store_true", help="Skip E2E tests")
     parser.add_argument("--stop-on-fail", action="store_true", help="Stop on first failure")
+    parser.add_argument("--jobs", "-j", type=int, nargs="?", const=default_jobs(), default=1,
+                        help="Run up to N checks in parallel (default: 1; -j alone: one per CPU)")
+    parser.add_argument("--limit", type=parse_limit, action="append", default=[], metavar="CLASS=N",
+                        help="Max concurrent checks of a resource class with --jobs (cpu, io, browser, external-tool)")
+    parser.add_argument("--no-cache", action="store_true", help="Re-run every check instead of reusing cached results")
+    parser.add_argument("--in-process", action="store_true",
+                        help="Run the built-in scanners in this interpreter over one shared read of the project tree "
+                             "(a scanner past the timeout is reported as timed out but cannot be killed)")
+    parser.add_argument("--no-stream", action="store_true", help="Don't echo each check's output as it runs")
+    parser.add_argument("--no-history", action="store_true", help="Don't record check timings in .agent/.cache/history.sqlite")
+    parser.add_argument("--events", metavar="FILE",
+                        help="Write NDJSON progress events (check started/finished, duration, exit code, findings) to FILE")
     
     args = parser.parse_args()
+    sys.stdout.reconfigure(line_buffering=True)  # live progress when piped (CI logs)
     
     project_path = Path(args.project).resolve()
     
@@ -290,36 +257,52 @@ Examples:
     
     start_time = datetime.now()
     results = []
+    snapshot = FileSnapshot(project_path) if args.in_process else None
+    events = EventLog(args.events) if args.events else None
+    history = None if args.no_history else TimingHistory(project_path)
+    cache = None if args.no_cache else ResultCache(project_path, snapshot=snapshot)
+    
+    # Skip suites that require a URL when none is provided, and E2E if flag set
+    suites = [
+        suite for suite in VERIFICATION_SUITE
+        if not (suite.get("requires_url", False) and not args.url)
+        and not (args.no_e2e and suite["category"] == "E2E Testing")
+    ]
+    if events:
+        events.run_started(project_path, sum(len(suite["checks"]) for suite in suites), args.jobs)
+    
+    if args.jobs > 1:
+        results = run_parallel(suites, project_path, args.url, args.jobs, args.stop_on_fail, dict(args.limit), cache, snapshot,
+                               events, not args.no_stream)
+        all_passed = print_final_report(results, start_time, record_history(history, "verify_all", results))
+        finish_events(events, results, (datetime.now() - start_time).total_seconds())
+        sys.exit(0 if all_passed else 1)
     
     # Run all verification categories
-    for suite in VERIFICATION_SUITE:
+    for suite in suites:
         category = suite["category"]
-        requires_url = suite.get("requires_url", False)
-        
-        # Skip if requires URL and not provided
-        if requires_url and not args.url:
-            continue
-        
-        # Skip E2E if flag set
-        if args.no_e2e and category == "E2E Testing":
-            continue
         
         print_header(f"📋 {category.upper()}")
         
-        for name, script_path, required in suite["checks"]:
+        for name, script_path, required, _, depends in suite["checks"]:
             script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
+            result = run_script(name, script, str(project_path), args.url, 600, cache, snapshot, events, not args.no_stream,
+                                blocked_by=failed_dependency(depends, {r["name"]: r for r in results}))
             result["category"] = category
             results.append(result)
+            if events:
+                events.check_finished(result)
             
             # Stop on critical failure if flag set
             if args.stop_on_fail and required and not result["passed"] and not result.get("skipped"):
                 print_error(f"CRITICAL: {name} failed. Stopping verification.")
-                print_final_report(results, start_time)
+                print_final_report(results, start_time, record_history(history, "verify_all", results))
+                finish_events(events, results, (datetime.now() - start_time).total_seconds())
                 sys.exit(1)
     
     # Print final report
-    all_passed = print_final_report(results, start_time)
+    all_passed = print_final_report(results, start_time, record_history(history, "verify_all", results))
+    finish_events(events, results, (datetime.now() - start_time).total_seconds())
     
     sys.exit(0 if all_passed else 1)
 
@@ -15,7 +15,17 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
-def find_api_files(project_path: Path) -> list:
+def _glob(project_path: Path, pattern: str, snapshot=None):
+    """project_path.glob(pattern), or the orchestrator's shared file snapshot when run in-process."""
+    return snapshot.glob(project_path, pattern) if snapshot is not None else project_path.glob(pattern)
+
+def _read_text(file_path: Path, snapshot=None, errors: str = 'strict') -> str:
+    """file_path.read_text() as UTF-8, served from the shared file snapshot when given."""
+    if snapshot is not None:
+        return snapshot.read_text(file_path, errors=errors)
+    return file_path.read_text(encoding='utf-8', errors=errors)
+
+def find_api_files(project_path: Path, snapshot=None) -> list:
     """Find API-related files."""
     patterns = [
         "**/*api*.ts", "**/*api*.js", "**/*api*.py",
@@ -29,18 +39,18 @@ def find_api_files(project_path: Path) -> list:
     
     files = []
     for pattern in patterns:
-        files.extend(project_path.glob(pattern))
+        files.extend(_glob(project_path, pattern, snapshot))
     
     # Exclude node_modules, etc.
     return [f for f in files if not any(x in str(f) for x in ['node_modules', '.git', 'dist', 'build', '__pycache__'])]
 
-def check_openapi_spec(file_path: Path) -> dict:
+def check_openapi_spec(file_path: Path, snapshot=None) -> dict:
     """Check OpenAPI/Swagger specification."""
     issues = []
     passed = []
     
     try:
-        content = file_path.read_text(encoding='utf-8')
+        content = _read_text(file_path, snapshot)
         
         if file_path.suffix == '.json':
             spec = json.loads(content)
@@ -91,13 +101,13 @@ def check_openapi_spec(file_path: Path) -> dict:
     
     return {'file': str(file_path), 'passed': passed, 'issues': issues, 'type': 'openapi'}
 
-def check_api_code(file_path: Path) -> dict:
+def check_api_code(file_path: Path, snapshot=None) -> dict:
     """Check API code for common issues."""
     issues = []
     passed = []
     
     try:
-        content = file_path.read_text(encoding='utf-8')
+        content = _read_text(file_path, snapshot)
         
         # Check for error handling
         error_patterns = [
@@ -159,27 +169,29 @@ def check_api_code(file_path: Path) -> dict:
     
     return {'file': str(file_path), 'passed': passed, 'issues': issues, 'type': 'code'}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
+def main(argv=None, snapshot=None) -> int:
+    """Command-line entry point; also called in-process by the orchestrators."""
+    argv = sys.argv[1:] if argv is None else argv
+    target = argv[0] if argv else "."
     project_path = Path(target)
     
     print("\n" + "=" * 60)
     print("  API VALIDATOR - Endpoint Best Practices Check")
     print("=" * 60 + "\n")
     
-    api_files = find_api_files(project_path)
+    api_files = find_api_files(project_path, snapshot)
     
     if not api_files:
         print("[!] No API files found.")
         print("   Looking for: routes/, controllers/, api/, openapi.json/yaml")
-        sys.exit(0)
+        return 0
     
     results = []
     for file_path in api_files[:15]:  # Limit
         if 'openapi' in file_path.name.lower() or 'swagger' in file_path.name.lower():
-            result = check_openapi_spec(file_path)
+            result = check_openapi_spec(file_path, snapshot)
         else:
-            result = check_api_code(file_path)
+            result = check_api_code(file_path, snapshot)
         results.append(result)
     
     # Print results
@@ -202,10 +214,10 @@ def main():
     
     if total_issues == 0:
         print("[OK] API validation passed")
-        sys.exit(0)
+        return 0
     else:
         print("[X] Fix critical issues before deployment")
-        sys.exit(1)
+        return 1
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -27,26 +27,38 @@ except:
     pass
 
 
-def find_html_files(project_path: Path) -> list:
+def _glob(project_path: Path, pattern: str, snapshot=None):
+    """project_path.glob(pattern), or the orchestrator's shared file snapshot when run in-process."""
+    return snapshot.glob(project_path, pattern) if snapshot is not None else project_path.glob(pattern)
+
+
+def _read_text(file_path: Path, snapshot=None, errors: str = 'strict') -> str:
+    """file_path.read_text() as UTF-8, served from the shared file snapshot when given."""
+    if snapshot is not None:
+        return snapshot.read_text(file_path, errors=errors)
+    return file_path.read_text(encoding='utf-8', errors=errors)
+
+
+def find_html_files(project_path: Path, snapshot=None) -> list:
     """Find all HTML/JSX/TSX files."""
     patterns = ['**/*.html', '**/*.jsx', '**/*.tsx']
     skip_dirs = {'node_modules', '.next', 'dist', 'build', '.git'}
     
     files = []
     for pattern in patterns:
-        for f in project_path.glob(pattern):
+        for f in _glob(project_path, pattern, snapshot):
             if not any(skip in f.parts for skip in skip_dirs):
                 files.append(f)
     
     return files[:50]
 
 
-def check_accessibility(file_path: Path) -> list:
+def check_accessibility(file_path: Path, snapshot=None) -> list:
     """Check a single file for accessibility issues."""
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = _read_text(file_path, snapshot, errors='ignore')
         
         # Check for form inputs without labels
         inputs = re.findall(r'<input[^>]*>', content, re.IGNORECASE)
@@ -108,8 +120,10 @@ def check_accessibility(file_path: Path) -> list:
     return issues
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def main(argv=None, snapshot=None) -> int:
+    """Command-line entry point; also called in-process by the orchestrators."""
+    argv = sys.argv[1:] if argv is None else argv
+    project_path = Path(argv[0] if argv else ".").resolve()
     
     print(f"\n{'='*60}")
     print(f"[ACCESSIBILITY CHECKER] WCAG Compliance Audit")
@@ -119,7 +133,7 @@ def main():
     print("-"*60)
     
     # Find HTML files
-    files = find_html_files(project_path)
+    files = find_html_files(project_path, snapshot)
     print(f"Found {len(files)} HTML/JSX/TSX files")
     
     if not files:
@@ -132,13 +146,13 @@ def main():
             "message": "No HTML files found"
         }
         print(json.dumps(output, indent=2))
-        sys.exit(0)
+        return 0
     
     # Check each file
     all_issues = []
     
     for f in files:
-        issues = check_accessibility(f)
+        issues = check_accessibility(f, snapshot)
         if issues:
             all_issues.append({
                 "file": str(f.name),
@@ -176,8 +190,8 @@ def main():
     
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if passed else 1)
+    return 0 if passed else 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
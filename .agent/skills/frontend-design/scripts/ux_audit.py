@@ -96,15 +96,26 @@ import json
 from pathlib import Path
 
 class UXAuditor:
-    def __init__(self):
+    def __init__(self, snapshot=None):
+        self.snapshot = snapshot  # shared file snapshot when run in-process by an orchestrator
         self.issues = []
         self.warnings = []
         self.passed_count = 0
         self.files_checked = 0
     
+    def _open(self, filepath: str):
+        """open() for reading, served from the shared file snapshot when given."""
+        if self.snapshot is not None:
+            return self.snapshot.open(filepath, errors='replace')
+        return open(filepath, 'r', encoding='utf-8', errors='replace')
+    
+    def _walk(self, directory: str):
+        """os.walk(), or the shared file snapshot's walk when given."""
+        return self.snapshot.walk(directory) if self.snapshot is not None else os.walk(directory)
+    
     def audit_file(self, filepath: str) -> None:
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+            with self._open(filepath) as f:
                 content = f.read()
         except: return
         
@@ -673,7 +684,7 @@ class UXAuditor:
 
     def audit_directory(self, directory: str) -> None:
         extensions = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
-        for root, dirs, files in os.walk(directory):
+        for root, dirs, files in self._walk(directory):
             dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next'}]
             for file in files:
                 if Path(file).suffix in extensions:
@@ -688,13 +699,14 @@ class UXAuditor:
             "compliant": len(self.issues) == 0
         }
 
-def main():
-    if len(sys.argv) < 2: sys.exit(1)
+def main(argv=None, snapshot=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 1: return 1
     
-    path = sys.argv[1]
-    is_json = "--json" in sys.argv
+    path = argv[0]
+    is_json = "--json" in argv
     
-    auditor = UXAuditor()
+    auditor = UXAuditor(snapshot)
     if os.path.isfile(path): auditor.audit_file(path)
     else: auditor.audit_directory(path)
     
@@ -716,7 +728,7 @@ def main():
         status = "PASS" if report['compliant'] else "FAIL"
         print(f"STATUS: {status}")
 
-    sys.exit(0 if report['compliant'] else 1)
+    return 0 if report['compliant'] else 1
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -78,13 +78,25 @@ def is_page_file(file_path: Path) -> bool:
     return False
 
 
-def find_web_pages(project_path: Path) -> list:
+def _glob(project_path: Path, pattern: str, snapshot=None):
+    """project_path.glob(pattern), or the orchestrator's shared file snapshot when run in-process."""
+    return snapshot.glob(project_path, pattern) if snapshot is not None else project_path.glob(pattern)
+
+
+def _read_text(file_path: Path, snapshot=None, errors: str = 'strict') -> str:
+    """file_path.read_text() as UTF-8, served from the shared file snapshot when given."""
+    if snapshot is not None:
+        return snapshot.read_text(file_path, errors=errors)
+    return file_path.read_text(encoding='utf-8', errors=errors)
+
+
+def find_web_pages(project_path: Path, snapshot=None) -> list:
     """Find public-facing web pages only."""
     patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
     
     files = []
     for pattern in patterns:
-        for f in project_path.glob(pattern):
+        for f in _glob(project_path, pattern, snapshot):
             # Skip excluded directories
             if any(skip in f.parts for skip in SKIP_DIRS):
                 continue
@@ -96,10 +108,10 @@ def find_web_pages(project_path: Path) -> list:
     return files[:30]  # Limit to 30 pages
 
 
-def check_page(file_path: Path) -> dict:
+def check_page(file_path: Path, snapshot=None) -> dict:
     """Check a single web page for GEO elements."""
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = _read_text(file_path, snapshot, errors='ignore')
     except Exception as e:
         return {'file': str(file_path.name), 'passed': [], 'issues': [f"Error: {e}"], 'score': 0}
     
@@ -219,8 +231,10 @@ def check_page(file_path: Path) -> dict:
     }
 
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
+def main(argv=None, snapshot=None) -> int:
+    """Command-line entry point; also called in-process by the orchestrators."""
+    argv = sys.argv[1:] if argv is None else argv
+    target = argv[0] if argv else "."
     target_path = Path(target).resolve()
     
     print("\n" + "=" * 60)
@@ -230,7 +244,7 @@ def main():
     print("-" * 60)
     
     # Find web pages only
-    pages = find_web_pages(target_path)
+    pages = find_web_pages(target_path, snapshot)
     
     if not pages:
         print("\n[!] No public web pages found.")
@@ -238,14 +252,14 @@ def main():
         print("    Skipping: docs, tests, config files, node_modules")
         output = {"script": "geo_checker", "pages_found": 0, "passed": True}
         print("\n" + json.dumps(output, indent=2))
-        sys.exit(0)
+        return 0
     
     print(f"Found {len(pages)} public pages to analyze\n")
     
     # Check each page
     results = []
     for page in pages:
-        result = check_page(page)
+        result = check_page(page, snapshot)
         results.append(result)
     
     # Print results
@@ -282,8 +296,8 @@ def main():
     }
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if avg_score >= 60 else 1)
+    return 0 if avg_score >= 60 else 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -50,7 +50,21 @@ I18N_PATTERNS = [
     r'i18n\.',             # Generic i18n
 ]
 
-def find_locale_files(project_path: Path) -> list:
+def _glob(project_path: Path, pattern: str, snapshot=None):
+    """project_path.glob(pattern), or the orchestrator's shared file snapshot when run in-process."""
+    return snapshot.glob(project_path, pattern) if snapshot is not None else project_path.glob(pattern)
+
+def _rglob(project_path: Path, pattern: str, snapshot=None):
+    """project_path.rglob(pattern), or the orchestrator's shared file snapshot when run in-process."""
+    return snapshot.rglob(project_path, pattern) if snapshot is not None else project_path.rglob(pattern)
+
+def _read_text(file_path: Path, snapshot=None, errors: str = 'strict') -> str:
+    """file_path.read_text() as UTF-8, served from the shared file snapshot when given."""
+    if snapshot is not None:
+        return snapshot.read_text(file_path, errors=errors)
+    return file_path.read_text(encoding='utf-8', errors=errors)
+
+def find_locale_files(project_path: Path, snapshot=None) -> list:
     """Find translation/locale files."""
     patterns = [
         "**/locales/**/*.json",
@@ -63,11 +77,11 @@ def find_locale_files(project_path: Path) -> list:
     
     files = []
     for pattern in patterns:
-        files.extend(project_path.glob(pattern))
+        files.extend(_glob(project_path, pattern, snapshot))
     
     return [f for f in files if 'node_modules' not in str(f)]
 
-def check_locale_completeness(locale_files: list) -> dict:
+def check_locale_completeness(locale_files: list, snapshot=None) -> dict:
     """Check if all locales have the same keys."""
     issues = []
     passed = []
@@ -81,7 +95,7 @@ def check_locale_completeness(locale_files: list) -> dict:
         if f.suffix == '.json':
             try:
                 lang = f.parent.name
-                content = json.loads(f.read_text(encoding='utf-8'))
+                content = json.loads(_read_text(f, snapshot))
                 if lang not in locales:
                     locales[lang] = {}
                 locales[lang][f.stem] = set(flatten_keys(content))
@@ -128,7 +142,7 @@ def flatten_keys(d, prefix=''):
             keys.add(new_key)
     return keys
 
-def check_hardcoded_strings(project_path: Path) -> dict:
+def check_hardcoded_strings(project_path: Path, snapshot=None) -> dict:
     """Check for hardcoded strings in code files."""
     issues = []
     passed = []
@@ -142,7 +156,7 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     
     code_files = []
     for ext in extensions:
-        code_files.extend(project_path.rglob(f"*{ext}"))
+        code_files.extend(_rglob(project_path, f"*{ext}", snapshot))
     
     code_files = [f for f in code_files if not any(x in str(f) for x in 
                   ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])]
@@ -156,7 +170,7 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     
     for file_path in code_files[:50]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = _read_text(file_path, snapshot, errors='ignore')
             ext = file_path.suffix
             file_type = extensions.get(ext, 'jsx')
             
@@ -196,8 +210,10 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     
     return {'passed': passed, 'issues': issues}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
+def main(argv=None, snapshot=None) -> int:
+    """Command-line entry point; also called in-process by the orchestrators."""
+    argv = sys.argv[1:] if argv is None else argv
+    target = argv[0] if argv else "."
     project_path = Path(target)
     
     print("\n" + "=" * 60)
@@ -205,11 +221,11 @@ def main():
     print("=" * 60 + "\n")
     
     # Check locale files
-    locale_files = find_locale_files(project_path)
-    locale_result = check_locale_completeness(locale_files)
+    locale_files = find_locale_files(project_path, snapshot)
+    locale_result = check_locale_completeness(locale_files, snapshot)
     
     # Check hardcoded strings
-    code_result = check_hardcoded_strings(project_path)
+    code_result = check_hardcoded_strings(project_path, snapshot)
     
     # Print results
     print("[LOCALE FILES]")
@@ -232,10 +248,10 @@ def main():
     print("\n" + "=" * 60)
     if critical_issues == 0:
         print("[OK] i18n CHECK: PASSED")
-        sys.exit(0)
+        return 0
     else:
         print(f"[X] i18n CHECK: {critical_issues} issues found")
-        sys.exit(1)
+        return 1
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
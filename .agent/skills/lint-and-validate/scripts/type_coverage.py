@@ -15,13 +15,23 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
-def check_typescript_coverage(project_path: Path) -> dict:
+def _rglob(project_path: Path, pattern: str, snapshot=None):
+    """project_path.rglob(pattern), or the orchestrator's shared file snapshot when run in-process."""
+    return snapshot.rglob(project_path, pattern) if snapshot is not None else project_path.rglob(pattern)
+
+def _read_text(file_path: Path, snapshot=None, errors: str = 'strict') -> str:
+    """file_path.read_text() as UTF-8, served from the shared file snapshot when given."""
+    if snapshot is not None:
+        return snapshot.read_text(file_path, errors=errors)
+    return file_path.read_text(encoding='utf-8', errors=errors)
+
+def check_typescript_coverage(project_path: Path, snapshot=None) -> dict:
     """Check TypeScript type coverage."""
     issues = []
     passed = []
     stats = {'any_count': 0, 'untyped_functions': 0, 'total_functions': 0}
     
-    ts_files = list(project_path.rglob("*.ts")) + list(project_path.rglob("*.tsx"))
+    ts_files = list(_rglob(project_path, "*.ts", snapshot)) + list(_rglob(project_path, "*.tsx", snapshot))
     ts_files = [f for f in ts_files if 'node_modules' not in str(f) and '.d.ts' not in str(f)]
     
     if not ts_files:
@@ -29,7 +39,7 @@ def check_typescript_coverage(project_path: Path) -> dict:
     
     for file_path in ts_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = _read_text(file_path, snapshot, errors='ignore')
             
             # Count 'any' usage
             any_matches = re.findall(r':\s*any\b', content)
@@ -71,13 +81,13 @@ def check_typescript_coverage(project_path: Path) -> dict:
     
     return {'type': 'typescript', 'files': len(ts_files), 'passed': passed, 'issues': issues, 'stats': stats}
 
-def check_python_coverage(project_path: Path) -> dict:
+def check_python_coverage(project_path: Path, snapshot=None) -> dict:
     """Check Python type hints coverage."""
     issues = []
     passed = []
     stats = {'untyped_functions': 0, 'typed_functions': 0, 'any_count': 0}
     
-    py_files = list(project_path.rglob("*.py"))
+    py_files = list(_rglob(project_path, "*.py", snapshot))
     py_files = [f for f in py_files if not any(x in str(f) for x in ['venv', '__pycache__', '.git', 'node_modules'])]
     
     if not py_files:
@@ -85,7 +95,7 @@ def check_python_coverage(project_path: Path) -> dict:
     
     for file_path in py_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            content = _read_text(file_path, snapshot, errors='ignore')
             
             # Count Any usage
             any_matches = re.findall(r':\s*Any\b', content)
@@ -125,8 +135,10 @@ def check_python_coverage(project_path: Path) -> dict:
     
     return {'type': 'python', 'files': len(py_files), 'passed': passed, 'issues': issues, 'stats': stats}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
+def main(argv=None, snapshot=None) -> int:
+    """Command-line entry point; also called in-process by the orchestrators."""
+    argv = sys.argv[1:] if argv is None else argv
+    target = argv[0] if argv else "."
     project_path = Path(target)
     
     print("\n" + "=" * 60)
@@ -136,18 +148,18 @@ def main():
     results = []
     
     # Check TypeScript
-    ts_result = check_typescript_coverage(project_path)
+    ts_result = check_typescript_coverage(project_path, snapshot)
     if ts_result['files'] > 0:
         results.append(ts_result)
     
     # Check Python
-    py_result = check_python_coverage(project_path)
+    py_result = check_python_coverage(project_path, snapshot)
     if py_result['files'] > 0:
         results.append(py_result)
     
     if not results:
         print("[!] No TypeScript or Python files found.")
-        sys.exit(0)
+        return 0
     
     # Print results
     critical_issues = 0
@@ -164,10 +176,10 @@ def main():
     print("\n" + "=" * 60)
     if critical_issues == 0:
         print("[OK] TYPE COVERAGE: ACCEPTABLE")
-        sys.exit(0)
+        return 0
     else:
         print(f"[X] TYPE COVERAGE: {critical_issues} critical issues")
-        sys.exit(1)
+        return 1
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
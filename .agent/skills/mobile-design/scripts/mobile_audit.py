@@ -72,15 +72,26 @@ import json
 from pathlib import Path
 
 class MobileAuditor:
-    def __init__(self):
+    def __init__(self, snapshot=None):
+        self.snapshot = snapshot  # shared file snapshot when run in-process by an orchestrator
         self.issues = []
         self.warnings = []
         self.passed_count = 0
         self.files_checked = 0
 
+    def _open(self, filepath: str):
+        """open() for reading, served from the shared file snapshot when given."""
+        if self.snapshot is not None:
+            return self.snapshot.open(filepath, errors='replace')
+        return open(filepath, 'r', encoding='utf-8', errors='replace')
+
+    def _walk(self, directory: str):
+        """os.walk(), or the shared file snapshot's walk when given."""
+        return self.snapshot.walk(directory) if self.snapshot is not None else os.walk(directory)
+
     def audit_file(self, filepath: str) -> None:
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+            with self._open(filepath) as f:
                 content = f.read()
         except:
             return
@@ -612,7 +623,7 @@ class MobileAuditor:
 
     def audit_directory(self, directory: str) -> None:
         extensions = {'.tsx', '.ts', '.jsx', '.js', '.dart'}
-        for root, dirs, files in os.walk(directory):
+        for root, dirs, files in self._walk(directory):
             dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next', 'ios', 'android', 'build', '.idea'}]
             for file in files:
                 if Path(file).suffix in extensions:
@@ -628,15 +639,16 @@ class MobileAuditor:
         }
 
 
-def main():
-    if len(sys.argv) < 2:
+def main(argv=None, snapshot=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 1:
         print("Usage: python mobile_audit.py <directory>")
-        sys.exit(1)
+        return 1
 
-    path = sys.argv[1]
-    is_json = "--json" in sys.argv
+    path = argv[0]
+    is_json = "--json" in argv
 
-    auditor = MobileAuditor()
+    auditor = MobileAuditor(snapshot)
     if os.path.isfile(path):
         auditor.audit_file(path)
     else:
@@ -661,10 +673,10 @@ def main():
         status = "PASS" if report['compliant'] else "FAIL"
         print(f"STATUS: {status}")
 
-    sys.exit(0 if report['compliant'] else 1)
+    return 0 if report['compliant'] else 1
 
 
 if __name__ == "__main__":
     # Fix missing import
     import re
-    main()
+    sys.exit(main())
@@ -75,13 +75,25 @@ def is_page_file(file_path: Path) -> bool:
     return False
 
 
-def find_pages(project_path: Path) -> list:
+def _glob(project_path: Path, pattern: str, snapshot=None):
+    """project_path.glob(pattern), or the orchestrator's shared file snapshot when run in-process."""
+    return snapshot.glob(project_path, pattern) if snapshot is not None else project_path.glob(pattern)
+
+
+def _read_text(file_path: Path, snapshot=None, errors: str = 'strict') -> str:
+    """file_path.read_text() as UTF-8, served from the shared file snapshot when given."""
+    if snapshot is not None:
+        return snapshot.read_text(file_path, errors=errors)
+    return file_path.read_text(encoding='utf-8', errors=errors)
+
+
+def find_pages(project_path: Path, snapshot=None) -> list:
     """Find page files to check."""
     patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
     
     files = []
     for pattern in patterns:
-        for f in project_path.glob(pattern):
+        for f in _glob(project_path, pattern, snapshot):
             # Skip excluded directories
             if any(skip in f.parts for skip in SKIP_DIRS):
                 continue
@@ -93,12 +105,12 @@ def find_pages(project_path: Path) -> list:
     return files[:50]  # Limit to 50 files
 
 
-def check_page(file_path: Path) -> dict:
+def check_page(file_path: Path, snapshot=None) -> dict:
     """Check a single page for SEO issues."""
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = _read_text(file_path, snapshot, errors='ignore')
     except Exception as e:
         return {"file": str(file_path.name), "issues": [f"Error: {e}"]}
     
@@ -145,8 +157,10 @@ def check_page(file_path: Path) -> dict:
     }
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def main(argv=None, snapshot=None) -> int:
+    """Command-line entry point; also called in-process by the orchestrators."""
+    argv = sys.argv[1:] if argv is None else argv
+    project_path = Path(argv[0] if argv else ".").resolve()
     
     print(f"\n{'='*60}")
     print(f"  SEO CHECKER - Search Engine Optimization Audit")
@@ -156,21 +170,21 @@ def main():
     print("-"*60)
     
     # Find pages
-    pages = find_pages(project_path)
+    pages = find_pages(project_path, snapshot)
     
     if not pages:
         print("\n[!] No page files found.")
         print("    Looking for: HTML, JSX, TSX in pages/app/routes directories")
         output = {"script": "seo_checker", "files_checked": 0, "passed": True}
         print("\n" + json.dumps(output, indent=2))
-        sys.exit(0)
+        return 0
     
     print(f"Found {len(pages)} page files to analyze\n")
     
     # Check each page
     all_issues = []
     for f in pages:
-        result = check_page(f)
+        result = check_page(f, snapshot)
         if result["issues"]:
             all_issues.append(result)
     
@@ -212,8 +226,8 @@ def main():
     
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if passed else 1)
+    return 0 if passed else 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -90,11 +90,27 @@ CODE_EXTENSIONS = {'.js', '.ts', '.jsx', '.tsx', '.py', '.go', '.java', '.rb', '
 CONFIG_EXTENSIONS = {'.json', '.yaml', '.yml', '.toml', '.env', '.env.local', '.env.development'}
 
 
+# ============================================================================
+#  FILE ACCESS
+# ============================================================================
+
+def _walk(project_path: str, snapshot=None):
+    """os.walk(), or the orchestrator's shared file snapshot when run in-process."""
+    return snapshot.walk(project_path) if snapshot is not None else os.walk(project_path)
+
+
+def _open(filepath, snapshot=None):
+    """open() for reading, served from the shared file snapshot when given."""
+    if snapshot is not None:
+        return snapshot.open(filepath, errors='ignore')
+    return open(filepath, 'r', encoding='utf-8', errors='ignore')
+
+
 # ============================================================================
 #  SCANNING FUNCTIONS
 # ============================================================================
 
-def scan_dependencies(project_path: str) -> Dict[str, Any]:
+def scan_dependencies(project_path: str, snapshot=None) -> Dict[str, Any]:
     """
     Validate supply chain security (OWASP A03).
     Checks: npm audit, lock file presence, dependency age.
@@ -178,7 +194,7 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_secrets(project_path: str) -> Dict[str, Any]:
+def scan_secrets(project_path: str, snapshot=None) -> Dict[str, Any]:
     """
     Validate no hardcoded secrets (OWASP A04).
     Checks: API keys, tokens, passwords, cloud credentials.
@@ -191,7 +207,7 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
         "by_severity": {"critical": 0, "high": 0, "medium": 0}
     }
     
-    for root, dirs, files in os.walk(project_path):
+    for root, dirs, files in _walk(project_path, snapshot):
         dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
         
         for file in files:
@@ -203,7 +219,7 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
             results["scanned_files"] += 1
             
             try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+                with _open(filepath, snapshot) as f:
                     content = f.read()
                     
                     for pattern, secret_type, severity in SECRET_PATTERNS:
@@ -233,7 +249,7 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_code_patterns(project_path: str) -> Dict[str, Any]:
+def scan_code_patterns(project_path: str, snapshot=None) -> Dict[str, Any]:
     """
     Validate dangerous code patterns (OWASP A05).
     Checks: Injection risks, XSS, unsafe deserialization.
@@ -246,7 +262,7 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
         "by_category": {}
     }
     
-    for root, dirs, files in os.walk(project_path):
+    for root, dirs, files in _walk(project_path, snapshot):
         dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
         
         for file in files:
@@ -258,7 +274,7 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
             results["scanned_files"] += 1
             
             try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+                with _open(filepath, snapshot) as f:
                     lines = f.readlines()
                     
                     for line_num, line in enumerate(lines, 1):
@@ -293,7 +309,7 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_configuration(project_path: str) -> Dict[str, Any]:
+def scan_configuration(project_path: str, snapshot=None) -> Dict[str, Any]:
     """
     Validate security configuration (OWASP A02).
     Checks: Security headers, CORS, debug modes.
@@ -315,7 +331,7 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
         (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
     ]
     
-    for root, dirs, files in os.walk(project_path):
+    for root, dirs, files in _walk(project_path, snapshot):
         dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
         
         for file in files:
@@ -326,7 +342,7 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
             filepath = Path(root) / file
             
             try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+                with _open(filepath, snapshot) as f:
                     content = f.read()
                     
                     for pattern, issue, severity in config_issues:
@@ -369,7 +385,7 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
 #  MAIN
 # ============================================================================
 
-def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
+def run_full_scan(project_path: str, scan_type: str = "all", snapshot=None) -> Dict[str, Any]:
     """Execute security validation scans."""
     
     report = {
@@ -394,7 +410,7 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
     
     for key, (name, scanner) in scanners.items():
         if scan_type == "all" or scan_type == key:
-            result = scanner(project_path)
+            result = scanner(project_path, snapshot)
             report["scans"][name] = result
             
             findings_count = len(result.get("findings", []))
@@ -418,7 +434,8 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
     return report
 
 
-def main():
+def main(argv=None, snapshot=None) -> int:
+    """Command-line entry point; also called in-process by the orchestrators."""
     parser = argparse.ArgumentParser(
         description="Validate security principles from vulnerability-scanner skill"
     )
@@ -428,13 +445,13 @@ def main():
     parser.add_argument("--output", choices=["json", "summary"], default="json",
                         help="Output format")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not os.path.isdir(args.project_path):
         print(json.dumps({"error": f"Directory not found: {args.project_path}"}))
-        sys.exit(1)
+        return 1
     
-    result = run_full_scan(args.project_path, args.scan_type)
+    result = run_full_scan(args.project_path, args.scan_type, snapshot)
     
     if args.output == "summary":
         print(f"\n{'='*60}")
@@ -452,7 +469,8 @@ def main():
                 print(f"  - {finding}")
     else:
         print(json.dumps(result, indent=2))
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())